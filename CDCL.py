@@ -0,0 +1,167 @@
+"""
+Implémentation de l'algorithme CDCL (Conflict-Driven Clause Learning).
+À chaque conflit, l'analyse 1-UIP produit une clause apprise qui est ajoutée à la base ; la recherche
+revient ensuite directement au niveau où cette clause devient unitaire (retour arrière non chronologique).
+Des redémarrages suivant la suite de Luby évitent de rester bloqué dans une mauvaise partie de l'arbre.
+"""
+
+import instrumentation
+from heuristiques import creer_heuristique
+from propagation import WatchedLiterals
+
+# Nombre de conflits entre deux redémarrages, multiplié par la suite de Luby
+restart_base = 100
+
+
+def luby(i):
+    """Retourne le i-ème terme (i >= 1) de la suite de Luby : 1 1 2 1 1 2 4 1 1 2 ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+def analyze(moteur, conflit, heuristique=None):
+    """
+    Analyse 1-UIP du conflit.
+    Les variables rencontrées sont signalées à l'heuristique de branchement.
+    Retourne la clause apprise (littéral assertif en tête, puis le littéral de plus haut niveau)
+    et le niveau de retour arrière.
+    """
+    trail = moteur.trail
+    level = moteur.level
+    niveau = moteur.decision_level()
+    vus = [False] * (moteur.nb_vars + 1)
+    appris = [0]
+    compteur = 0
+    index = len(trail) - 1
+    lit = 0
+    clause = moteur.clauses[conflit]
+    rencontres = []
+
+    while True:
+        for q in clause:
+            if q == lit:
+                continue
+            var = abs(q)
+            if not vus[var] and level[var] > 0:
+                vus[var] = True
+                rencontres.append(q)
+                if level[var] == niveau:
+                    compteur += 1
+                else:
+                    appris.append(q)
+
+        # Littéral du niveau courant le plus récent parmi ceux à expliquer
+        while not vus[abs(trail[index])]:
+            index -= 1
+        lit = trail[index]
+        index -= 1
+        vus[abs(lit)] = False
+        compteur -= 1
+        if compteur == 0:
+            break
+        clause = moteur.clauses[moteur.reason[abs(lit)]]
+
+    appris[0] = -lit
+
+    if heuristique is not None:
+        heuristique.bump(rencontres)
+        heuristique.decay()
+
+    # Le littéral de plus haut niveau est surveillé en second
+    niveau_retour = 0
+    if len(appris) > 1:
+        i_max = max(range(1, len(appris)), key=lambda i: level[abs(appris[i])])
+        appris[1], appris[i_max] = appris[i_max], appris[1]
+        niveau_retour = level[abs(appris[1])]
+
+    return appris, niveau_retour
+
+
+class CDCLSolver:
+    """
+    Solveur CDCL réentrant : compteurs, modèle, options et preuve appartiennent à l'instance,
+    donc plusieurs résolutions peuvent s'exécuter en même temps (une instance chacune).
+    heuristique : nom de l'heuristique de branchement (voir heuristiques.HEURISTIQUES)
+    preuve : drat.DratWriter recevant la preuve des réponses UNSAT (clauses apprises puis clause vide), ou None.
+    """
+
+    def __init__(self, heuristique="vsids", preuve=None):
+        self.heuristique = heuristique
+        self.preuve = preuve
+        self.cpt = 0  # Nombre de décisions
+        self.conflits = 0  # Nombre de conflits analysés
+        self.modele = None  # Modèle (liste de littéraux) trouvé par la dernière résolution satisfiable
+
+    def solve(self, clauses):
+        """Retourne vrai si la formule est satisfiable ; les compteurs sont remis à zéro au début"""
+        self.cpt = 0
+        self.conflits = 0
+        self.modele = None
+        preuve = self.preuve
+
+        if not clauses:
+            self.modele = []
+            return True
+        if any(len(clause) == 0 for clause in clauses):
+            return False
+
+        moteur = WatchedLiterals(clauses)
+        mesures = instrumentation.courantes()
+        if mesures is not None:
+            mesures.moteur(moteur)
+        if moteur.conflict:
+            if preuve is not None:
+                preuve.ajouter([])
+            return False
+
+        branchement = creer_heuristique(self.heuristique)
+        branchement.initialiser(moteur)
+
+        nb_restarts = 1
+        limite = restart_base * luby(nb_restarts)
+        conflits_depuis_restart = 0
+
+        while True:
+            conflit = moteur.propagate()
+            if conflit is not None:
+                self.conflits += 1
+                if moteur.decision_level() == 0:
+                    if preuve is not None:
+                        preuve.ajouter([])
+                    return False
+
+                appris, niveau_retour = analyze(moteur, conflit, branchement)
+                if preuve is not None:
+                    preuve.ajouter(appris)
+                moteur.backtrack(niveau_retour)
+                index = moteur.add_clause(appris)
+                moteur.assign(appris[0], index)
+
+                conflits_depuis_restart += 1
+                if conflits_depuis_restart >= limite:
+                    # Redémarrage : on garde les clauses apprises mais on repart du niveau 0
+                    moteur.backtrack(0)
+                    nb_restarts += 1
+                    limite = restart_base * luby(nb_restarts)
+                    conflits_depuis_restart = 0
+                continue
+
+            literal = branchement.choisir(moteur)
+            if literal is None:
+                self.modele = moteur.modele()
+                return True
+
+            self.cpt += 1
+            moteur.decide(literal)
+
+
+def CDCL(clauses, heuristique="vsids"):
+    """Retourne vrai si la formule est satisfiable (CDCL, avec un solveur CDCLSolver neuf)"""
+    return CDCLSolver(heuristique).solve(clauses)
@@ -3,11 +3,14 @@ Implémentation corrigée de l'algorithme DPLL (Davis-Putnam-Logemann-Loveland).
 Cette version résout correctement les problèmes SAT et identifie correctement les formules insatisfiables.
 """
 
+import sys
 from collections import Counter
 
-# Cache pour mémorisation
-dpll_cache = {}
-dpll_cpt = 0
+import bitset
+import instrumentation
+from cache import FormulaCache
+from heuristiques import creer_heuristique
+from propagation import Occurrences, WatchedLiterals
 
 def count_literals(clauses):
     """Compte les occurrences de chaque littéral dans les clauses"""
@@ -16,10 +19,11 @@ def count_literals(clauses):
         counter.update(c)
     return counter
 
-def unit_propagation(clauses):
+def unit_propagation(clauses, affectes=None):
     """
     Applique la propagation unitaire
     Retourne une formule simplifiée et un drapeau indiquant si une contradiction a été trouvée
+    Si affectes est une liste, les littéraux affectés y sont ajoutés.
     """
     result = list(clauses)  # Copie des clauses
     assigned = {}  # Littéraux assignés
@@ -43,6 +47,8 @@ def unit_propagation(clauses):
             return [], True  # Contradiction trouvée
         if unit_lit is None:
             break  # Plus de clauses unitaires
+        if affectes is not None:
+            affectes.append(unit_lit)
 
         # Supprimer les clauses contenant le littéral assigné
         new_clauses = []
@@ -66,10 +72,11 @@ def unit_propagation(clauses):
 
     return result, False
 
-def pure_literal_elimination(clauses):
+def pure_literal_elimination(clauses, affectes=None):
     """
     Élimine les littéraux purs
     Retourne une formule simplifiée
+    Si affectes est une liste, les littéraux purs (affectés à vrai) y sont ajoutés.
     """
     if not clauses:
         return clauses
@@ -88,6 +95,8 @@ def pure_literal_elimination(clauses):
 
     if not pure_lits:
         return clauses
+    if affectes is not None:
+        affectes.extend(pure_lits)
 
     # Supprimer les clauses contenant les littéraux purs
     result = []
@@ -98,6 +107,21 @@ def pure_literal_elimination(clauses):
 
     return result
 
+def contient_vide(clauses):
+    """Retourne vrai si la formule contient la clause vide"""
+    return [] in clauses
+
+
+def unitaire(lit):
+    """Retourne la clause unitaire du littéral"""
+    return [lit]
+
+
+def cle(clauses):
+    """Clé de cache de la formule"""
+    return FormulaCache.cle(clauses)
+
+
 def choose_literal(clauses):
     """Choisit un littéral pour la division de cas en utilisant l'heuristique DLIS
     (Dynamic Largest Individual Sum)"""
@@ -111,62 +135,277 @@ def choose_literal(clauses):
         return max(counter.items(), key=lambda x: x[1])[0]
     return None
 
-def DPLL(clauses):
+class DPLLSolver:
     """
-    Algorithme DPLL amélioré pour la satisfiabilité
+    Solveur DPLL réentrant : cache, compteur, modèle, options et preuve appartiennent à l'instance,
+    donc plusieurs résolutions peuvent s'exécuter en même temps (une instance chacune).
+    use_watched_literals : solve délègue à solve_iteratif, qui garde une seule base de littéraux surveillés
+    pendant toute la recherche (le retour arrière annule le trail) au lieu de reconstruire les listes à chaque appel.
+    preuve : drat.DratWriter recevant la preuve des réponses UNSAT de solve, ou None. Chaque branche réfutée
+    donne le lemme « négation des décisions qui y mènent » ; quand les deux branches d'une division de cas
+    sont réfutées, le lemme du nœud est RUP grâce à ceux des branches, qui sont alors supprimés.
+    backend : "listes", "bits" (masques de bits, voir bitset.py) ou "auto" (listes : choose_literal y départage
+    les égalités dans l'ordre de la formule) ; solve_iteratif travaille toujours sur son propre moteur.
     """
-    global dpll_cpt
-    dpll_cpt += 1
 
-    # Case de base: formule vide
-    if not clauses:
-        return True
-
-    # Case de base: clause vide
-    if any(len(clause) == 0 for clause in clauses):
-        return False
-
-    # Mémorisation
-    clauses_tuple = tuple(tuple(sorted(c)) for c in sorted(clauses, key=lambda x: tuple(sorted(x))))
-    if clauses_tuple in dpll_cache:
-        return dpll_cache[clauses_tuple]
-
-    # 1. Propagation unitaire
-    simplified_clauses, contradiction = unit_propagation(clauses)
-    if contradiction:
-        dpll_cache[clauses_tuple] = False
-        return False
-
-    # Si toutes les clauses sont satisfaites
-    if not simplified_clauses:
-        dpll_cache[clauses_tuple] = True
-        return True
-
-    # 2. Élimination des littéraux purs
-    simplified_clauses = pure_literal_elimination(simplified_clauses)
-
-    # Si toutes les clauses sont satisfaites
-    if not simplified_clauses:
-        dpll_cache[clauses_tuple] = True
-        return True
-
-    # Si les clauses ont changé, réappliquer DPLL
-    if simplified_clauses != clauses:
-        result = DPLL(simplified_clauses)
-        dpll_cache[clauses_tuple] = result
-        return result
-
-    # 3. Division de cas
-    literal = choose_literal(simplified_clauses)
-
-    # Essayer avec le littéral positif
-    positive_result = DPLL(simplified_clauses + [[literal]])
-    if positive_result:
-        dpll_cache[clauses_tuple] = True
-        return True
-
-    # Essayer avec le littéral négatif
-    negative_result = DPLL(simplified_clauses + [[-literal]])
-
-    dpll_cache[clauses_tuple] = negative_result
-    return negative_result
\ No newline at end of file
+    def __init__(self, use_watched_literals=False, preuve=None, max_entrees=200000, backend="auto"):
+        self.use_watched_literals = use_watched_literals
+        self.preuve = preuve
+        self.backend = backend
+        self.regles = _LISTES  # Module des étapes utilisé par la résolution en cours
+        # Cache pour mémorisation (borné, clés de taille fixe)
+        self.cache = FormulaCache(max_entrees)
+        self.cpt = 0
+        self.modele = None  # Littéraux affectés le long du chemin de succès de la dernière résolution satisfiable
+        self._decisions = []  # Littéraux de branchement du chemin courant (seulement avec une preuve)
+
+    def solve(self, clauses):
+        """
+        Retourne vrai si la formule est satisfiable (DPLL récursif). Le compteur et le cache sont remis à zéro
+        au début ; à la fin, les entrées du cache sont libérées (ses compteurs restent disponibles).
+        En cas de succès, modele contient les littéraux affectés (propagation, littéraux purs, divisions de cas)
+        le long du chemin qui a réussi : chaque appel ajoute les siens en remontant. Les variables absentes sont libres.
+        """
+        if self.use_watched_literals:
+            return self.solve_iteratif(clauses)
+        if not isinstance(clauses, list):
+            # Une autre séquence (base_clauses.ClauseDB) est décodée une fois : _dpll compare ses formules
+            # simplifiées à la formule reçue, ce qui n'a de sens qu'entre listes
+            clauses = list(clauses)
+        self.cpt = 0
+        self.modele = None
+        self._decisions = []
+        self.cache.clear()
+        regles = choisir_regles(clauses, self.backend)
+        if regles is bitset:
+            clauses = bitset.encoder(clauses)
+        mesures = instrumentation.courantes()
+        self.regles = regles if mesures is None else mesures.regles(regles)
+        try:
+            return self._dpll(clauses)
+        finally:
+            if mesures is not None:
+                mesures.cache(self.cache)
+            self.cache.liberer()
+
+    def _lemme_echec(self):
+        """Ajoute à la preuve la négation des décisions courantes ; retourne ce lemme"""
+        lemme = [-d for d in self._decisions]
+        self.preuve.ajouter(lemme)
+        return lemme
+
+    def _dpll(self, clauses):
+        """
+        Algorithme DPLL amélioré pour la satisfiabilité
+        """
+        self.cpt += 1
+        preuve = self.preuve
+        dpll_cache = self.cache
+        regles = self.regles
+
+        # Case de base: formule vide
+        if not clauses:
+            self.modele = []
+            return True
+
+        # Case de base: clause vide
+        if regles.contient_vide(clauses):
+            if preuve is not None:
+                self._lemme_echec()
+            return False
+
+        # Mémorisation. Un succès mémorisé ne fournit pas de modèle : la formule est alors résolue à nouveau.
+        # Cela n'arrive qu'entre deux recherches, car une recherche s'arrête au premier succès.
+        # Avec une preuve, un échec mémorisé n'est pas réutilisé : il a été prouvé sous d'autres décisions.
+        cle = regles.cle(clauses)
+        resultat = dpll_cache.get(cle)
+        if resultat is False and preuve is None:
+            return False
+
+        # 1. Propagation unitaire
+        affectes = []
+        simplified_clauses, contradiction = regles.unit_propagation(clauses, affectes)
+        if contradiction:
+            dpll_cache[cle] = False
+            if preuve is not None:
+                self._lemme_echec()
+            return False
+
+        # Si toutes les clauses sont satisfaites
+        if not simplified_clauses:
+            dpll_cache[cle] = True
+            self.modele = affectes
+            return True
+
+        # 2. Élimination des littéraux purs
+        simplified_clauses = regles.pure_literal_elimination(simplified_clauses, affectes)
+
+        # Si toutes les clauses sont satisfaites
+        if not simplified_clauses:
+            dpll_cache[cle] = True
+            self.modele = affectes
+            return True
+
+        # Si les clauses ont changé, réappliquer DPLL
+        if simplified_clauses != clauses:
+            result = self._dpll(simplified_clauses)
+            if result:
+                self.modele.extend(affectes)
+            dpll_cache[cle] = result
+            return result
+
+        # 3. Division de cas (le littéral de branchement est affecté par la propagation de l'appel suivant)
+        literal = regles.choose_literal(simplified_clauses)
+
+        # Essayer avec le littéral positif
+        if preuve is not None:
+            self._decisions.append(literal)
+        positive_result = self._dpll(simplified_clauses + [regles.unitaire(literal)])
+        if preuve is not None:
+            self._decisions.pop()
+        if positive_result:
+            dpll_cache[cle] = True
+            return True
+
+        # Essayer avec le littéral négatif
+        if preuve is not None:
+            self._decisions.append(-literal)
+        negative_result = self._dpll(simplified_clauses + [regles.unitaire(-literal)])
+        if preuve is not None:
+            self._decisions.pop()
+            if not negative_result:
+                lemme = self._lemme_echec()
+                preuve.supprimer(lemme + [-literal])
+                preuve.supprimer(lemme + [literal])
+
+        dpll_cache[cle] = negative_result
+        return negative_result
+
+    def solve_iteratif(self, clauses, heuristique="dlis"):
+        """
+        Version itérative de DPLL sans recopie de la formule.
+        Une seule base de clauses (littéraux surveillés) et un trail d'affectations par niveaux de décision :
+        le retour arrière annule les affectations au lieu de reconstruire des listes.
+        Les règles appliquées et l'ordre des divisions de cas sont ceux de DPLL, et cpt compte un appel
+        à chaque fois que la version récursive se rappellerait.
+        heuristique : nom de l'heuristique de branchement (voir heuristiques.HEURISTIQUES)
+        La preuve (self.preuve) reçoit les mêmes lemmes que dans la version récursive : la négation des
+        décisions à chaque conflit, puis celle du préfixe quand les deux branches d'une décision sont réfutées.
+        """
+        self.cpt = 1
+        self.modele = None
+        preuve = self.preuve
+        if not isinstance(clauses, list):
+            clauses = list(clauses)  # Décodée une fois, pour le test ci-dessous et pour le moteur
+
+        if not clauses:
+            self.modele = []
+            return True
+        if any(len(clause) == 0 for clause in clauses):
+            if preuve is not None:
+                preuve.ajouter([])
+            return False
+
+        moteur = WatchedLiterals(clauses)
+        mesures = instrumentation.courantes()
+        if mesures is not None:
+            mesures.moteur(moteur)
+        branchement = creer_heuristique(heuristique)
+        branchement.initialiser(moteur)
+        occurrences = Occurrences(moteur)
+        decisions = []  # Pile des divisions de cas : [littéral, branche négative déjà essayée]
+        debut = 0  # Taille du trail au début de l'appel courant
+        conflit = moteur.conflict
+
+        while True:
+            # 1. Propagation unitaire
+            if not conflit:
+                clause_conflit = moteur.propagate()
+                if clause_conflit is not None:
+                    conflit = True
+                    branchement.bump(moteur.clauses[clause_conflit])
+                    branchement.decay()
+
+            if not conflit:
+                occurrences.synchroniser()
+                if occurrences.restantes == 0:
+                    self.modele = moteur.modele()
+                    return True
+
+                # 2. Élimination des littéraux purs : les affecter à vrai satisfait leurs clauses
+                # Optimisation: les comptes d'occurrences sont tenus à jour, seuls les littéraux dont l'opposé
+                # vient de disparaître sont examinés au lieu de recompter toute la formule
+                pure_lits = occurrences.purs()
+                if pure_lits:
+                    for lit in pure_lits:
+                        moteur.assign(lit)
+                    occurrences.synchroniser()
+                    if occurrences.restantes == 0:
+                        self.modele = moteur.modele()
+                        return True
+
+                # Si la formule a changé, la version récursive se rappelle sur la formule simplifiée
+                if len(moteur.trail) > debut:
+                    self.cpt += 1
+                    debut = len(moteur.trail)
+                    continue
+
+                # 3. Division de cas : par défaut le littéral le plus fréquent (DLIS)
+                literal = branchement.choisir(moteur)
+                decisions.append([literal, False])
+                self.cpt += 1
+                debut = len(moteur.trail)
+                moteur.decide(literal)
+                continue
+
+            # Conflit : retour arrière chronologique vers la dernière décision dont la négation n'a pas été essayée
+            if preuve is not None:
+                preuve.ajouter(_negation_chemin(decisions))
+            while decisions and decisions[-1][1]:
+                literal = decisions.pop()[0]
+                if preuve is not None:
+                    lemme = _negation_chemin(decisions)
+                    preuve.ajouter(lemme)
+                    preuve.supprimer(lemme + [-literal])
+                    preuve.supprimer(lemme + [literal])
+            if not decisions:
+                return False
+
+            decisions[-1][1] = True
+            literal = decisions[-1][0]
+            moteur.backtrack(len(decisions) - 1)
+            self.cpt += 1
+            debut = len(moteur.trail)
+            moteur.decide(-literal)
+            conflit = False
+
+
+def _negation_chemin(decisions):
+    """Lemme d'échec du chemin courant de solve_iteratif : la négation de chaque branche prise"""
+    return [literal if essayee else -literal for literal, essayee in decisions]
+
+
+_LISTES = sys.modules[__name__]  # Étapes sur listes de littéraux (ce module)
+
+
+def choisir_regles(clauses, backend="auto"):
+    """Retourne le module des étapes à utiliser : ce module (listes) ou bitset (masques de bits)"""
+    if backend == "listes":
+        return _LISTES
+    if backend == "bits":
+        return bitset
+    if backend != "auto":
+        raise ValueError(f"Représentation inconnue: {backend} (disponibles: auto, listes, bits)")
+    # Les masques n'ordonnent pas les littéraux d'une clause : leurs égalités de fréquence sont départagées par
+    # numéro de variable et non dans l'ordre de la formule, ce qui change la recherche (et le nombre d'appels)
+    return _LISTES
+
+
+def DPLL(clauses):
+    """Retourne vrai si la formule est satisfiable (DPLL récursif, avec un solveur DPLLSolver neuf)"""
+    return DPLLSolver().solve(clauses)
+
+
+def DPLL_iteratif(clauses, heuristique="dlis"):
+    """Retourne vrai si la formule est satisfiable (DPLL itératif, avec un solveur DPLLSolver neuf)"""
+    return DPLLSolver().solve_iteratif(clauses, heuristique)
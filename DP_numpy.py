@@ -0,0 +1,203 @@
+"""
+Règles de simplification de DP vectorisées avec NumPy.
+La formule est une matrice d'entiers (une ligne par clause, littéraux alignés à gauche, complétée par des 0) :
+chaque règle devient quelques opérations sur toute la matrice au lieu d'une boucle Python par clause.
+Les règles ont le même effet que celles des listes (formule_indexee.py) et des masques (bitset.py) ;
+vers_matrice et vers_listes convertissent entre les deux représentations.
+Le module sert de représentation à DPSolver (backend="numpy", voir DP_optimised.choisir_regles) : comme dans
+bitset.py, une règle qui ne change rien retourne la matrice elle-même, et les règles 2 et 3 retournent aussi
+le littéral qu'elles appliquent (0 si aucun).
+"""
+
+from collections import Counter
+
+import numpy as np
+
+import subsumption
+from cache import valeurs_zobrist
+
+
+def vers_matrice(clauses):
+    """Convertit une liste de listes de littéraux en matrice complétée par des 0"""
+    largeur = max((len(c) for c in clauses), default=0)
+    M = np.zeros((len(clauses), largeur), dtype=np.int32)
+    for i, c in enumerate(clauses):
+        M[i, :len(c)] = c
+    return M
+
+
+def vers_listes(M):
+    """Convertit une matrice en liste de listes de littéraux (les 0 de remplissage sont ôtés)"""
+    return [[int(l) for l in ligne if l != 0] for ligne in M]
+
+
+encoder = vers_matrice
+decoder = vers_listes
+
+
+def longueurs(M):
+    """Nombre de littéraux de chaque clause"""
+    return np.count_nonzero(M, axis=1)
+
+
+def _tasser(M):
+    """Réaligne les littéraux à gauche après suppression (ordre conservé) et retire les colonnes vides"""
+    ordre = np.argsort(M == 0, axis=1, kind='stable')
+    M = np.take_along_axis(M, ordre, axis=1)
+    largeur = int(longueurs(M).max(initial=0))
+    return M[:, :largeur]
+
+
+def tautologies(M):
+    """Masque des clauses contenant un littéral et son opposé"""
+    somme_nulle = (M[:, :, None] + M[:, None, :]) == 0
+    non_vide = (M != 0)[:, :, None]
+    return (somme_nulle & non_vide).any(axis=(1, 2))
+
+
+def regle_1(M):
+    """Règle 1 : oter tautologie -> clause contenant l et non l"""
+    return M[~tautologies(M)]
+
+
+def ote_val_from_clauses(M, value):
+    """Supprime la valeur value de toutes les clauses"""
+    return _tasser(np.where(M == value, 0, M))
+
+
+def ote_clauses_with_val(M, value):
+    """Supprime les clauses contenant la valeur value"""
+    return M[~(M == value).any(axis=1)]
+
+
+def _occurrences(M):
+    """Littéraux distincts dans l'ordre de première apparition, avec leur nombre d'occurrences"""
+    plat = M[M != 0]
+    lits, premiers, nombres = np.unique(plat, return_index=True, return_counts=True)
+    ordre = np.argsort(premiers, kind='stable')
+    return lits[ordre], nombres[ordre]
+
+
+def count_literals(M):
+    """Compte les occurrences de chaque littéral dans les clauses"""
+    lits, nombres = _occurrences(M)
+    return Counter(dict(zip(lits.tolist(), nombres.tolist())))
+
+
+def contient_vide(M):
+    """Retourne vrai si la formule contient la clause vide"""
+    return bool((longueurs(M) == 0).any())
+
+
+def lit_unitaire(M):
+    """Retourne le littéral de la première clause unitaire, ou 0 s'il n'y en a pas"""
+    unitaires = np.flatnonzero(longueurs(M) == 1)
+    return int(M[unitaires[0], 0]) if len(unitaires) else 0
+
+
+def regle_2(M):
+    """Règle 2 : clause contient 1 seul littéral -> enlever les clauses le contenant,
+    et enlever l'apparition de son inverse ailleurs.
+    Retourne (matrice, littéral affecté), ou (la matrice elle-même, 0) s'il n'y a pas de clause unitaire."""
+    value = lit_unitaire(M)
+    if value == 0:
+        return M, 0
+    M = M[np.argsort(longueurs(M), kind='stable')]
+    return ote_val_from_clauses(ote_clauses_with_val(M, value), -value), value
+
+
+def single_lit(M):
+    """Retourne un littéral qui apparaît dans des clauses mais dont l'opposé n'apparaît jamais"""
+    lits, _ = _occurrences(M)
+    purs = lits[~np.isin(-lits, lits)]
+    return int(purs[0]) if len(purs) else 0
+
+
+def regle_3(M):
+    """Règle 3 : 1 littéral apparaît dans des clauses, son inverse n'apparaît jamais
+    -> enlever les clauses le contenant.
+    Retourne (matrice, littéral pur), ou (la matrice elle-même, 0) s'il n'y a pas de littéral pur."""
+    lit = single_lit(M)
+    if lit != 0:
+        return ote_clauses_with_val(M, lit), lit
+    return M, 0
+
+
+def _subsumees(M):
+    """
+    Indicateurs des clauses subsumées : C ⊆ D si |C ∩ D| = |C|, les intersections de toutes les paires
+    venant d'un seul produit de la matrice d'incidence clauses × littéraux par sa transposée.
+    Parmi des clauses égales, seule la première est gardée, comme dans subsumption.simplifier.
+    """
+    m = len(M)
+    n = int(np.abs(M).max(initial=0))
+    lignes, colonnes = np.nonzero(M)
+    incidence = np.zeros((m, 2 * n + 1), dtype=np.float32)  # Produit en flottants (BLAS), exact sur ces entiers
+    incidence[lignes, M[lignes, colonnes] + n] = 1
+    tailles = incidence.sum(axis=1)  # Littéraux distincts de chaque clause
+    # inclus[i, j] : la clause i est incluse dans la clause j
+    inclus = (incidence @ incidence.T) == tailles[:, None]
+    avant = np.tri(m, k=-1, dtype=bool).T  # avant[i, j] : i < j
+    retire = inclus & (~inclus.T | avant)
+    np.fill_diagonal(retire, False)
+    return retire.any(axis=0)
+
+
+def regle_4(M, auto_subsumption=False):
+    """Règle 4 : si une clause est contenue dans d'autres -> enlever les autres
+    Avec auto_subsumption, les clauses sont aussi raccourcies par auto-subsomption (sur les listes)."""
+    if auto_subsumption:
+        listes = vers_listes(M)
+        result = subsumption.simplifier(listes, True)
+        return M if result is listes else vers_matrice(result)
+    retirees = _subsumees(M)
+    if not retirees.any():
+        return M
+    return M[~retirees]
+
+
+def _melanger(h):
+    """cache.melanger sur un tableau d'entiers de 64 bits (les multiplications débordent modulo 2^64)"""
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def cle(M):
+    """Clé de cache de la formule, égale à FormulaCache.cle(vers_listes(M))"""
+    lits, indices = np.unique(M, return_inverse=True)
+    valeurs = np.array(valeurs_zobrist(lits.tolist()), dtype=np.uint64)
+    valeurs[lits == 0] = 0  # Remplissage
+    hachages = _melanger(valeurs[indices.reshape(M.shape)].sum(axis=1, dtype=np.uint64))
+    return int(hachages.sum(dtype=np.uint64)), len(M)
+
+
+def get_not_single(M):
+    """Retourne un littéral l dont son inverse apparaît également (le plus fréquent)"""
+    lits, nombres = _occurrences(M)
+    lits = lits[np.argsort(-nombres, kind='stable')]
+    candidats = lits[np.isin(-lits, lits)]
+    return int(candidats[0]) if len(candidats) else 0
+
+
+def regle_5(M):
+    """Règle 5 : Créer des mondes à partir d'un littéral l dont l'inverse apparaît également
+    -> (F sans les clauses contenant l et sans ¬l, F sans les clauses contenant ¬l et sans l)"""
+    l = get_not_single(M)
+    if l != 0:
+        return (ote_val_from_clauses(ote_clauses_with_val(M, l), -l),
+                ote_val_from_clauses(ote_clauses_with_val(M, -l), l))
+    return None
+
+
+def simplifier(M):
+    """Applique la règle 1 puis les règles 2 et 3 jusqu'à ce que la formule ne change plus
+    (ou devienne vide, ou contienne la clause vide)"""
+    M = regle_1(M)
+    while len(M) and not (longueurs(M) == 0).any():
+        M, lit = regle_2(M)
+        if lit == 0:
+            M, lit = regle_3(M)
+            if lit == 0:
+                break
+    return M
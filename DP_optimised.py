@@ -3,7 +3,12 @@ Ce code est une version optimisée de l'algorithme de Davis-Putnam. Au fil du co
 qui expliquent les optimisations apportées. Ces optimisations permettent de réduire le temps d'exécution de l'algorithme.
 """
 
-from collections import Counter
+import sys
+
+import bitset
+import instrumentation
+from cache import FormulaCache
+from formule_indexee import FormuleIndexee
 
 
 def is_tautologie(clause):
@@ -19,236 +24,248 @@ def regle_1(clauses):
     return [c for c in clauses if not is_tautologie(c)]
 
 
-def ote_val_from_clauses(clauses, value):
-    """Supprime la valeur value de toutes les clauses"""
-    return [[i for i in c if i != value] for c in clauses]
-
-
-def ote_clauses_with_val(clauses, value):
-    """Supprime les clauses contenant la valeur value"""
-    return [c for c in clauses if value not in c]
-
-
-def regle_2(clauses):
-    """Règle 2 : clause contient 1 seul littéral -> enlever les clauses le contenant, 
-    et enlever l'apparition de son inverse ailleurs"""
-    # Optimisation: tri des clauses par longueur pour trouver plus rapidement les clauses unitaires
-    clauses.sort(key=len)
-
-    for c in clauses:
-        if len(c) == 1:
-            value = c[0]
-            clauses2 = ote_clauses_with_val(clauses, value)
-            clauses3 = ote_val_from_clauses(clauses2, -value)
-            return clauses3
-    return clauses
-
-
-def count_literals(clauses):
-    """Compte les occurrences de chaque littéral dans les clauses"""
-    counter = Counter()
-    for c in clauses:
-        counter.update(c)
-    return counter
-
-
-def exist_in_clauses(value, clauses):
-    """Retourne vrai si la valeur value existe dans au moins une clause"""
-    for c in clauses:
-        if value in c:
-            return True
-    return False
-
-
-def single_lit(clauses):
-    """Retourne un littéral qui apparaît dans des clauses mais dont l'opposé n'apparaît jamais"""
-    # Optimisation: utilisation de Counter pour un comptage plus rapide
-    counter = count_literals(clauses)
-
-    for lit in counter:
-        if -lit not in counter:
-            return lit
-    return 0
-
-
-def regle_3(clauses):
-    """Règle 3 : 1 littéral apparaît dans des clauses, son inverse n'apparaît jamais 
-    -> enlever les clauses le contenant"""
-    lit = single_lit(clauses)
-    if lit != 0:
-        clauses2 = ote_clauses_with_val(clauses, lit)
-        return clauses2
-    return clauses
-
-
-def bigger_clauses(clauses):
-    """Retourne les clauses qui contiennent d'autres clauses"""
-    clauses2 = []
-    # Optimisation: tri des clauses par longueur pour une vérification plus rapide des sous-ensembles
-    sorted_clauses = sorted(clauses, key=len)
-
-    for i, c2 in enumerate(sorted_clauses):
-        for c in sorted_clauses[i + 1:]:
-            if set(c2).issubset(set(c)):
-                clauses2.append(c)
-
-    return clauses2
-
-
-def regle_4(clauses):
-    """Règle 4 : si une clause est contenue dans d'autres -> enlever les autres"""
-    clauses2 = bigger_clauses(clauses)
-    clauses3 = [c for c in clauses if c not in clauses2]
-    return clauses3
-
-
-def get_not_single(clauses):
-    """Retourne un littéral l dont son inverse apparaît également"""
-    # Optimisation: choisir le littéral avec la plus haute occurrence
-    counter = count_literals(clauses)
-
-    literals = sorted(counter.keys(), key=lambda x: counter[x], reverse=True)
-
-    for lit in literals:
-        if -lit in counter:
-            return lit
-    return 0
-
-
-def regle_5(clauses):
-    """Règle 5 : Créer des mondes -> choisir un littéral l dont son inverse apparaît également
-    -> créer 2 formules,
-    - F1) contenant les clauses de F sauf celles contenant l
-         et où les apparitions de ¬l sont ôtées
-    - F2) contenant les clauses de F sauf celles contenant ¬l
-      et où les apparitions de l sont ôtées
+class DPSolver:
+    """
+    Solveur DP réentrant : cache, compteur, modèle et options appartiennent à l'instance,
+    donc plusieurs résolutions peuvent s'exécuter en même temps (une instance chacune).
+    verbose : affiche chaque formule résolue ; auto_subsumption : la règle 4 raccourcit aussi les clauses.
+    backend : "listes", "bits" (masques de bits, voir bitset.py), "numpy" (matrice, voir DP_numpy.py) ou "auto"
+    (listes : avec la formule indexée, elles sont plus rapides que les autres représentations sur toutes les
+    tailles mesurées).
     """
-    l = get_not_single(clauses)
-    if l != 0:
-        clauses21 = ote_clauses_with_val(clauses, l)
-        clauses31 = ote_val_from_clauses(clauses21, -l)
-        clauses22 = ote_clauses_with_val(clauses, -l)
-        clauses32 = ote_val_from_clauses(clauses22, l)
-        return (clauses31, clauses32)
-    return None
-
-
-def formules_egales(f1, f2):
-    """Retourne vrai si les formules f1 et f2 sont identiques"""
-    # Optimisation: utilisation d'ensembles pour la comparaison
-    if len(f1) != len(f2):
-        return False
-
-    f1_set = {tuple(sorted(c)) for c in f1}
-    f2_set = {tuple(sorted(c)) for c in f2}
-
-    return f1_set == f2_set
-
-
-# Cache pour la mémorisation
-formula_cache = {}
 
-cpt = 0
-verbose = False
-start_time = 0
+    def __init__(self, verbose=False, auto_subsumption=False, max_entrees=200000, backend="auto"):
+        self.verbose = verbose
+        self.auto_subsumption = auto_subsumption
+        self.backend = backend
+        self.regles = _LISTES  # Module des règles utilisé par la résolution en cours
+        # Cache pour la mémorisation (borné, clés de taille fixe)
+        self.cache = FormulaCache(max_entrees)
+        self.cpt = 0
+        self.modele = None  # Littéraux affectés le long du chemin de succès de la dernière résolution satisfiable
+
+    def solve(self, clauses):
+        """
+        Retourne vrai si la formule est satisfiable. Le compteur et le cache sont remis à zéro au début ;
+        à la fin, les entrées du cache sont libérées (ses compteurs restent disponibles).
+        En cas de succès, modele contient les littéraux affectés par les règles 2, 3 et 5 le long du chemin
+        qui a réussi. Les variables absentes sont libres.
+        """
+        self.cpt = 0
+        self.modele = None
+        self.cache.clear()
+        regles = choisir_regles(clauses, self.backend)
+        mesures = instrumentation.courantes()
+        self.regles = regles if mesures is None else mesures.regles(regles)
+        try:
+            # Les règles 2 à 5 ne font qu'ôter des clauses ou des littéraux : elles ne créent pas de tautologie,
+            # la règle 1 n'est donc appliquée qu'une fois
+            if regles is not _LISTES:
+                return self._dp_bits(self.regles.regle_1(regles.encoder(clauses)))
+            etat = FormuleIndexee(self.regles.regle_1(clauses), self.auto_subsumption)
+            return self._dp(etat if mesures is None else mesures.formule(etat))
+        finally:
+            if mesures is not None:
+                mesures.cache(self.cache)
+            self.cache.liberer()
+
+    def _point_fixe(self, etat, chemin):
+        """
+        Applique les règles 2, 3 et 4 à la formule indexée etat jusqu'à ce qu'aucune ne s'applique.
+        Chaque nouvelle formule ni vide ni contradictoire compte pour un appel (cpt), comme un appel récursif
+        de l'ancienne version (la formule de départ est comptée par l'appelant).
+        Les littéraux affectés par les règles 2 et 3 sont ajoutés à chemin.
+        Retourne True si la formule est satisfaite, False si elle contient la clause vide,
+        None s'il faut une division de cas.
+        """
+        premiere = True
+        while True:
+            if etat.contradiction:
+                return False
+            if etat.nb_clauses == 0:
+                return True
+            if not premiere:
+                self.cpt += 1
+            premiere = False
+            if self.verbose:
+                print("résolution de ", etat.formule())
+
+            # Optimisation: chaque règle signale elle-même si elle a changé la formule,
+            # sans comparer la formule avant et après
+            lit = etat.regle_2()
+            if lit == 0:
+                lit = etat.regle_3()
+            if lit != 0:
+                chemin.append(lit)
+                continue
+            # Les clauses ôtées ou raccourcies par la règle 4 sont satisfaites par tout modèle du résultat
+            if etat.regle_4():
+                continue
+            return None
+
+    def _point_fixe_bits(self, formule, chemin):
+        """
+        Point fixe sur masques de bits ou sur matrice NumPy : les règles 2 et 3 retournent la formule
+        et le littéral appliqué (0 si aucun), la règle 4 retourne la formule elle-même si elle ne change rien
+        """
+        regles = self.regles
+        premiere = True
+        while True:
+            if len(formule) == 0:
+                return True, None
+            if regles.contient_vide(formule):
+                return False, None
+            if not premiere:
+                self.cpt += 1
+            premiere = False
+            if self.verbose:
+                print("résolution de ", formule)
+
+            clr2, lit = regles.regle_2(formule)
+            if lit != 0:
+                chemin.append(lit)
+                formule = clr2
+                continue
+
+            clr3, lit = regles.regle_3(formule)
+            if lit != 0:
+                chemin.append(lit)
+                formule = clr3
+                continue
+
+            clr4 = regles.regle_4(formule, self.auto_subsumption)
+            if clr4 is not formule:
+                formule = clr4
+                continue
+
+            return None, formule
+
+    def _dp(self, etat):
+        """
+        DP itératif sur une formule indexée : les règles 2 à 4 sont appliquées jusqu'au point fixe dans une
+        boucle, et les divisions de cas (règle 5) sont gardées sur une pile explicite au lieu de la pile
+        d'appels de Python. Un monde est obtenu en affectant le littéral de division sur place ; le second
+        monde part de la même formule, remise dans son état d'avant la division par le journal.
+        La mémorisation porte sur les formules de départ de chaque monde : un échec y est enregistré
+        quand le monde, et donc toute la suite de simplifications qui en découle, est réfuté.
+        """
+        formula_cache = self.cache
+        verbose = self.verbose
+
+        pile = []  # Divisions de cas en cours : [clé du nœud, littéral, second monde essayé, taille du chemin, marque]
+        chemin = []  # Littéraux affectés depuis la formule de départ : trail des règles 2, 3 et 5
+
+        while True:
+            # Descente : résolution d'un monde jusqu'au succès, à l'échec ou à la prochaine division de cas
+            self.cpt += 1
+            cle = etat.cle()
+            if formula_cache.get(cle) is False:
+                resultat = False
+            else:
+                resultat = self._point_fixe(etat, chemin)
+
+            if resultat is None:
+                l = etat.regle_5()
+                if l != 0:
+                    pile.append([cle, l, False, len(chemin), etat.marque()])
+                    chemin.append(l)
+                    etat.affecter(l)
+                    continue
+                resultat = False  # Aucun progrès possible
+
+            if resultat:
+                if verbose:
+                    print("succès")
+                self.modele = chemin
+                return True
+
+            # Échec : remontée jusqu'à la dernière division de cas dont le second monde n'a pas été essayé
+            if verbose:
+                print("échec")
+            formula_cache[cle] = False
+            while pile and pile[-1][2]:
+                formula_cache[pile.pop()[0]] = False
+            if not pile:
+                return False
+            noeud = pile[-1]
+            noeud[2] = True
+            etat.annuler(noeud[4])
+            del chemin[noeud[3]:]
+            chemin.append(-noeud[1])
+            etat.affecter(-noeud[1])
+
+    def _dp_bits(self, formule):
+        """
+        Même recherche que _dp sur masques de bits ou sur matrice NumPy : chaque monde est une nouvelle
+        formule (règle 5)
+        """
+        formula_cache = self.cache
+        regles = self.regles
+        verbose = self.verbose
+
+        pile = []  # Divisions de cas en cours : [clé du nœud, second monde, littéral, second monde essayé, taille du chemin]
+        chemin = []
+
+        while True:
+            self.cpt += 1
+            cle = regles.cle(formule)
+            if formula_cache.get(cle) is False:
+                resultat = False
+            else:
+                resultat, formule = self._point_fixe_bits(formule, chemin)
+
+            if resultat is None:
+                l = regles.get_not_single(formule)
+                if l != 0:
+                    monde1, monde2 = regles.regle_5(formule)
+                    pile.append([cle, monde2, l, False, len(chemin)])
+                    chemin.append(l)
+                    formule = monde1
+                    continue
+                resultat = False
+
+            if resultat:
+                if verbose:
+                    print("succès")
+                self.modele = chemin
+                return True
+
+            if verbose:
+                print("échec")
+            formula_cache[cle] = False
+            while pile and pile[-1][3]:
+                formula_cache[pile.pop()[0]] = False
+            if not pile:
+                return False
+            noeud = pile[-1]
+            noeud[3] = True
+            del chemin[noeud[4]:]
+            chemin.append(-noeud[2])
+            formule = noeud[1]
+
+
+_LISTES = sys.modules[__name__]  # Listes de littéraux : règle 1 de ce module, règles 2 à 5 de formule_indexee.py
+
+
+def choisir_regles(clauses, backend="auto"):
+    """
+    Retourne le module de règles à utiliser : ce module (listes), bitset (masques de bits)
+    ou DP_numpy (matrice NumPy, importé seulement s'il est demandé : NumPy est facultatif)
+    """
+    if backend == "listes":
+        return _LISTES
+    if backend == "bits":
+        return bitset
+    if backend == "numpy":
+        import DP_numpy
+        return DP_numpy
+    if backend != "auto":
+        raise ValueError(f"Représentation inconnue: {backend} (disponibles: auto, listes, bits, numpy)")
+    # Les règles sur listes travaillent sur place (formule_indexee.py) alors que celles sur masques
+    # reconstruisent la formule à chaque étape : les listes l'emportent quel que soit le nombre de variables
+    return _LISTES
 
 
 def DP(clauses):
-    """Retourne vrai si la formule est satisfiable (algorithme DP)"""
-    global cpt, start_time
-    cpt += 1
-
-    # Optimisation: mémorisation pour les sous-problèmes répétés
-    clauses_tuple = tuple(tuple(sorted(c)) for c in sorted(clauses, key=lambda x: tuple(sorted(x))))
-    if clauses_tuple in formula_cache:
-        return formula_cache[clauses_tuple]
-
-    if verbose:
-        print("résolution de ", clauses)
-
-    # Détection précoce de succès/échec
-    if len(clauses) == 0:
-        if verbose:
-            print("succès")
-        formula_cache[clauses_tuple] = True
-        return True
-
-    if [] in clauses:
-        if verbose:
-            print("échec")
-        formula_cache[clauses_tuple] = False
-        return False
-
-    # Application des règles dans l'ordre (optimisé)
-    clr1 = regle_1(clauses)
-    if len(clr1) == 0:
-        if verbose:
-            print("succès")
-        formula_cache[clauses_tuple] = True
-        return True
-    if [] in clr1:
-        if verbose:
-            print("échec")
-        formula_cache[clauses_tuple] = False
-        return False
-
-    clr2 = regle_2(clr1)
-    if len(clr2) == 0:
-        if verbose:
-            print("succès")
-        formula_cache[clauses_tuple] = True
-        return True
-    if [] in clr2:
-        if verbose:
-            print("échec")
-        formula_cache[clauses_tuple] = False
-        return False
-    if not formules_egales(clr1, clr2):
-        result = DP(clr2)
-        formula_cache[clauses_tuple] = result
-        return result
-
-    clr3 = regle_3(clr2)
-    if len(clr3) == 0:
-        if verbose:
-            print("succès")
-        formula_cache[clauses_tuple] = True
-        return True
-    if [] in clr3:
-        if verbose:
-            print("échec")
-        formula_cache[clauses_tuple] = False
-        return False
-    if not formules_egales(clr2, clr3):
-        result = DP(clr3)
-        formula_cache[clauses_tuple] = result
-        return result
-
-    clr4 = regle_4(clr3)
-    if len(clr4) == 0:
-        if verbose:
-            print("succès")
-        formula_cache[clauses_tuple] = True
-        return True
-    if [] in clr4:
-        if verbose:
-            print("échec")
-        formula_cache[clauses_tuple] = False
-        return False
-    if not formules_egales(clr3, clr4):
-        result = DP(clr4)
-        formula_cache[clauses_tuple] = result
-        return result
-
-    result_regle_5 = regle_5(clr4)
-    if result_regle_5:
-        clr51, clr52 = result_regle_5
-        mondes_unis = DP(clr51) or DP(clr52)
-        if verbose:
-            print("fin résolution de ", clauses)
-        formula_cache[clauses_tuple] = mondes_unis
-        return mondes_unis
-
-    # Si nous arrivons ici, aucun progrès n'a été fait
-    formula_cache[clauses_tuple] = False
-    return False
\ No newline at end of file
+    """Retourne vrai si la formule est satisfiable (algorithme DP, avec un solveur DPSolver neuf)"""
+    return DPSolver().solve(clauses)
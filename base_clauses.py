@@ -0,0 +1,149 @@
+"""
+Base de clauses compacte : tous les littéraux dans un seul tableau array('i'), plus un tableau des débuts
+et un tableau des longueurs de clauses. Les littéraux sont codés par des indices de 0 à 2n-1
+(2*(v-1) pour v, 2*(v-1)+1 pour ¬v) : 4 octets par littéral au lieu d'une liste Python par clause.
+C'est un format de stockage et d'entrée-sortie (lecture DIMACS, copie binaire .cdb de dimacs.py) : aucun
+solveur ne cherche sur les tableaux eux-mêmes. La base se comporte comme une séquence de clauses au format
+DIMACS, donc DP, DPLL et CDCL peuvent la recevoir à la place d'une liste de listes : le moteur de
+propagation (propagation.WatchedLiterals) la décode une seule fois, les règles de DP et DPLL récursif la
+parcourent une fois avant de travailler sur leurs propres listes.
+"""
+
+import sys
+import time
+from array import array
+
+
+def encode(lit):
+    """Code un littéral DIMACS (non nul) en indice de 0 à 2n-1"""
+    return 2 * (abs(lit) - 1) + (lit < 0)
+
+
+def decode(code):
+    """Retrouve le littéral DIMACS correspondant à un indice"""
+    var = (code >> 1) + 1
+    return -var if code & 1 else var
+
+
+class ClauseDB:
+    """Séquence de clauses stockée dans trois tableaux d'entiers contigus"""
+
+    def __init__(self, nb_vars=0):
+        self.nb_vars = nb_vars
+        self.lits = array('i')  # Littéraux codés de toutes les clauses, bout à bout
+        self.offsets = array('i')  # Indice du premier littéral de chaque clause dans lits
+        self.lengths = array('i')  # Nombre de littéraux de chaque clause
+
+    @classmethod
+    def from_clauses(cls, clauses, nb_vars=0):
+        """Construit une base à partir d'une liste de listes de littéraux DIMACS"""
+        db = cls(nb_vars)
+        for clause in clauses:
+            db.ajouter(clause)
+        return db
+
+    def ajouter(self, clause):
+        """Ajoute une clause (littéraux DIMACS) à la fin de la base"""
+        self.offsets.append(len(self.lits))
+        self.lengths.append(len(clause))
+        for lit in clause:
+            self.lits.append(encode(lit))
+            if abs(lit) > self.nb_vars:
+                self.nb_vars = abs(lit)
+
+    def codes(self, i):
+        """Retourne les littéraux codés de la clause i (tranche du tableau, sans conversion)"""
+        debut = self.offsets[i]
+        return self.lits[debut:debut + self.lengths[i]]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.offsets)
+        debut = self.offsets[i]
+        return [decode(c) for c in self.lits[debut:debut + self.lengths[i]]]
+
+    def __iter__(self):
+        lits = self.lits
+        # Table de décodage indexée par le code : une indexation de liste par littéral au lieu d'un calcul
+        table = [decode(c) for c in range(2 * self.nb_vars)].__getitem__
+        for debut, longueur in zip(self.offsets, self.lengths):
+            yield list(map(table, lits[debut:debut + longueur]))
+
+    def __contains__(self, clause):
+        if not clause:
+            return 0 in self.lengths
+        return any(c == clause for c in self)
+
+    def to_lists(self):
+        """Retourne les clauses sous forme de liste de listes"""
+        return list(self)
+
+    def octets(self):
+        """Mémoire occupée par les trois tableaux, en octets"""
+        return sys.getsizeof(self.lits) + sys.getsizeof(self.offsets) + sys.getsizeof(self.lengths)
+
+
+def octets_listes(clauses):
+    """
+    Mémoire occupée par une liste de listes de clauses, en octets.
+    Les entiers de -5 à 256 sont partagés par l'interpréteur et ne sont comptés que pour leur pointeur.
+    """
+    total = sys.getsizeof(clauses)
+    for clause in clauses:
+        total += sys.getsizeof(clause)
+        for lit in clause:
+            if not -5 <= lit <= 256:
+                total += sys.getsizeof(lit)
+    return total
+
+
+def comparer(clauses, repetitions=3):
+    """
+    Compare la représentation liste de listes et la base compacte : mémoire, puis meilleur temps
+    de DP, DPLL (itératif) et CDCL sur chacune. Retourne un dictionnaire des mesures.
+    """
+    import CDCL
+    import DP_optimised
+    import DPLL
+
+    db = ClauseDB.from_clauses(clauses)
+    mesures = {
+        'octets_listes': octets_listes(clauses),
+        'octets_db': db.octets(),
+    }
+    solveurs = {
+        'dp': DP_optimised.DP,
+        'dpll': DPLL.DPLL_iteratif,
+        'cdcl': CDCL.CDCL,
+    }
+    for nom, solveur in solveurs.items():
+        for representation, formule in (('listes', clauses), ('db', db)):
+            meilleur = None
+            for _ in range(repetitions):
+                debut = time.perf_counter()
+                solveur(formule)
+                duree = time.perf_counter() - debut
+                meilleur = duree if meilleur is None else min(meilleur, duree)
+            mesures[f'temps_{nom}_{representation}'] = meilleur
+    return mesures
+
+
+if __name__ == "__main__":
+    import os
+
+    from main import lire_cnf, scanner_dossier
+
+    dossier = sys.argv[1] if len(sys.argv) > 1 else "uf_files"
+    print(f"{'Fichier':<15} {'Listes (o)':<12} {'Base (o)':<12} {'DP listes':<11} {'DP base':<11} "
+          f"{'DPLL listes':<12} {'DPLL base':<11} {'CDCL listes':<12} {'CDCL base':<11}")
+    for fichier in scanner_dossier(dossier):
+        if fichier == "uuf150-01.cnf":
+            continue
+        m = comparer(lire_cnf(os.path.join(dossier, fichier)))
+        print(f"{fichier:<15} {m['octets_listes']:<12} {m['octets_db']:<12} "
+              f"{m['temps_dp_listes']:<11.4f} {m['temps_dp_db']:<11.4f} "
+              f"{m['temps_dpll_listes']:<12.4f} {m['temps_dpll_db']:<11.4f} "
+              f"{m['temps_cdcl_listes']:<12.4f} {m['temps_cdcl_db']:<11.4f}")
@@ -0,0 +1,158 @@
+"""
+Banc d'essai non interactif : chaque couple (fichier, solveur) est exécuté plusieurs fois et les temps
+(mesurés par les fonctions de test de main avec time.perf_counter) sont résumés par leur minimum, médiane,
+95e centile et écart type, plus le nombre d'appels par seconde. Les mesures s'écrivent en JSON ou en CSV,
+et peuvent être comparées à une référence enregistrée : une médiane plus lente que la référence au-delà
+d'un seuil est une régression, et la commande se termine alors avec le code 1.
+
+Exemple : python benchmark.py uf_files --solveurs DPLL CDCL -n 5 --json mesures.json --reference base.json
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import math
+import os
+import statistics
+import sys
+
+from main import SOLVEURS, lire_cnf, scanner_dossier
+from verification import verifier
+
+CHAMPS = ("fichier", "solveur", "satisfiable", "appels", "repetitions",
+          "temps_min", "temps_median", "temps_p95", "ecart_type", "appels_par_seconde", "modele_verifie")
+
+
+def centile(valeurs, p):
+    """Centile p (entre 0 et 100) par la méthode du rang le plus proche"""
+    triees = sorted(valeurs)
+    rang = max(1, math.ceil(p / 100 * len(triees)))
+    return triees[rang - 1]
+
+
+def mesurer(clauses, fichier, solveur, repetitions=5):
+    """
+    Exécute repetitions fois un solveur (clé de SOLVEURS) sur les clauses et retourne la mesure résumée.
+    Si la formule est satisfiable et que le solveur fournit un modèle, le modèle de la dernière exécution
+    est vérifié sur les clauses (modele_verifie vaut None sinon).
+    """
+    temps = []
+    result = None
+    appels = 0
+    modele = None
+    for _ in range(repetitions):
+        # Les fonctions de test affichent leurs résultats : la sortie est ignorée pendant la mesure
+        with contextlib.redirect_stdout(io.StringIO()):
+            result, appels, duree, modele = SOLVEURS[solveur](clauses, fichier)
+        temps.append(duree)
+    modele_verifie = None
+    if result and modele is not None:
+        modele_verifie = verifier(clauses, modele)
+    mediane = statistics.median(temps)
+    return {
+        "fichier": fichier,
+        "solveur": solveur,
+        "satisfiable": result,
+        "appels": appels,
+        "repetitions": repetitions,
+        "temps_min": min(temps),
+        "temps_median": mediane,
+        "temps_p95": centile(temps, 95),
+        "ecart_type": statistics.stdev(temps) if len(temps) > 1 else 0.0,
+        "appels_par_seconde": appels / mediane if mediane > 0 else 0.0,
+        "modele_verifie": modele_verifie,
+    }
+
+
+def executer(dossier="uf_files", solveurs=("DP", "DPLL", "CDCL"), repetitions=5, exclure=()):
+    """Mesure tous les solveurs sur tous les fichiers du dossier (sauf ceux de exclure) ; retourne la liste des mesures"""
+    mesures = []
+    for fichier in scanner_dossier(dossier):
+        if fichier in exclure:
+            continue
+        clauses = lire_cnf(os.path.join(dossier, fichier))
+        for solveur in solveurs:
+            mesure = mesurer(clauses, fichier, solveur, repetitions)
+            print(f"{fichier:<15} {solveur:<10} {str(mesure['satisfiable']):<6} "
+                  f"min {mesure['temps_min']:.6f}  médiane {mesure['temps_median']:.6f}  "
+                  f"p95 {mesure['temps_p95']:.6f}  écart type {mesure['ecart_type']:.6f}  "
+                  f"{mesure['appels_par_seconde']:.0f} appels/s"
+                  + (" (modèle FAUX)" if mesure["modele_verifie"] is False else ""), file=sys.stderr)
+            mesures.append(mesure)
+    return mesures
+
+
+def ecrire_json(mesures, chemin):
+    with open(chemin, "w") as f:
+        json.dump(mesures, f, indent=2)
+
+
+def ecrire_csv(mesures, chemin):
+    with open(chemin, "w", newline="") as f:
+        ecrivain = csv.DictWriter(f, fieldnames=CHAMPS)
+        ecrivain.writeheader()
+        ecrivain.writerows(mesures)
+
+
+def lire_reference(chemin):
+    """Lit une référence enregistrée par ecrire_json"""
+    with open(chemin) as f:
+        return json.load(f)
+
+
+def regressions(mesures, reference, seuil=0.10):
+    """
+    Retourne les mesures dont la médiane dépasse celle de la référence de plus de seuil (0.10 = 10 %),
+    sous forme de liste de (mesure, médiane de référence). Les couples absents de la référence sont ignorés.
+    """
+    medianes = {(r["fichier"], r["solveur"]): r["temps_median"] for r in reference}
+    result = []
+    for mesure in mesures:
+        ancienne = medianes.get((mesure["fichier"], mesure["solveur"]))
+        if ancienne is not None and mesure["temps_median"] > ancienne * (1 + seuil):
+            result.append((mesure, ancienne))
+    return result
+
+
+def creer_parseur(parseur=None):
+    """Déclare les options du banc d'essai (sur un parseur existant, pour une sous-commande)"""
+    parseur = parseur or argparse.ArgumentParser(description="Banc d'essai des solveurs SAT")
+    parseur.add_argument("dossier", nargs="?", default="uf_files", help="dossier des fichiers CNF")
+    parseur.add_argument("--solveurs", nargs="+", default=["DP", "DPLL", "CDCL"], choices=list(SOLVEURS),
+                         metavar="SOLVEUR", help=f"solveurs à mesurer parmi {', '.join(SOLVEURS)}")
+    parseur.add_argument("-n", "--repetitions", type=int, default=5, help="exécutions par couple (fichier, solveur)")
+    parseur.add_argument("--exclure", nargs="*", default=[], metavar="FICHIER", help="fichiers à ignorer")
+    parseur.add_argument("--json", help="fichier JSON où écrire les mesures")
+    parseur.add_argument("--csv", help="fichier CSV où écrire les mesures")
+    parseur.add_argument("--reference", help="mesures JSON de référence à comparer")
+    parseur.add_argument("--seuil", type=float, default=0.10,
+                         help="ralentissement toléré par rapport à la référence (0.10 = 10 %%)")
+    return parseur
+
+
+def lancer(options):
+    """Exécute le banc d'essai décrit par les options ; retourne le code de sortie (1 en cas de régression)"""
+    mesures = executer(options.dossier, options.solveurs, options.repetitions, options.exclure)
+    if options.json:
+        ecrire_json(mesures, options.json)
+    if options.csv:
+        ecrire_csv(mesures, options.csv)
+    if not (options.json or options.csv):
+        json.dump(mesures, sys.stdout, indent=2)
+        print()
+
+    if options.reference:
+        trouvees = regressions(mesures, lire_reference(options.reference), options.seuil)
+        for mesure, ancienne in trouvees:
+            print(f"Régression: {mesure['fichier']} {mesure['solveur']} médiane {mesure['temps_median']:.6f} s "
+                  f"contre {ancienne:.6f} s (+{(mesure['temps_median'] / ancienne - 1) * 100:.1f} %)",
+                  file=sys.stderr)
+        if trouvees:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(lancer(creer_parseur().parse_args()))
@@ -0,0 +1,393 @@
+"""
+Représentation des clauses par masques de bits, pour les formules à peu de variables.
+Une clause est un couple d'entiers (positifs, négatifs) : le bit v - 1 du premier est allumé si le littéral v
+est dans la clause, celui du second si ¬v y est. Les tests de tautologie, d'appartenance, de retrait d'un
+littéral, d'inclusion (subsomption) et d'égalité de formules deviennent quelques opérations sur des entiers
+au lieu de boucles sur des listes. Les comptages de littéraux (choix de branchement) passent par NumPy
+(matrice de uint64 dépliée en bits) s'il est installé et si les masques tiennent sur 64 bits.
+
+Le module fournit, sous les mêmes noms, les règles de DP (comme DP_numpy) et les étapes de DPLL (DPLL) :
+DPLLSolver et DPSolver l'utilisent seulement sur demande (backend="bits"). À la différence des listes, une clause
+n'a pas d'ordre entre ses littéraux : les égalités de fréquence sont départagées par le plus petit numéro de
+variable (positif d'abord) et non dans l'ordre de la formule, ce qui change la recherche et le nombre d'appels.
+`python bitset.py` compare les deux représentations sur les fichiers de uf_files.
+"""
+
+from collections import Counter
+
+import subsumption
+from cache import MASQUE, melanger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : comptages et subsomption se replient sur des boucles Python
+    np = None
+
+VIDE = (0, 0)
+
+# Constantes de départ du hachage des clauses : (0, n) et (n, 0) n'ont pas le même hachage
+_GRAINE_POSITIFS = 0x9E3779B97F4A7C15
+_GRAINE_NEGATIFS = 0xC2B2AE3D27D4EB4F
+
+
+def encoder(clauses):
+    """Convertit une liste de listes de littéraux en liste de couples de masques"""
+    formule = []
+    for clause in clauses:
+        p = n = 0
+        for lit in clause:
+            if lit > 0:
+                p |= 1 << (lit - 1)
+            else:
+                n |= 1 << (-lit - 1)
+        formule.append((p, n))
+    return formule
+
+
+def _variables(masque):
+    """Numéros des variables dont le bit est allumé, dans l'ordre croissant"""
+    while masque:
+        bit = masque & -masque
+        yield bit.bit_length()
+        masque ^= bit
+
+
+def decoder(formule):
+    """Convertit une liste de couples de masques en liste de listes de littéraux (positifs d'abord)"""
+    return [list(_variables(p)) + [-v for v in _variables(n)] for p, n in formule]
+
+
+def unitaire(lit):
+    """Retourne la clause unitaire du littéral"""
+    return (1 << (lit - 1), 0) if lit > 0 else (0, 1 << (-lit - 1))
+
+
+def _litteral(p, n):
+    """Littéral d'une clause unitaire"""
+    return p.bit_length() if p else -n.bit_length()
+
+
+def contient_vide(formule):
+    """Retourne vrai si la formule contient la clause vide"""
+    return VIDE in formule
+
+
+def _absorber(h, masque):
+    """Mélange un masque de largeur quelconque dans le hachage h, 64 bits à la fois"""
+    while True:
+        h = melanger((h ^ masque) & MASQUE)
+        masque >>= 64
+        if not masque:
+            return h
+
+
+def hash_clause(clause):
+    """
+    Hachage mélangé d'une clause sur 64 bits. Le hachage des entiers de Python ne convient pas : il est calculé
+    modulo 2^61 - 1, donc les bits des variables 62, 63 et 64 retombent sur ceux des variables 1, 2 et 3.
+    """
+    p, n = clause
+    return _absorber(_absorber(_GRAINE_POSITIFS, p) ^ _GRAINE_NEGATIFS, n)
+
+
+def cle(formule):
+    """Clé de cache (hachage, nombre de clauses) indépendante de l'ordre des clauses, comme FormulaCache.cle"""
+    return sum(map(hash_clause, formule)) & MASQUE, len(formule)
+
+
+def _unions(formule):
+    """Masques des variables qui apparaissent positivement et négativement dans la formule"""
+    P = N = 0
+    for p, n in formule:
+        P |= p
+        N |= n
+    return P, N
+
+
+def _comptes(formule):
+    """Occurrences de chaque variable : (positives, négatives), indexées par v - 1"""
+    P, N = _unions(formule)
+    largeur = max(P.bit_length(), N.bit_length())
+    if np is not None and 0 < largeur <= 64:
+        bits = np.array(formule, dtype='<u8').view(np.uint8)
+        # Une ligne par clause : 64 bits du masque positif puis 64 bits du masque négatif
+        plis = np.unpackbits(bits, axis=1, bitorder='little').reshape(len(formule), 2, 64)
+        comptes = plis.sum(axis=0, dtype=np.int64)
+        return comptes[0, :largeur].tolist(), comptes[1, :largeur].tolist()
+    positifs = [0] * largeur
+    negatifs = [0] * largeur
+    for p, n in formule:
+        for v in _variables(p):
+            positifs[v - 1] += 1
+        for v in _variables(n):
+            negatifs[v - 1] += 1
+    return positifs, negatifs
+
+
+def count_literals(formule):
+    """Compte les occurrences de chaque littéral dans les clauses"""
+    positifs, negatifs = _comptes(formule)
+    counter = Counter()
+    for i, (a, b) in enumerate(zip(positifs, negatifs)):
+        if a:
+            counter[i + 1] = a
+        if b:
+            counter[-(i + 1)] = b
+    return counter
+
+
+def _plus_frequent(positifs, negatifs, les_deux):
+    """Littéral le plus fréquent (plus petite variable, positif d'abord, en cas d'égalité), ou 0.
+    Avec les_deux, seules les variables qui apparaissent avec les deux signes sont candidates."""
+    meilleur, lit = 0, 0
+    for i, (a, b) in enumerate(zip(positifs, negatifs)):
+        if les_deux and not (a and b):
+            continue
+        if a > meilleur:
+            meilleur, lit = a, i + 1
+        if b > meilleur:
+            meilleur, lit = b, -(i + 1)
+    return lit
+
+
+# Règles de DP
+
+def is_tautologie(clause):
+    return clause[0] & clause[1] != 0
+
+
+def regle_1(formule):
+    """Règle 1 : oter tautologie -> clause contenant l et non l"""
+    return [c for c in formule if not c[0] & c[1]]
+
+
+def ote_val_from_clauses(formule, value):
+    """Supprime la valeur value de toutes les clauses"""
+    if value > 0:
+        garde = ~(1 << (value - 1))
+        return [(p & garde, n) for p, n in formule]
+    garde = ~(1 << (-value - 1))
+    return [(p, n & garde) for p, n in formule]
+
+
+def ote_clauses_with_val(formule, value):
+    """Supprime les clauses contenant la valeur value"""
+    if value > 0:
+        bit = 1 << (value - 1)
+        return [c for c in formule if not c[0] & bit]
+    bit = 1 << (-value - 1)
+    return [c for c in formule if not c[1] & bit]
+
+
+def lit_unitaire(formule):
+    """Retourne le littéral de la première clause unitaire, ou 0 s'il n'y en a pas"""
+    for p, n in formule:
+        m = p | n
+        if m and not m & (m - 1) and not p & n:
+            return _litteral(p, n)
+    return 0
+
+
+def regle_2(formule):
+    """Règle 2 : clause contient 1 seul littéral -> enlever les clauses le contenant,
+    et enlever l'apparition de son inverse ailleurs.
+    Retourne (formule, littéral affecté), ou (la formule elle-même, 0) s'il n'y a pas de clause unitaire."""
+    value = lit_unitaire(formule)
+    if value != 0:
+        return ote_val_from_clauses(ote_clauses_with_val(formule, value), -value), value
+    return formule, 0
+
+
+def single_lit(formule):
+    """Retourne un littéral qui apparaît dans des clauses mais dont l'opposé n'apparaît jamais"""
+    P, N = _unions(formule)
+    purs = (P & ~N) | (N & ~P)
+    if not purs:
+        return 0
+    bit = purs & -purs
+    return bit.bit_length() if P & bit else -bit.bit_length()
+
+
+def regle_3(formule):
+    """Règle 3 : 1 littéral apparaît dans des clauses, son inverse n'apparaît jamais
+    -> enlever les clauses le contenant.
+    Retourne (formule, littéral pur), ou (la formule elle-même, 0) s'il n'y a pas de littéral pur."""
+    lit = single_lit(formule)
+    if lit != 0:
+        return ote_clauses_with_val(formule, lit), lit
+    return formule, 0
+
+
+def _subsumees(formule):
+    """
+    Indicateurs des clauses subsumées : C ⊆ D si C n'a aucun bit hors de D (sur les deux masques).
+    Parmi des clauses égales, seule la première est gardée, comme dans subsumption.simplifier.
+    """
+    m = len(formule)
+    if np is not None and m and max(max(p.bit_length(), n.bit_length()) for p, n in formule) <= 64:
+        A = np.array(formule, dtype=np.uint64)
+        P, N = A[:, 0], A[:, 1]
+        # inclus[i, j] : la clause i est incluse dans la clause j
+        inclus = ((P[:, None] & ~P[None, :]) == 0) & ((N[:, None] & ~N[None, :]) == 0)
+        avant = np.tri(m, k=-1, dtype=bool).T  # avant[i, j] : i < j
+        retire = inclus & (~inclus.T | avant)
+        np.fill_diagonal(retire, False)
+        return retire.any(axis=0).tolist()
+
+    retirees = [False] * m
+    ordre = sorted(range(m), key=lambda i: bin(formule[i][0]).count("1") + bin(formule[i][1]).count("1"))
+    for k, i in enumerate(ordre):
+        if retirees[i]:
+            continue
+        p, n = formule[i]
+        for j in ordre[k + 1:]:
+            if not retirees[j] and not p & ~formule[j][0] and not n & ~formule[j][1]:
+                retirees[j] = True
+    return retirees
+
+
+def bigger_clauses(formule):
+    """Retourne les clauses qui contiennent d'autres clauses"""
+    return [c for c, retiree in zip(formule, _subsumees(formule)) if retiree]
+
+
+def regle_4(formule, auto_subsumption=False):
+    """Règle 4 : si une clause est contenue dans d'autres -> enlever les autres
+    Avec auto_subsumption, les clauses sont aussi raccourcies par auto-subsomption (sur les listes).
+    Retourne la formule elle-même si elle ne change pas."""
+    if auto_subsumption:
+        listes = decoder(formule)
+        result = subsumption.simplifier(listes, True)
+        return formule if result is listes else encoder(result)
+    retirees = _subsumees(formule)
+    if not any(retirees):
+        return formule
+    return [c for c, retiree in zip(formule, retirees) if not retiree]
+
+
+def get_not_single(formule):
+    """Retourne un littéral l dont son inverse apparaît également (le plus fréquent)"""
+    return _plus_frequent(*_comptes(formule), les_deux=True)
+
+
+def regle_5(formule):
+    """Règle 5 : Créer des mondes à partir d'un littéral l dont l'inverse apparaît également
+    -> (F sans les clauses contenant l et sans ¬l, F sans les clauses contenant ¬l et sans l)"""
+    l = get_not_single(formule)
+    if l != 0:
+        return (ote_val_from_clauses(ote_clauses_with_val(formule, l), -l),
+                ote_val_from_clauses(ote_clauses_with_val(formule, -l), l))
+    return None
+
+
+# Étapes de DPLL
+
+def unit_propagation(formule, affectes=None):
+    """
+    Applique la propagation unitaire
+    Retourne une formule simplifiée et un drapeau indiquant si une contradiction a été trouvée
+    Si affectes est une liste, les littéraux affectés y sont ajoutés.
+    """
+    # Toutes les clauses unitaires d'un passage sont propagées ensemble, par deux masques de littéraux vrais
+    result = formule
+    while True:
+        vrais_p = vrais_n = 0
+        for p, n in result:
+            m = p | n
+            if not m & (m - 1) and not p & n:  # Un seul littéral (pas une tautologie sur une variable)
+                vrais_p |= p
+                vrais_n |= n
+        if not vrais_p and not vrais_n:
+            return result, False
+        if vrais_p & vrais_n:
+            return [], True  # Un littéral et son opposé sont unitaires
+        if affectes is not None:
+            affectes.extend(_variables(vrais_p))
+            affectes.extend(-v for v in _variables(vrais_n))
+
+        faux_p, faux_n = ~vrais_n, ~vrais_p
+        suivante = []
+        for p, n in result:
+            if p & vrais_p or n & vrais_n:
+                continue  # Clause satisfaite
+            clause = (p & faux_p, n & faux_n)
+            if clause == VIDE:
+                return [], True
+            suivante.append(clause)
+        if not suivante:
+            return [], False
+        result = suivante
+
+
+def pure_literal_elimination(formule, affectes=None):
+    """
+    Élimine les littéraux purs
+    Retourne une formule simplifiée
+    Si affectes est une liste, les littéraux purs (affectés à vrai) y sont ajoutés.
+    """
+    if not formule:
+        return formule
+    P, N = _unions(formule)
+    purs_positifs = P & ~N
+    purs_negatifs = N & ~P
+    if not purs_positifs and not purs_negatifs:
+        return formule
+    if affectes is not None:
+        affectes.extend(_variables(purs_positifs))
+        affectes.extend(-v for v in _variables(purs_negatifs))
+    return [c for c in formule if not (c[0] & purs_positifs or c[1] & purs_negatifs)]
+
+
+def choose_literal(formule):
+    """Choisit le littéral le plus fréquent pour la division de cas (DLIS)"""
+    lit = _plus_frequent(*_comptes(formule), les_deux=False)
+    return lit if lit != 0 else None
+
+
+def comparer(clauses, repetitions=3):
+    """
+    Compare les listes et les masques de bits : meilleur temps et nombre d'appels de DP et DPLL
+    avec chaque représentation. Retourne un dictionnaire des mesures.
+    """
+    import time
+
+    import DP_optimised
+    import DPLL
+
+    mesures = {}
+    solveurs = {
+        'dp': DP_optimised.DPSolver,
+        'dpll': DPLL.DPLLSolver,
+    }
+    for nom, classe in solveurs.items():
+        for representation in ('listes', 'bits'):
+            meilleur = None
+            for _ in range(repetitions):
+                solveur = classe(backend=representation)
+                debut = time.perf_counter()
+                solveur.solve(clauses)
+                duree = time.perf_counter() - debut
+                meilleur = duree if meilleur is None else min(meilleur, duree)
+            mesures[f'temps_{nom}_{representation}'] = meilleur
+            mesures[f'appels_{nom}_{representation}'] = solveur.cpt
+    return mesures
+
+
+if __name__ == "__main__":
+    import sys
+
+    from main import lire_cnf, scanner_dossier
+
+    dossier = sys.argv[1] if len(sys.argv) > 1 else "uf_files"
+    fichiers = [f for f in scanner_dossier(dossier) if "uuf150" not in f]
+    totaux = Counter()
+    for fichier in fichiers:
+        m = comparer(lire_cnf(f"{dossier}/{fichier}"))
+        totaux.update(m)
+        print(f"{fichier}: " + ", ".join(
+            f"{nom} {m[f'temps_{nom}_listes']:.4f} s / {m[f'temps_{nom}_bits']:.4f} s "
+            f"({m[f'appels_{nom}_listes']} / {m[f'appels_{nom}_bits']} appels)" for nom in ('dp', 'dpll')))
+    for nom in ('dp', 'dpll'):
+        print(f"Total {nom.upper()}: listes {totaux[f'temps_{nom}_listes']:.3f} s, bits {totaux[f'temps_{nom}_bits']:.3f} s "
+              f"(x{totaux[f'temps_{nom}_listes'] / totaux[f'temps_{nom}_bits']:.2f}), "
+              f"appels {totaux[f'appels_{nom}_listes']} / {totaux[f'appels_{nom}_bits']}")
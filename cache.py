@@ -0,0 +1,130 @@
+"""
+Cache de mémorisation borné pour les solveurs DP et DPLL.
+La clé d'une formule est un hachage de Zobrist sur 64 bits : chaque littéral reçoit une valeur aléatoire,
+une clause est la somme des valeurs de ses littéraux et une formule la somme des clauses mélangées.
+Les sommes sont commutatives, donc la clé ne dépend ni de l'ordre des clauses ni de celui des littéraux,
+sans aucun tri, et elle se met à jour en O(taille de la clause) quand on ajoute ou retire une clause.
+Le nombre d'entrées est borné : au-delà, l'entrée la moins récemment utilisée est évincée (LRU).
+"""
+
+import random
+from collections import OrderedDict
+
+MASQUE = (1 << 64) - 1
+
+
+class _Zobrist(dict):
+    """Table littéral -> valeur aléatoire sur 64 bits, remplie à la demande avec une graine fixe"""
+
+    def __init__(self, graine=0):
+        super().__init__()
+        self.generateur = random.Random(graine)
+
+    def __missing__(self, lit):
+        valeur = self.generateur.getrandbits(64)
+        self[lit] = valeur
+        return valeur
+
+
+_zobrist = _Zobrist()
+
+
+def melanger(h):
+    """Mélange non linéaire sur 64 bits (finaliseur de splitmix64)"""
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASQUE
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASQUE
+    return h ^ (h >> 31)
+
+
+def valeurs_zobrist(lits):
+    """Retourne les valeurs aléatoires des littéraux (pour les hachages calculés hors de ce module)"""
+    z = _zobrist
+    return [z[lit] for lit in lits]
+
+
+def hash_clause(clause):
+    """Retourne le hachage mélangé d'une clause, indépendant de l'ordre de ses littéraux"""
+    z = _zobrist
+    h = 0
+    for lit in clause:
+        h += z[lit]
+    return melanger(h & MASQUE)
+
+
+def hash_formule(clauses):
+    """Retourne le hachage d'une formule, indépendant de l'ordre des clauses et des littéraux"""
+    h = 0
+    for clause in clauses:
+        h += hash_clause(clause)
+    return h & MASQUE
+
+
+def ajouter_clause(h, clause):
+    """Met à jour le hachage h d'une formule à laquelle on ajoute la clause"""
+    return (h + hash_clause(clause)) & MASQUE
+
+
+def retirer_clause(h, clause):
+    """Met à jour le hachage h d'une formule dont on retire la clause"""
+    return (h - hash_clause(clause)) & MASQUE
+
+
+class FormulaCache:
+    """
+    Cache LRU borné associant une formule à son résultat.
+    Les clés (hachage, nombre de clauses) ont une taille fixe : la mémoire est d'environ 200 octets
+    par entrée, quelle que soit la taille des formules.
+    """
+
+    def __init__(self, max_entrees=200000):
+        self.max_entrees = max_entrees
+        self.entrees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def cle(clauses):
+        """Retourne la clé canonique de la formule"""
+        return hash_formule(clauses), len(clauses)
+
+    def get(self, cle):
+        """Retourne le résultat mémorisé pour la clé, ou None s'il est absent"""
+        resultat = self.entrees.get(cle)
+        if resultat is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entrees.move_to_end(cle)
+        return resultat
+
+    def __setitem__(self, cle, resultat):
+        entrees = self.entrees
+        entrees[cle] = resultat
+        entrees.move_to_end(cle)
+        if len(entrees) > self.max_entrees:
+            entrees.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.entrees)
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro"""
+        self.entrees.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def liberer(self):
+        """Libère les entrées en gardant les compteurs (fin d'une recherche)"""
+        self.entrees = OrderedDict()
+
+    def stats(self):
+        """Retourne les compteurs du cache sous forme de dictionnaire"""
+        return {
+            'entrees': len(self.entrees),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
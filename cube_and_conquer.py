@@ -0,0 +1,121 @@
+"""
+Cube-and-conquer : répartition d'une seule formule sur plusieurs cœurs.
+On choisit k variables de branchement (les plus fréquentes, comme choose_literal de DPLL) ; chacune des
+2^k affectations de ces variables forme un cube, c'est-à-dire la formule à laquelle on ajoute k clauses
+unitaires. Les cubes sont indépendants : la formule est satisfiable si et seulement si l'un d'eux l'est.
+Les processus prennent les cubes dans une file partagée dès qu'ils sont libres : un processus qui tombe
+sur des cubes faciles en traite davantage, ce qui équilibre la charge sans répartition fixe à l'avance.
+Dès qu'un cube est satisfiable, les autres processus sont arrêtés.
+"""
+
+import itertools
+import math
+import multiprocessing
+import os
+import queue
+import time
+
+import DPLL
+
+
+def choisir_variables(clauses, k):
+    """
+    Retourne au plus k variables de branchement : à chaque étape, la variable du littéral le plus fréquent
+    (choose_literal), puis on la retire de la formule pour que la suivante ne soit pas choisie sur les mêmes clauses.
+    """
+    variables = []
+    reste = clauses
+    for _ in range(k):
+        lit = DPLL.choose_literal(reste)
+        if lit is None:
+            break
+        var = abs(lit)
+        variables.append(var)
+        reste = [[l for l in c if abs(l) != var] for c in reste]
+    return variables
+
+
+def generer_cubes(variables):
+    """Retourne les 2^k cubes (listes de littéraux) sur les variables, positif d'abord"""
+    return [[v if signe else -v for v, signe in zip(variables, signes)]
+            for signes in itertools.product((True, False), repeat=len(variables))]
+
+
+def _travailleur(clauses, cubes, file_cubes, file_resultats, trouve):
+    """Processus fils : résout les cubes de la file avec DPLL jusqu'à épuisement ou jusqu'à un cube satisfiable"""
+    while not trouve.is_set():
+        i = file_cubes.get()
+        if i is None:
+            break
+        solveur = DPLL.DPLLSolver()
+        try:
+            result = solveur.solve(clauses + [[lit] for lit in cubes[i]])
+        except Exception:
+            result = None
+        file_resultats.put((i, result, solveur.cpt, solveur.modele if result else None))
+
+
+def cube_and_conquer(clauses, k=None, nb_workers=None, timeout=None):
+    """
+    Retourne (satisfiable, appels, cubes traités, nombre de cubes, modèle) en répartissant les cubes entre
+    nb_workers processus (un par cœur par défaut). Par défaut, k donne environ 8 cubes par processus.
+    satisfiable vaut None si un cube n'a pas pu être résolu ou si timeout secondes sont dépassées.
+    Le modèle est celui du cube satisfiable trouvé (ses littéraux en font partie), None sinon.
+    """
+    nb_workers = nb_workers or os.cpu_count() or 1
+    if k is None:
+        k = max(1, math.ceil(math.log2(8 * nb_workers)))
+    cubes = generer_cubes(choisir_variables(clauses, k))
+
+    file_cubes = multiprocessing.Queue()
+    file_resultats = multiprocessing.Queue()
+    trouve = multiprocessing.Event()
+    for i in range(len(cubes)):
+        file_cubes.put(i)
+    for _ in range(nb_workers):
+        file_cubes.put(None)  # Un marqueur de fin par processus
+
+    processus = [multiprocessing.Process(target=_travailleur,
+                                         args=(clauses, cubes, file_cubes, file_resultats, trouve),
+                                         daemon=True)
+                 for _ in range(nb_workers)]
+    for p in processus:
+        p.start()
+
+    echeance = None if timeout is None else time.perf_counter() + timeout
+    result = False
+    modele = None
+    appels = 0
+    traites = 0
+    try:
+        while traites < len(cubes):
+            # Le délai est vérifié à chaque tour : des résultats qui arrivent sans cesse ne le repoussent pas
+            if echeance is not None and time.perf_counter() >= echeance:
+                result = None
+                break
+            attente = 0.1 if echeance is None else max(0.0, min(0.1, echeance - time.perf_counter()))
+            try:
+                _, resultat_cube, appels_cube, modele_cube = file_resultats.get(timeout=attente)
+            except queue.Empty:
+                if not any(p.is_alive() for p in processus):
+                    result = None  # Tous les processus se sont arrêtés sans finir les cubes
+                    break
+                continue
+            traites += 1
+            appels += appels_cube
+            if resultat_cube is None:
+                result = None
+            elif resultat_cube:
+                result = True
+                modele = modele_cube
+                trouve.set()
+                break
+    finally:
+        # Arrêt anticipé : un cube satisfiable suffit, les cubes restants ne sont pas traités
+        for p in processus:
+            p.kill()
+            p.join()
+        file_cubes.close()
+        file_resultats.close()
+
+    return result, appels, traites, len(cubes), modele
@@ -0,0 +1,266 @@
+"""
+Lecture rapide des fichiers DIMACS CNF.
+Le fichier est lu par blocs d'octets : dans un bloc sans commentaire, tous les entiers sont découpés et
+convertis en une fois, puis codés pour ClauseDB ; les 0 deviennent -1, ce qui permet de trouver la fin
+de chaque clause avec list.index (boucle en C) au lieu de tester chaque littéral en Python.
+Les clauses peuvent s'étendre sur plusieurs lignes, l'en-tête « p cnf » sert à dimensionner les tableaux
+de la base, et les fichiers .gz, .xz et .bz2 sont décompressés à la volée.
+Une copie binaire de la base (fichier .cdb à côté du fichier lu) est écrite après la première lecture :
+les lectures suivantes projettent ce fichier en mémoire (mmap) et copient directement les tableaux,
+sans aucune conversion de texte. La copie est ignorée si le fichier source a changé depuis.
+"""
+
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from base_clauses import ClauseDB
+
+TAILLE_BLOC = 1 << 20  # Octets lus à la fois
+EXTENSION_CACHE = ".cdb"
+
+# En-tête de la copie binaire : signature (avec l'ordre des octets de la machine), nombre de variables,
+# de clauses et de littéraux, puis taille et date de modification du fichier source
+_SIGNATURE = b"CNFDB1" + (b"L" if sys.byteorder == "little" else b"B") + b"\0"
+_ENTETE = struct.Struct("<8sqqqqq")
+
+_OUVERTURES = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+
+
+def ouvrir(chemin):
+    """Ouvre un fichier en lecture binaire, en le décompressant selon son extension"""
+    ouverture = _OUVERTURES.get(os.path.splitext(chemin)[1], open)
+    return ouverture(chemin, "rb")
+
+
+def _lire_entete(ligne, db):
+    """Lit la ligne « p cnf <variables> <clauses> » ; retourne le nombre de clauses annoncé"""
+    champs = ligne.split()
+    if len(champs) >= 4 and champs[1] == b"cnf":
+        db.nb_vars = max(db.nb_vars, int(champs[2]))
+        return int(champs[3])
+    return 0
+
+
+def _filtrer_lignes(bloc, db):
+    """
+    Retire les commentaires et l'en-tête d'un bloc.
+    Retourne (texte restant, nombre de clauses annoncé ou 0, vrai si la fin des clauses « % » a été atteinte).
+    """
+    gardees = []
+    annoncees = 0
+    for ligne in bloc.split(b"\n"):
+        debut = ligne.lstrip()[:1]
+        if debut == b"c":
+            continue
+        if debut == b"p":
+            annoncees = _lire_entete(ligne, db)
+            continue
+        if debut == b"%":
+            return b"\n".join(gardees), annoncees, True
+        gardees.append(ligne)
+    return b"\n".join(gardees), annoncees, False
+
+
+def _ranger(offsets, lengths, i, debut, longueur):
+    """Enregistre la clause i dans les tableaux prédimensionnés, en les agrandissant au-delà de l'en-tête"""
+    if i < len(offsets):
+        offsets[i] = debut
+        lengths[i] = longueur
+    else:
+        offsets.append(debut)
+        lengths.append(longueur)
+
+
+def _blocs(f, db, entete):
+    """
+    Lit le fichier par blocs et produit, pour chaque bloc, la liste de ses entiers (littéraux et 0 de fin de clause).
+    Les lignes coupées en fin de bloc sont reportées au bloc suivant ; entete reçoit le nombre de clauses annoncé.
+    """
+    reste = b""  # Ligne coupée à la fin du bloc précédent
+    fin = False
+    while not fin:
+        bloc = f.read(TAILLE_BLOC)
+        if not bloc:
+            bloc, reste, fin = reste, b"", True
+        else:
+            bloc = reste + bloc
+            coupure = bloc.rfind(b"\n")
+            if coupure < 0:
+                reste = bloc
+                continue
+            bloc, reste = bloc[:coupure], bloc[coupure + 1:]
+
+        if b"c" in bloc or b"p" in bloc or b"%" in bloc:
+            bloc, annoncees, termine = _filtrer_lignes(bloc, db)
+            if annoncees:
+                entete(annoncees)
+            fin = fin or termine
+        yield list(map(int, bloc.split()))
+
+
+def _table_codage(nb_vars):
+    """Table littéral -> code indexée directement par le littéral (les négatifs par la fin), 0 -> -1"""
+    table = [-1] * (2 * nb_vars + 1)
+    for v in range(1, nb_vars + 1):
+        table[v] = 2 * v - 2
+        table[-v] = 2 * v - 1
+    return table
+
+
+def analyser(f, nb_vars=0):
+    """Construit une ClauseDB à partir d'un fichier DIMACS ouvert en binaire"""
+    db = ClauseDB(nb_vars)
+    lits = db.lits
+    # Tableaux des clauses, prédimensionnés d'après l'en-tête et remplis par indice
+    offsets = array("i")
+    lengths = array("i")
+    table = []
+
+    def entete(annoncees):
+        nonlocal offsets, lengths, table
+        if not offsets:
+            offsets = array("i", bytes(4 * annoncees))
+            lengths = array("i", bytes(4 * annoncees))
+        table = _table_codage(db.nb_vars)
+
+    nb_clauses = 0
+    en_attente = []  # Codes de la clause commencée à la fin du bloc précédent
+    for entiers in _blocs(f, db, entete):
+        # Codage des littéraux pour ClauseDB (2(v-1) pour v, 2(v-1)+1 pour ¬v) ; 0 devient -1.
+        # La table évite une expression Python par littéral. Un littéral hors de la table tomberait sur
+        # le code d'un littéral négatif (index négatif) : sans en-tête fiable, la table est agrandie.
+        if entiers:
+            borne = max(max(entiers), -min(entiers))
+            if borne > len(table) // 2:
+                table = _table_codage(borne)
+        codes = list(map(table.__getitem__, entiers))
+        if en_attente:
+            codes = en_attente + codes
+        i = 0
+        while True:
+            try:
+                j = codes.index(-1, i)
+            except ValueError:
+                break
+            _ranger(offsets, lengths, nb_clauses, len(lits), j - i)
+            lits.extend(codes[i:j])
+            nb_clauses += 1
+            i = j + 1
+        en_attente = codes[i:]
+
+    # Dernière clause sans 0 final
+    if en_attente:
+        _ranger(offsets, lengths, nb_clauses, len(lits), len(en_attente))
+        lits.extend(en_attente)
+        nb_clauses += 1
+
+    del offsets[nb_clauses:]
+    del lengths[nb_clauses:]
+    db.offsets = offsets
+    db.lengths = lengths
+    if lits:
+        db.nb_vars = max(db.nb_vars, max(lits) // 2 + 1)
+    return db
+
+
+def analyser_listes(f):
+    """Retourne les clauses d'un fichier DIMACS ouvert en binaire sous forme de liste de listes"""
+    clauses = []
+    en_attente = []
+    for entiers in _blocs(f, ClauseDB(), lambda annoncees: None):
+        if en_attente:
+            entiers = en_attente + entiers
+        i = 0
+        while True:
+            try:
+                j = entiers.index(0, i)
+            except ValueError:
+                break
+            clauses.append(entiers[i:j])
+            i = j + 1
+        en_attente = entiers[i:]
+    if en_attente:
+        clauses.append(en_attente)
+    return clauses
+
+
+def chemin_cache(chemin):
+    """Chemin de la copie binaire associée à un fichier DIMACS"""
+    return chemin + EXTENSION_CACHE
+
+
+def ecrire_cache(db, chemin):
+    """Écrit la copie binaire de la base lue depuis chemin ; retourne faux si elle n'a pas pu être écrite"""
+    etat = os.stat(chemin)
+    try:
+        with open(chemin_cache(chemin), "wb") as f:
+            f.write(_ENTETE.pack(_SIGNATURE, db.nb_vars, len(db.offsets), len(db.lits),
+                                 etat.st_size, etat.st_mtime_ns))
+            db.offsets.tofile(f)
+            db.lengths.tofile(f)
+            db.lits.tofile(f)
+    except OSError:
+        return False
+    return True
+
+
+def lire_cache(chemin):
+    """Retourne la base enregistrée dans la copie binaire de chemin, ou None si elle est absente ou périmée"""
+    try:
+        etat = os.stat(chemin)
+        f = open(chemin_cache(chemin), "rb")
+    except OSError:
+        return None
+    with f:
+        if os.fstat(f.fileno()).st_size < _ENTETE.size:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            signature, nb_vars, nb_clauses, nb_lits, taille, mtime = _ENTETE.unpack_from(mm)
+            if (signature != _SIGNATURE or taille != etat.st_size or mtime != etat.st_mtime_ns
+                    or len(mm) != _ENTETE.size + 4 * (2 * nb_clauses + nb_lits)):
+                return None
+            db = ClauseDB(nb_vars)
+            vue = memoryview(mm)
+            debut = _ENTETE.size
+            for tableau, nombre in ((db.offsets, nb_clauses), (db.lengths, nb_clauses), (db.lits, nb_lits)):
+                tableau.frombytes(vue[debut:debut + 4 * nombre])
+                debut += 4 * nombre
+            vue.release()
+    return db
+
+
+def lire(chemin, cache=True):
+    """
+    Lit un fichier DIMACS (éventuellement compressé) et retourne une ClauseDB.
+    Avec cache=True, la copie binaire est utilisée si elle est à jour, et écrite sinon.
+    """
+    if cache:
+        db = lire_cache(chemin)
+        if db is not None:
+            return db
+    with ouvrir(chemin) as f:
+        db = analyser(f)
+    if cache:
+        ecrire_cache(db, chemin)
+    return db
+
+
+def lire_listes(chemin, cache=True):
+    """
+    Lit un fichier DIMACS (éventuellement compressé) et retourne ses clauses sous forme de liste de listes.
+    Avec cache=True, la lecture passe par lire() : la copie binaire est utilisée, ou écrite pour la fois suivante.
+    """
+    if cache:
+        return lire(chemin).to_lists()
+    with ouvrir(chemin) as f:
+        return analyser_listes(f)
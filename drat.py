@@ -0,0 +1,260 @@
+"""
+Preuves DRAT d'insatisfiabilité : écriture en flux et vérification.
+Une preuve est la suite des clauses ajoutées (lemmes) et supprimées par le solveur, terminée par la clause
+vide. Chaque lemme doit être RUP (la propagation unitaire de sa négation sur les clauses courantes produit
+un conflit) ou, à défaut, RAT sur son premier littéral.
+Format texte : « 1 -2 0 » pour un ajout, « d 1 -2 0 » pour une suppression.
+Format binaire (celui de drat-trim) : un octet 'a' ou 'd', puis chaque littéral l codé par 2|l| + (l < 0)
+en entier de longueur variable (7 bits par octet, bit de poids fort pour « octet suivant »), puis un octet 0.
+Le binaire est environ deux fois plus compact que le texte sur les formules de uf_files.
+L'écriture passe par un tampon vidé par blocs : la mémoire reste constante quelle que soit la longueur de la recherche.
+"""
+
+TAILLE_TAMPON = 1 << 16  # Octets accumulés avant écriture dans le fichier
+
+
+class DratWriter:
+    """Écrit une preuve DRAT (texte ou binaire) dans un fichier, par blocs"""
+
+    def __init__(self, chemin, binaire=False, taille_tampon=TAILLE_TAMPON):
+        self.fichier = open(chemin, "wb")
+        self.binaire = binaire
+        self.taille_tampon = taille_tampon
+        self.tampon = bytearray()
+        self.ajouts = 0
+        self.suppressions = 0
+
+    def _ecrire(self, prefixe, clause):
+        tampon = self.tampon
+        if self.binaire:
+            tampon += prefixe
+            for lit in clause:
+                u = 2 * lit if lit > 0 else -2 * lit + 1
+                while u > 0x7F:
+                    tampon.append((u & 0x7F) | 0x80)
+                    u >>= 7
+                tampon.append(u)
+            tampon.append(0)
+        else:
+            if prefixe == b"d":
+                tampon += b"d "
+            tampon += " ".join(map(str, clause)).encode()
+            tampon += b" 0\n" if clause else b"0\n"
+        if len(tampon) >= self.taille_tampon:
+            self.vider()
+
+    def ajouter(self, clause):
+        """Enregistre l'ajout d'un lemme"""
+        self.ajouts += 1
+        self._ecrire(b"a", clause)
+
+    def supprimer(self, clause):
+        """Enregistre la suppression d'une clause"""
+        self.suppressions += 1
+        self._ecrire(b"d", clause)
+
+    def vider(self):
+        """Écrit le contenu du tampon dans le fichier"""
+        self.fichier.write(self.tampon)
+        self.tampon.clear()
+
+    def fermer(self):
+        self.vider()
+        self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def _est_binaire(debut):
+    """Une preuve texte ne contient que des chiffres, des '-', des 'd' et des blancs"""
+    return any(o not in b"0123456789-d \t\r\n" for o in debut)
+
+
+def lire_preuve(chemin, binaire=None):
+    """
+    Produit les étapes d'une preuve : (vrai pour un ajout / faux pour une suppression, clause).
+    binaire=None : format détecté d'après le début du fichier.
+    """
+    with open(chemin, "rb") as f:
+        donnees = f.read()
+    if binaire is None:
+        binaire = _est_binaire(donnees[:1024])
+
+    if not binaire:
+        ajout, clause = True, []
+        for jeton in donnees.split():
+            if jeton == b"d":
+                ajout = False
+                continue
+            lit = int(jeton)
+            if lit == 0:
+                yield ajout, clause
+                ajout, clause = True, []
+            else:
+                clause.append(lit)
+        return
+
+    i, n = 0, len(donnees)
+    while i < n:
+        ajout = donnees[i] == ord("a")
+        i += 1
+        clause = []
+        while True:
+            u, decalage = 0, 0
+            while True:
+                octet = donnees[i]
+                i += 1
+                u |= (octet & 0x7F) << decalage
+                decalage += 7
+                if octet < 0x80:
+                    break
+            if u == 0:
+                break
+            clause.append(-(u >> 1) if u & 1 else u >> 1)
+        yield ajout, clause
+
+
+class _Verificateur:
+    """Base de clauses avec suppression et propagation unitaire par littéraux surveillés"""
+
+    def __init__(self):
+        self.clauses = {}  # Identifiant -> clause (liste, les deux premiers littéraux sont surveillés)
+        self.par_contenu = {}  # Clause triée -> identifiants (pour les suppressions)
+        self.watches = {}  # Littéral -> identifiants des clauses qui le surveillent (entrées périmées tolérées)
+        self.unitaires = {}  # Identifiant -> littéral des clauses unitaires
+        self.vide = False
+        self.suivant = 0
+
+    def ajouter(self, clause):
+        clause = list(dict.fromkeys(clause))  # Sans doublons, ordre conservé
+        if not clause:
+            self.vide = True
+            return
+        ident = self.suivant
+        self.suivant += 1
+        self.clauses[ident] = clause
+        self.par_contenu.setdefault(tuple(sorted(clause)), []).append(ident)
+        if len(clause) == 1:
+            self.unitaires[ident] = clause[0]
+        else:
+            for lit in clause[:2]:
+                self.watches.setdefault(lit, []).append(ident)
+
+    def supprimer(self, clause):
+        idents = self.par_contenu.get(tuple(sorted(set(clause))))
+        if not idents:
+            return False
+        ident = idents.pop()
+        del self.clauses[ident]
+        self.unitaires.pop(ident, None)
+        return True
+
+    def propager(self, hypotheses):
+        """Retourne vrai si les hypothèses (littéraux supposés vrais) et les clauses produisent un conflit"""
+        val = {}
+        trail = []
+        for lit in list(self.unitaires.values()) + list(hypotheses):
+            v = val.get(lit)
+            if v is False:
+                return True
+            if v is None:
+                val[lit] = True
+                val[-lit] = False
+                trail.append(lit)
+
+        clauses = self.clauses
+        watches = self.watches
+        tete = 0
+        while tete < len(trail):
+            faux = -trail[tete]
+            tete += 1
+            liste = watches.get(faux, [])
+            gardes = []
+            for k, ident in enumerate(liste):
+                clause = clauses.get(ident)
+                if clause is None:
+                    continue  # Clause supprimée : l'entrée est retirée
+                if clause[0] == faux:
+                    clause[0], clause[1] = clause[1], clause[0]
+                if clause[1] != faux:
+                    continue  # Entrée périmée : la clause ne surveille plus ce littéral
+                if val.get(clause[0]) is True:
+                    gardes.append(ident)
+                    continue
+                for j in range(2, len(clause)):
+                    if val.get(clause[j]) is not False:
+                        clause[1], clause[j] = clause[j], clause[1]
+                        watches.setdefault(clause[1], []).append(ident)
+                        break
+                else:
+                    gardes.append(ident)
+                    autre = clause[0]
+                    if val.get(autre) is False:
+                        gardes.extend(liste[k + 1:])
+                        watches[faux] = gardes
+                        return True
+                    val[autre] = True
+                    val[-autre] = False
+                    trail.append(autre)
+            watches[faux] = gardes
+        return False
+
+    def rup(self, lemme):
+        return self.propager([-lit for lit in lemme])
+
+    def rat(self, lemme):
+        """Le lemme est RAT sur son premier littéral p : toute résolvante avec une clause contenant ¬p est RUP"""
+        if not lemme:
+            return False
+        p = lemme[0]
+        for clause in list(self.clauses.values()):
+            if -p not in clause:
+                continue
+            resolvante = list(lemme) + [lit for lit in clause if lit != -p]
+            if any(-lit in resolvante for lit in resolvante):
+                continue  # Résolvante tautologique
+            if not self.rup(resolvante):
+                return False
+        return True
+
+
+def verifier_preuve(clauses, chemin, binaire=None):
+    """
+    Vérifie une preuve DRAT de l'insatisfiabilité des clauses.
+    Retourne (vrai si la preuve est valide, message). Les suppressions de clauses absentes sont ignorées.
+    """
+    base = _Verificateur()
+    for clause in clauses:
+        base.ajouter(clause)
+
+    nb_lemmes = 0
+    for ajout, clause in lire_preuve(chemin, binaire):
+        if not ajout:
+            base.supprimer(clause)
+            continue
+        nb_lemmes += 1
+        if not base.vide and not base.rup(clause) and not base.rat(clause):
+            return False, f"le lemme {nb_lemmes} ({' '.join(map(str, clause))} 0) n'est ni RUP ni RAT"
+        base.ajouter(clause)
+        if not clause:
+            return True, f"preuve valide ({nb_lemmes} lemmes)"
+    if base.vide or base.propager([]):
+        return True, f"preuve valide ({nb_lemmes} lemmes)"
+    return False, "la preuve ne se termine pas par la clause vide"
+
+
+if __name__ == "__main__":
+    import sys
+
+    from main import lire_cnf
+
+    if len(sys.argv) != 3:
+        print("Usage: python drat.py FICHIER.cnf PREUVE.drat")
+        sys.exit(2)
+    valide, message = verifier_preuve(lire_cnf(sys.argv[1]), sys.argv[2])
+    print(("s VERIFIED " if valide else "s NOT VERIFIED ") + message)
+    sys.exit(0 if valide else 1)
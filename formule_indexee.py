@@ -0,0 +1,219 @@
+"""
+Formule indexée pour le point fixe des règles 2, 3 et 4 de DP.
+Les clauses sont modifiées sur place et chaque littéral a sa liste d'occurrences (ensemble des indices
+des clauses qui le contiennent) : affecter un littéral ne visite que les clauses qui le contiennent ou
+contiennent son opposé, au lieu de reconstruire toute la formule. Chaque règle signale elle-même ses
+changements ; il n'y a plus à comparer la formule avant et après pour savoir si elle a changé.
+
+Les clauses touchées sont rangées dans des files :
+- unitaires : clauses réduites à un littéral (règle 2) ;
+- purs : littéraux dont l'opposé vient de disparaître de la formule, candidats pour la règle 3. Un littéral
+  ne devient pur que lorsque le compte d'occurrences de son opposé tombe à zéro : la règle 3 n'examine
+  que ces candidats au lieu de parcourir tous les littéraux ;
+- sales : clauses raccourcies depuis le dernier passage de la règle 4. Une clause qui raccourcit ne peut
+  être subsumée que par une clause qui subsumait déjà sa version longue : seules les clauses sales
+  peuvent donc subsumer de nouvelles clauses, et la règle 4 ne part que d'elles.
+
+Chaque modification est notée dans un journal : une division de cas (règle 5) pose une marque, affecte l
+et, en cas d'échec, annule le journal jusqu'à la marque avant d'affecter ¬l. Les deux mondes partagent
+ainsi la même formule au lieu d'en construire deux copies. La clé de cache (hachage de Zobrist, nombre de
+clauses, voir cache.py) est tenue à jour à chaque modification.
+"""
+
+from collections import defaultdict
+
+from cache import MASQUE, hash_clause
+
+
+class FormuleIndexee:
+    """Formule sans tautologie, modifiée sur place par les règles 2 à 5 de DP"""
+
+    def __init__(self, clauses, auto_subsumption=False):
+        self.auto_subsumption = auto_subsumption
+        self.clauses = []  # Indice -> liste de littéraux, ou None si la clause a été ôtée
+        self.hachages = []  # Indice -> hachage de la clause (cache.hash_clause)
+        self.occ = defaultdict(set)  # Littéral -> indices des clauses qui le contiennent
+        self.nb_clauses = 0  # Clauses restantes
+        self.hachage = 0  # Hachage de Zobrist des clauses restantes
+        self.contradiction = False  # Vrai dès qu'une clause devient vide
+        self.unitaires = []  # Indices des clauses devenues unitaires (entrées périmées tolérées)
+        self.sales = set()  # Indices des clauses à faire passer par la règle 4
+        self.purs = []  # Littéraux peut-être purs (entrées périmées tolérées)
+        self.journal = []  # (indice, clause ôtée) ou (indice, littéral retiré, ancien hachage)
+
+        occ = self.occ
+        for i, clause in enumerate(clauses):
+            clause = list(dict.fromkeys(clause))  # Sans doublons, ordre conservé
+            h = hash_clause(clause)
+            self.clauses.append(clause)
+            self.hachages.append(h)
+            self.hachage += h
+            for lit in clause:
+                occ[lit].add(i)
+            if len(clause) == 1:
+                self.unitaires.append(i)
+            elif not clause:
+                self.contradiction = True
+        self.hachage &= MASQUE
+        self.nb_clauses = len(self.clauses)
+        self.sales = set(range(self.nb_clauses))
+        self.unitaires.reverse()  # Dépilées dans l'ordre de la formule
+        self.purs = [lit for lit in reversed(occ) if -lit not in occ]
+
+    def formule(self):
+        """Retourne les clauses restantes sous forme de liste de listes"""
+        return [c for c in self.clauses if c is not None]
+
+    def cle(self):
+        """Clé de cache des clauses restantes, égale à FormulaCache.cle(self.formule())"""
+        return self.hachage, self.nb_clauses
+
+    def _oter(self, i):
+        """Ôte la clause i (satisfaite ou subsumée)"""
+        clause = self.clauses[i]
+        occ = self.occ
+        for lit in clause:
+            indices = occ[lit]
+            indices.discard(i)
+            if not indices:
+                self.purs.append(-lit)
+        self.clauses[i] = None
+        self.nb_clauses -= 1
+        self.hachage = (self.hachage - self.hachages[i]) & MASQUE
+        self.journal.append((i, clause))
+
+    def _raccourcir(self, i, lit):
+        """Retire le littéral lit de la clause i"""
+        clause = self.clauses[i]
+        clause.remove(lit)
+        indices = self.occ[lit]
+        indices.discard(i)
+        if not indices:
+            self.purs.append(-lit)
+        ancien = self.hachages[i]
+        h = self.hachages[i] = hash_clause(clause)
+        self.hachage = (self.hachage - ancien + h) & MASQUE
+        self.journal.append((i, lit, ancien))
+        if len(clause) == 1:
+            self.unitaires.append(i)
+        elif not clause:
+            self.contradiction = True
+        self.sales.add(i)
+
+    def affecter(self, lit):
+        """Ôte les clauses qui contiennent lit et retire ¬lit des autres"""
+        for i in list(self.occ[lit]):
+            self._oter(i)
+        for i in list(self.occ[-lit]):
+            self._raccourcir(i, -lit)
+
+    def marque(self):
+        """Retourne la position actuelle du journal, à prendre au point fixe (files vides)"""
+        return len(self.journal)
+
+    def annuler(self, marque):
+        """Défait les modifications faites depuis la marque : la formule revient à son point fixe d'alors"""
+        journal = self.journal
+        clauses = self.clauses
+        occ = self.occ
+        while len(journal) > marque:
+            entree = journal.pop()
+            i = entree[0]
+            if len(entree) == 2:
+                clause = clauses[i] = entree[1]
+                for lit in clause:
+                    occ[lit].add(i)
+                self.nb_clauses += 1
+                self.hachage += self.hachages[i]
+            else:
+                lit, ancien = entree[1], entree[2]
+                clauses[i].append(lit)
+                occ[lit].add(i)
+                self.hachage += ancien - self.hachages[i]
+                self.hachages[i] = ancien
+        self.hachage &= MASQUE
+        self.contradiction = False
+        self.unitaires = []
+        self.sales = set()
+        self.purs = []
+
+    def regle_2(self):
+        """Règle 2 : affecte le littéral d'une clause unitaire ; retourne ce littéral, ou 0 s'il n'y en a pas"""
+        clauses = self.clauses
+        while self.unitaires:
+            clause = clauses[self.unitaires.pop()]
+            if clause is not None and len(clause) == 1:
+                lit = clause[0]
+                self.affecter(lit)
+                return lit
+        return 0
+
+    def regle_3(self):
+        """Règle 3 : ôte les clauses d'un littéral pur ; retourne ce littéral, ou 0 s'il n'y en a pas"""
+        occ = self.occ
+        purs = self.purs
+        while purs:
+            lit = purs.pop()
+            indices = occ.get(lit)
+            if indices and not occ.get(-lit):
+                for i in list(indices):
+                    self._oter(i)
+                return lit
+        return 0
+
+    def regle_4(self):
+        """
+        Règle 4 : ôte les clauses subsumées par une clause sale (et, avec auto_subsumption, raccourcit les
+        clauses par auto-subsomption). Retourne vrai si la formule a changé.
+        """
+        clauses = self.clauses
+        occ = self.occ
+        change = False
+        while self.sales:
+            # Les clauses courtes d'abord : ce sont elles qui subsument le plus
+            file = sorted((i for i in self.sales if clauses[i] is not None), key=lambda i: len(clauses[i]))
+            self.sales = set()
+            for i in file:
+                clause = clauses[i]
+                if clause is None:
+                    continue
+                taille = len(clause)
+
+                # Subsomption : seules les clauses qui contiennent le littéral le plus rare de C sont candidates
+                rare = min(clause, key=lambda l: len(occ[l]))
+                candidates = [j for j in occ[rare] if j != i and len(clauses[j]) >= taille]
+                if candidates:
+                    e = set(clause)
+                    for j in candidates:
+                        if e.issubset(clauses[j]):
+                            self._oter(j)
+                            change = True
+
+                if not self.auto_subsumption:
+                    continue
+                # Auto-subsomption : si C = R ∪ {l} et D ⊇ R ∪ {¬l}, on retire ¬l de D
+                e = set(clause)
+                for lit in list(clause):
+                    reste = e - {lit}
+                    for j in list(occ[-lit]):
+                        cj = clauses[j]
+                        if j != i and len(cj) >= taille and reste.issubset(cj):
+                            self._raccourcir(j, -lit)
+                            change = True
+                if self.contradiction:
+                    break
+            if self.contradiction:
+                break
+        return change
+
+    def regle_5(self):
+        """
+        Règle 5 : retourne le littéral de division de cas, le plus fréquent parmi ceux dont l'opposé
+        apparaît aussi, ou 0 s'il n'y en a pas. La formule n'est pas modifiée : voir marque et affecter.
+        """
+        occ = self.occ
+        meilleur, nb_meilleur = 0, 0
+        for lit, indices in occ.items():
+            if len(indices) > nb_meilleur and occ.get(-lit):
+                meilleur, nb_meilleur = lit, len(indices)
+        return meilleur
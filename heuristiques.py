@@ -0,0 +1,194 @@
+"""
+Heuristiques de branchement pour les solveurs à trail (DPLL.DPLL_iteratif et CDCL).
+Toutes partagent la même interface : initialiser() une fois sur le moteur de propagation,
+choisir() à chaque décision, bump()/decay() à chaque conflit.
+"""
+
+from collections import Counter
+
+
+class Heuristique:
+    """Interface commune des heuristiques de branchement"""
+
+    def initialiser(self, moteur):
+        """Prépare l'heuristique pour le moteur de propagation donné"""
+
+    def choisir(self, moteur, counter=None):
+        """
+        Retourne le prochain littéral de décision, ou None si toutes les variables sont affectées.
+        counter : occurrences des littéraux libres de la formule restante, si l'appelant les a déjà calculées
+        """
+        raise NotImplementedError
+
+    def agrandir(self, moteur, ancien_nb_vars):
+        """Prend en compte les variables ajoutées au moteur (moteur.agrandir) au-delà de ancien_nb_vars"""
+
+    def bump(self, lits):
+        """Signale les littéraux impliqués dans un conflit"""
+
+    def decay(self):
+        """Signale la fin du traitement d'un conflit"""
+
+
+class DLIS(Heuristique):
+    """Littéral le plus fréquent dans la formule restante (Dynamic Largest Individual Sum), en O(formule)"""
+
+    def choisir(self, moteur, counter=None):
+        if counter is None:
+            counter = moteur.residual_counts()
+        if not counter:
+            return None
+        return max(counter.items(), key=lambda x: x[1])[0]
+
+
+class Statique(Heuristique):
+    """Ordre fixé au départ : variables les plus fréquentes d'abord, avec leur polarité majoritaire"""
+
+    def initialiser(self, moteur):
+        counter = Counter()
+        for clause in moteur.source:
+            counter.update(clause)
+        variables = sorted(range(1, moteur.nb_vars + 1), key=lambda v: counter[v] + counter[-v], reverse=True)
+        self.ordre = [v if counter[v] >= counter[-v] else -v for v in variables]
+
+    def agrandir(self, moteur, ancien_nb_vars):
+        self.ordre.extend(range(ancien_nb_vars + 1, moteur.nb_vars + 1))
+
+    def choisir(self, moteur, counter=None):
+        val = moteur.val
+        for lit in self.ordre:
+            if val[lit] == 0:
+                return lit
+        return None
+
+
+class VSIDS(Heuristique):
+    """
+    Activité par variable (Variable State Independent Decaying Sum) rangée dans un tas binaire max.
+    Les variables des conflits voient leur activité augmentée ; l'augmentation croît à chaque conflit,
+    ce qui revient à faire décroître les anciennes activités. Une décision coûte O(log n).
+    La polarité choisie est la dernière valeur prise par la variable (phase saving).
+    """
+
+    def __init__(self, decay=0.95):
+        self.facteur = 1 / decay
+        self.increment = 1.0
+
+    def initialiser(self, moteur):
+        n = moteur.nb_vars
+        counter = Counter()
+        for clause in moteur.source:
+            counter.update(clause)
+
+        # Activité initiale : nombre d'occurrences, pour que les premières décisions ne soient pas arbitraires
+        self.activite = [0.0] + [float(counter[v] + counter[-v]) for v in range(1, n + 1)]
+        self.phase = [True] + [counter[v] >= counter[-v] for v in range(1, n + 1)]
+
+        self.tas = sorted(range(1, n + 1), key=lambda v: -self.activite[v])  # Trié, donc déjà un tas
+        self.position = [-1] * (n + 1)  # Variable -> indice dans le tas, -1 si absente
+        for i, v in enumerate(self.tas):
+            self.position[v] = i
+
+        moteur.unassign_hooks.append(self.liberer)
+
+    def _monter(self, i):
+        tas, position, activite = self.tas, self.position, self.activite
+        var = tas[i]
+        a = activite[var]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if activite[tas[parent]] >= a:
+                break
+            tas[i] = tas[parent]
+            position[tas[i]] = i
+            i = parent
+        tas[i] = var
+        position[var] = i
+
+    def _descendre(self, i):
+        tas, position, activite = self.tas, self.position, self.activite
+        n = len(tas)
+        var = tas[i]
+        a = activite[var]
+        while True:
+            fils = 2 * i + 1
+            if fils >= n:
+                break
+            if fils + 1 < n and activite[tas[fils + 1]] > activite[tas[fils]]:
+                fils += 1
+            if activite[tas[fils]] <= a:
+                break
+            tas[i] = tas[fils]
+            position[tas[i]] = i
+            i = fils
+        tas[i] = var
+        position[var] = i
+
+    def _extraire(self):
+        tas = self.tas
+        var = tas[0]
+        dernier = tas.pop()
+        self.position[var] = -1
+        if tas:
+            tas[0] = dernier
+            self.position[dernier] = 0
+            self._descendre(0)
+        return var
+
+    def agrandir(self, moteur, ancien_nb_vars):
+        # Les nouvelles variables entrent dans le tas avec une activité nulle et la polarité négative
+        for var in range(ancien_nb_vars + 1, moteur.nb_vars + 1):
+            self.activite.append(0.0)
+            self.phase.append(False)
+            self.position.append(len(self.tas))
+            self.tas.append(var)
+            self._monter(len(self.tas) - 1)
+
+    def liberer(self, lit):
+        """Remet dans le tas une variable désaffectée et mémorise sa dernière polarité"""
+        var = abs(lit)
+        self.phase[var] = lit > 0
+        if self.position[var] < 0:
+            self.tas.append(var)
+            self.position[var] = len(self.tas) - 1
+            self._monter(len(self.tas) - 1)
+
+    def choisir(self, moteur, counter=None):
+        val = moteur.val
+        # Les variables affectées sont retirées paresseusement ; liberer() les remettra au retour arrière
+        while self.tas:
+            var = self._extraire()
+            if val[var] == 0:
+                return var if self.phase[var] else -var
+        return None
+
+    def bump(self, lits):
+        activite = self.activite
+        for lit in lits:
+            var = abs(lit)
+            activite[var] += self.increment
+            if activite[var] > 1e100:
+                # Remise à l'échelle pour éviter le dépassement ; l'ordre relatif est conservé
+                for v in range(1, len(activite)):
+                    activite[v] *= 1e-100
+                self.increment *= 1e-100
+            if self.position[var] >= 0:
+                self._monter(self.position[var])
+
+    def decay(self):
+        self.increment *= self.facteur
+
+
+# Heuristiques disponibles, sélectionnables par leur nom
+HEURISTIQUES = {
+    'dlis': DLIS,
+    'statique': Statique,
+    'vsids': VSIDS,
+}
+
+
+def creer_heuristique(nom):
+    """Retourne une nouvelle instance de l'heuristique nommée"""
+    if nom not in HEURISTIQUES:
+        raise ValueError(f"Heuristique inconnue: {nom} (disponibles: {', '.join(HEURISTIQUES)})")
+    return HEURISTIQUES[nom]()
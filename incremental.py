@@ -0,0 +1,203 @@
+"""
+Résolution incrémentale : une session garde sa base de clauses entre deux appels.
+On peut ajouter des clauses (add_clause) et résoudre sous hypothèses (solve(assumptions=[...])) sans
+reconstruire ni repropager la formule : les affectations de niveau 0, les clauses apprises par CDCL et les
+activités VSIDS sont conservées d'un appel à l'autre, ce qui rend les requêtes suivantes bien plus rapides.
+
+Les hypothèses sont posées comme les premières décisions de la recherche (à la manière de MiniSat) :
+les clauses apprises ne dépendent jamais d'elles et restent valables pour les appels suivants. Quand la
+formule est insatisfiable sous les hypothèses, hypotheses_echec contient celles qui suffisent à l'expliquer.
+
+Exemple :
+    session = IncrementalSolver(clauses)
+    session.solve(assumptions=[1, -3])   # Vrai ou faux, formule inchangée
+    session.add_clause([-1, 2])
+    session.solve()
+"""
+
+from CDCL import analyze, luby, restart_base
+from heuristiques import creer_heuristique
+from propagation import WatchedLiterals
+
+
+class IncrementalSolver:
+    """Session CDCL incrémentale : ajout de clauses et résolution sous hypothèses"""
+
+    def __init__(self, clauses=(), heuristique="vsids"):
+        self.clauses = []  # Clauses du problème (sans les clauses apprises), dans l'ordre d'ajout
+        self.insatisfiable = False  # Vrai dès que la formule est insatisfiable sans hypothèse : définitif
+        self.moteur = WatchedLiterals(self.clauses, 0)
+        self.branchement = None  # Créée après les clauses initiales, pour que VSIDS parte de leurs occurrences
+        for clause in clauses:
+            self.add_clause(clause)
+        self.branchement = creer_heuristique(heuristique)
+        self.branchement.initialiser(self.moteur)
+
+        self.modele = None  # Modèle trouvé par le dernier appel satisfiable
+        self.hypotheses_echec = []  # Hypothèses responsables du dernier échec (vide si la formule seule l'est)
+        # Compteurs cumulés sur toute la session
+        self.appels = 0
+        self.decisions = 0
+        self.conflits = 0
+        self.apprises = 0
+
+    def _agrandir(self, nb_vars):
+        ancien = self.moteur.nb_vars
+        if nb_vars > ancien:
+            self.moteur.agrandir(nb_vars)
+            if self.branchement is not None:
+                self.branchement.agrandir(self.moteur, ancien)
+
+    def add_clause(self, clause):
+        """
+        Ajoute une clause à la formule pour tous les appels suivants.
+        Les littéraux faux au niveau 0 sont retirés ; une clause déjà satisfaite au niveau 0 n'est pas surveillée.
+        """
+        clause = list(dict.fromkeys(clause))  # Sans doublons, ordre conservé
+        if any(-lit in clause for lit in clause):
+            return  # Tautologie
+        self.clauses.append(clause)
+        if self.insatisfiable:
+            return
+        moteur = self.moteur
+        self._agrandir(max((abs(lit) for lit in clause), default=0))
+        moteur.backtrack(0)
+
+        if any(moteur.value(lit) == 1 for lit in clause):
+            return
+        restants = [lit for lit in clause if moteur.value(lit) == 0]
+        if not restants:
+            self.insatisfiable = True
+            return
+        moteur.add_clause(restants)
+
+    def _hypotheses_en_echec(self, p):
+        """
+        Hypothèse p trouvée fausse : remonte les raisons de ¬p sur le trail jusqu'aux décisions,
+        qui sont toutes des hypothèses. Retourne p et les hypothèses qui impliquent ¬p.
+        """
+        moteur = self.moteur
+        echec = [p]
+        if moteur.level[abs(p)] == 0:
+            return echec
+        vus = {abs(p)}
+        for lit in reversed(moteur.trail[moteur.trail_lim[0]:]):
+            var = abs(lit)
+            if var not in vus:
+                continue
+            raison = moteur.reason[var]
+            if raison is None:
+                echec.append(lit)
+            else:
+                for q in moteur.clauses[raison]:
+                    if moteur.level[abs(q)] > 0:
+                        vus.add(abs(q))
+        return echec
+
+    def solve(self, assumptions=()):
+        """
+        Retourne vrai si la formule est satisfiable avec les littéraux de assumptions supposés vrais.
+        En cas de succès, modele contient une affectation de toutes les variables ; sinon hypotheses_echec
+        contient un sous-ensemble des hypothèses incompatible avec la formule (vide si la formule seule l'est).
+        """
+        self.appels += 1
+        self.modele = None
+        self.hypotheses_echec = []
+        if self.insatisfiable:
+            return False
+
+        assumptions = list(assumptions)
+        self._agrandir(max((abs(lit) for lit in assumptions), default=0))
+        moteur = self.moteur
+        branchement = self.branchement
+        moteur.backtrack(0)
+
+        nb_restarts = 1
+        limite = restart_base * luby(nb_restarts)
+        conflits_depuis_restart = 0
+
+        try:
+            while True:
+                conflit = moteur.propagate()
+                if conflit is not None:
+                    self.conflits += 1
+                    if moteur.decision_level() == 0:
+                        self.insatisfiable = True
+                        return False
+
+                    appris, niveau_retour = analyze(moteur, conflit, branchement)
+                    moteur.backtrack(niveau_retour)
+                    index = moteur.add_clause(appris)
+                    moteur.assign(appris[0], index)
+                    self.apprises += 1
+
+                    conflits_depuis_restart += 1
+                    if conflits_depuis_restart >= limite:
+                        moteur.backtrack(0)
+                        nb_restarts += 1
+                        limite = restart_base * luby(nb_restarts)
+                        conflits_depuis_restart = 0
+                    continue
+
+                # Les hypothèses sont décidées en premier, une par niveau
+                niveau = moteur.decision_level()
+                if niveau < len(assumptions):
+                    p = assumptions[niveau]
+                    valeur = moteur.value(p)
+                    if valeur == 1:
+                        moteur.nouveau_niveau()  # Déjà vraie : niveau vide pour garder la correspondance
+                    elif valeur == -1:
+                        self.hypotheses_echec = self._hypotheses_en_echec(p)
+                        return False
+                    else:
+                        moteur.decide(p)
+                    continue
+
+                literal = branchement.choisir(moteur)
+                if literal is None:
+                    self.modele = moteur.modele()
+                    return True
+
+                self.decisions += 1
+                moteur.decide(literal)
+        finally:
+            # Retour au niveau 0 : les ajouts de clauses et l'appel suivant repartent des affectations définitives
+            moteur.backtrack(0)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    import CDCL
+    from main import lire_cnf
+
+    if len(sys.argv) < 2:
+        print("Usage: python incremental.py FICHIER.cnf [REQUETES]")
+        sys.exit(2)
+    clauses = lire_cnf(sys.argv[1])
+    nb_requetes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    nb_vars = max(abs(l) for c in clauses for l in c)
+    rng = random.Random(0)
+    requetes = [[v if rng.random() < 0.5 else -v for v in rng.sample(range(1, nb_vars + 1), 3)]
+                for _ in range(nb_requetes)]
+
+    session = IncrementalSolver(clauses)
+    debut = time.perf_counter()
+    session.solve()
+    print(f"Premier appel: {time.perf_counter() - debut:.6f} s")
+
+    debut = time.perf_counter()
+    resultats = [session.solve(h) for h in requetes]
+    incremental = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    references = [CDCL.CDCL(clauses + [[lit] for lit in h]) for h in requetes]
+    complet = time.perf_counter() - debut
+
+    print(f"{nb_requetes} requêtes sous hypothèses: {incremental:.6f} s en session, "
+          f"{complet:.6f} s en repartant de zéro ({sum(resultats)} satisfiables)")
+    if resultats != references:
+        print("Erreur: résultats différents de CDCL")
+        sys.exit(1)
@@ -0,0 +1,230 @@
+"""
+Instrumentation des solveurs : compteurs d'événements, temps cumulés par règle et abonnements.
+Rien n'est instrumenté par défaut. Le bloc with instrumenter() rend un objet Mesures courant dans le contexte
+d'exécution (contextvars) : chaque solveur qui démarre une résolution dans ce contexte consulte courantes()
+une fois et, s'il y a des mesures, remplace pour cette résolution ses propres fonctions de règles (un espace
+de règles enveloppé) et les méthodes de ses objets (formule indexée, moteur à littéraux surveillés) par des
+enveloppes qui comptent et chronomètrent. Aucun module ni aucune classe n'est modifié : deux threads ou deux
+solveurs peuvent être mesurés séparément, ou l'un sans l'autre. Désactivée, l'instrumentation ne coûte
+qu'une lecture de variable de contexte par résolution.
+
+Compteurs : appels de chaque fonction mesurée, « regle_k.declenchements » quand une règle modifie la formule,
+propagations, decisions, conflits, cache.hits et cache.misses.
+Un abonné (Mesures.abonner) est appelé avec (nom, valeur) à chaque compteur incrémenté (valeur entière) et
+à chaque temps mesuré (valeur en secondes, nom suffixé par « .temps ») : un profileur externe peut s'y brancher.
+"""
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_courantes = ContextVar("instrumentation", default=None)
+
+
+def courantes():
+    """Retourne les mesures actives dans le contexte courant, ou None si l'instrumentation est désactivée"""
+    return _courantes.get()
+
+
+class _Regles:
+    """Espace de règles d'un solveur dont certaines fonctions sont enveloppées ; les autres sont celles du module"""
+
+    def __init__(self, regles, enveloppes):
+        self._regles = regles
+        self.__dict__.update(enveloppes)
+
+    def __getattr__(self, nom):
+        return getattr(self._regles, nom)
+
+
+class Mesures:
+    """Compteurs, temps cumulés (appels imbriqués compris) et abonnés d'une session d'instrumentation"""
+
+    def __init__(self):
+        self.compteurs = Counter()
+        self.temps = defaultdict(float)  # Nom de fonction -> temps cumulé (secondes)
+        self.abonnes = []
+
+    def abonner(self, fonction):
+        """Ajoute un abonné appelé avec (nom, valeur) pour chaque compteur et chaque temps mesuré"""
+        self.abonnes.append(fonction)
+
+    def desabonner(self, fonction):
+        self.abonnes.remove(fonction)
+
+    def compter(self, nom, n=1):
+        self.compteurs[nom] += n
+        for abonne in self.abonnes:
+            abonne(nom, n)
+
+    def _chronometrer(self, nom, duree):
+        self.temps[nom] += duree
+        for abonne in self.abonnes:
+            abonne(nom + ".temps", duree)
+
+    def reinitialiser(self):
+        """Remet les compteurs et les temps à zéro"""
+        self.compteurs.clear()
+        self.temps.clear()
+
+    # Enveloppes
+
+    def _mesuree(self, nom, fonction):
+        """Enveloppe qui compte les appels et cumule le temps de la fonction"""
+        def enveloppe(*args, **kwargs):
+            debut = time.perf_counter()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                self._chronometrer(nom, time.perf_counter() - debut)
+                self.compter(nom)
+        return enveloppe
+
+    def _regle(self, nom, fonction):
+        """Enveloppe d'une règle de DP : compte aussi les appels où la formule change"""
+        mesuree = self._mesuree(nom, fonction)
+
+        def enveloppe(formule, *args):
+            taille = len(formule)
+            result = mesuree(formule, *args)
+            # Sur masques de bits ou matrice, une règle qui ne change rien retourne la formule elle-même
+            if result is not formule and (len(result) != taille or not isinstance(result, list)
+                                          or result != formule):
+                self.compter(nom + ".declenchements")
+            return result
+        return enveloppe
+
+    def _regle_litteral(self, nom, fonction):
+        """Enveloppe de la règle 2 ou 3 sur masques ou matrice : elle retourne (formule, littéral appliqué ou 0)"""
+        mesuree = self._mesuree(nom, fonction)
+
+        def enveloppe(formule):
+            result = mesuree(formule)
+            if result[1]:
+                self.compter(nom + ".declenchements")
+            return result
+        return enveloppe
+
+    def _regle_indexee(self, nom, methode):
+        """Enveloppe d'une règle de FormuleIndexee : elle signale elle-même si la formule a changé"""
+        mesuree = self._mesuree(nom, methode)
+
+        def enveloppe():
+            result = mesuree()
+            if result:
+                self.compter(nom + ".declenchements")
+            return result
+        return enveloppe
+
+    def _propagation_dpll(self, fonction):
+        """Enveloppe de unit_propagation : compte les littéraux propagés et les contradictions"""
+        mesuree = self._mesuree("unit_propagation", fonction)
+
+        def enveloppe(clauses, affectes=None):
+            liste = [] if affectes is None else affectes
+            avant = len(liste)
+            result, contradiction = mesuree(clauses, liste)
+            self.compter("propagations", len(liste) - avant)
+            if contradiction:
+                self.compter("conflits")
+            return result, contradiction
+        return enveloppe
+
+    def _choix_dpll(self, fonction):
+        mesuree = self._mesuree("choose_literal", fonction)
+
+        def enveloppe(clauses):
+            self.compter("decisions")
+            return mesuree(clauses)
+        return enveloppe
+
+    def regles(self, regles):
+        """
+        Retourne l'espace de règles mesuré d'un module de règles (DP_optimised, DPLL, bitset, DP_numpy) :
+        règles de DP, étapes de DPLL et clé de cache, selon celles que le module définit.
+        """
+        enveloppes = {}
+        for nom in ("regle_1", "regle_4"):
+            if hasattr(regles, nom):
+                enveloppes[nom] = self._regle(nom, getattr(regles, nom))
+        for nom in ("regle_2", "regle_3"):
+            if hasattr(regles, nom):
+                enveloppes[nom] = self._regle_litteral(nom, getattr(regles, nom))
+        for nom in ("regle_5", "pure_literal_elimination"):
+            if hasattr(regles, nom):
+                enveloppes[nom] = self._mesuree(nom, getattr(regles, nom))
+        if hasattr(regles, "unit_propagation"):
+            enveloppes["unit_propagation"] = self._propagation_dpll(regles.unit_propagation)
+        if hasattr(regles, "choose_literal"):
+            enveloppes["choose_literal"] = self._choix_dpll(regles.choose_literal)
+        if hasattr(regles, "cle"):
+            enveloppes["cle"] = self._mesuree(regles.__name__ + ".cle", regles.cle)
+        return _Regles(regles, enveloppes)
+
+    def formule(self, etat):
+        """Enveloppe, sur cette instance seulement, les règles 2 à 5 d'une FormuleIndexee ; retourne etat"""
+        for nom in ("regle_2", "regle_3", "regle_4", "regle_5"):
+            setattr(etat, nom, self._regle_indexee(nom, getattr(etat, nom)))
+        return etat
+
+    def moteur(self, moteur):
+        """
+        Enveloppe, sur cette instance seulement, propagate (littéraux propagés, conflits) et decide
+        d'un WatchedLiterals ; retourne moteur
+        """
+        propagate = self._mesuree("WatchedLiterals.propagate", moteur.propagate)
+        decide = moteur.decide
+        trail = moteur.trail
+
+        def propager():
+            avant = len(trail)
+            conflit = propagate()
+            self.compter("propagations", len(trail) - avant)
+            if conflit is not None:
+                self.compter("conflits")
+            return conflit
+
+        def decider(lit):
+            self.compter("decisions")
+            return decide(lit)
+
+        moteur.propagate = propager
+        moteur.decide = decider
+        return moteur
+
+    def cache(self, cache):
+        """Ajoute les succès et les échecs d'un FormulaCache, à appeler à la fin de la résolution"""
+        self.compter("cache.hits", cache.hits)
+        self.compter("cache.misses", cache.misses)
+
+    # Résultats
+
+    def rapport(self):
+        """Retourne les compteurs et les temps cumulés sous forme de dictionnaire"""
+        return {
+            'compteurs': dict(self.compteurs),
+            'temps': dict(self.temps),
+        }
+
+    def afficher(self, prefixe=""):
+        """Affiche les compteurs puis les temps, du plus long au plus court"""
+        for nom, valeur in sorted(self.compteurs.items()):
+            print(f"{prefixe}{nom}: {valeur}")
+        for nom, duree in sorted(self.temps.items(), key=lambda x: -x[1]):
+            print(f"{prefixe}{nom}: {duree:.6f} s")
+
+
+@contextmanager
+def instrumenter(mesures=None):
+    """
+    Rend des mesures (nouvelles par défaut) courantes dans le contexte le temps d'un bloc with ;
+    retourne ces mesures. Les résolutions commencées dans le bloc sont mesurées.
+    """
+    if mesures is None:
+        mesures = Mesures()
+    jeton = _courantes.set(mesures)
+    try:
+        yield mesures
+    finally:
+        _courantes.reset(jeton)
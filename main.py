@@ -1,86 +1,225 @@
+import argparse
+import contextlib
 import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 import sys
+from functools import partial
+import multiprocessing
+from multiprocessing.connection import wait
 
 try:
     import DP_optimised
     import DPLL
+    import CDCL
+    import resolution
+    import pretraitement
+    import portfolio
+    import cube_and_conquer
+    import dimacs
+    import verification
+    import drat
+    import instrumentation
 except ImportError:
     print(
-        "Erreur: Impossible d'importer les modules. Assurez-vous que DP_optimised.py et DPLL.py sont dans le même dossier.")
+        "Erreur: Impossible d'importer les modules. Assurez-vous que DP_optimised.py, DPLL.py et CDCL.py sont dans le même dossier.")
     sys.exit(1)
 
 
 def lire_cnf(fichier):
     """
-    Lit un fichier CNF en format DIMACS et retourne une liste de listes représentant les clauses.
+    Lit un fichier CNF en format DIMACS (éventuellement compressé en .gz, .xz ou .bz2)
+    et retourne une liste de listes représentant les clauses.
     """
-    clauses = []
+    return dimacs.lire_listes(fichier)
 
-    with open(fichier, 'r') as f:
-        for ligne in f:
-            if ligne.startswith("%"):
-                break
-            if ligne.startswith('c') or ligne.startswith('p'):
-                continue
-
-            literals = list(map(int, ligne.split()))
 
-            if literals and literals[-1] == 0:
-                literals.pop()
+def afficher_stats_cache(cache):
+    """Affiche les compteurs d'un cache de mémorisation"""
+    stats = cache.stats()
+    print(f"Cache: {stats['entrees']} entrées, {stats['hits']} succès, {stats['misses']} échecs, "
+          f"{stats['evictions']} évictions")
 
-            if literals:
-                clauses.append(literals)
 
-    return clauses
+def _pretraiter(clauses, etapes):
+    """Applique le prétraitement (temps inclus dans celui du solveur) et affiche son journal"""
+    pre = pretraitement.Pretraitement(etapes)
+    clauses = pre.appliquer(clauses)
+    print("\nPrétraitement:")
+    for ligne in pre.rapport():
+        print(f"  {ligne}")
+    return pre, clauses
 
 
-def run_dp_test(clauses, name="Test"):
-    """Exécute DP sur un jeu de clauses et affiche les statistiques"""
-    # Réinitialisation des variables globales
-    DP_optimised.cpt = 0
-    DP_optimised.formula_cache = {}
+def run_dp_test(clauses, name="Test", etapes_pretraitement=None):
+    """Exécute DP sur un jeu de clauses et affiche les statistiques
+    etapes_pretraitement : étapes de pretraitement.ETAPES appliquées d'abord (temps inclus), ou None.
+    Retourne (satisfiable, appels, temps, modèle de la formule de départ ou None)."""
+    solveur = DP_optimised.DPSolver()
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        result = DP_optimised.DP(clauses)
-        end_time = time.time()
+        if etapes_pretraitement:
+            pre, clauses = _pretraiter(clauses, etapes_pretraitement)
+        result = solveur.solve(clauses)
+        modele = solveur.modele
+        if etapes_pretraitement and result:
+            modele = pre.reconstruire(modele)
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         print(f"\n--- Résultats {name} ---")
         print(f"Satisfiable: {result}")
-        print(f"Nombre d'appels: {DP_optimised.cpt}")
+        print(f"Nombre d'appels: {solveur.cpt}")
+        afficher_stats_cache(solveur.cache)
         print(f"Temps d'exécution: {execution_time:.6f} secondes")
 
-        return result, DP_optimised.cpt, execution_time
+        return result, solveur.cpt, execution_time, modele
     except Exception as e:
         print(f"Erreur lors du test de {name}: {e}")
-        return None, 0, 0
+        return None, 0, 0, None
 
 
-def run_dpll_test(clauses, name="Test"):
-    """Exécute DPLL sur un jeu de clauses et affiche les statistiques"""
-    # Réinitialisation des variables globales
-    DPLL.dpll_cpt = 0
-    DPLL.dpll_cache = {}
+def run_dpll_test(clauses, name="Test", iteratif=False, heuristique="dlis", bve=False, preuve=None,
+                  etapes_pretraitement=None):
+    """Exécute DPLL (récursif, ou itératif sur trail si iteratif=True) sur un jeu de clauses et affiche les statistiques
+    L'heuristique de branchement ne s'applique qu'à la version itérative.
+    Avec bve=True, la formule est d'abord réduite par élimination de variables bornée (temps inclus).
+    etapes_pretraitement : étapes de pretraitement.ETAPES appliquées d'abord (temps inclus), ou None.
+    preuve : drat.DratWriter recevant la preuve DRAT d'une réponse UNSAT.
+    Retourne (satisfiable, appels, temps, modèle de la formule de départ ou None)."""
+    solveur = DPLL.DPLLSolver(preuve=preuve)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        result = DPLL.DPLL(clauses)
-        end_time = time.time()
+        if etapes_pretraitement:
+            pre, clauses = _pretraiter(clauses, etapes_pretraitement)
+        if bve:
+            nb_clauses = len(clauses)
+            clauses, pile = resolution.bve(clauses)
+            print(f"\nBVE: {len(pile)} variables éliminées, {nb_clauses} -> {len(clauses)} clauses")
+        if iteratif:
+            result = solveur.solve_iteratif(clauses, heuristique)
+        else:
+            result = solveur.solve(clauses)
+        modele = solveur.modele
+        if bve and result:
+            valeurs = resolution.reconstruire_modele({abs(lit): lit > 0 for lit in modele}, pile)
+            modele = [var if vrai else -var for var, vrai in sorted(valeurs.items())]
+        if etapes_pretraitement and result:
+            modele = pre.reconstruire(modele)
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         print(f"\n--- Résultats DPLL {name} ---")
         print(f"Satisfiable: {result}")
-        print(f"Nombre d'appels: {DPLL.dpll_cpt}")
+        print(f"Nombre d'appels: {solveur.cpt}")
+        if not iteratif:
+            afficher_stats_cache(solveur.cache)
+        print(f"Temps d'exécution: {execution_time:.6f} secondes")
+
+        return result, solveur.cpt, execution_time, modele
+    except Exception as e:
+        print(f"Erreur lors du test de {name}: {e}")
+        return None, 0, 0, None
+
+
+def run_resolution_test(clauses, name="Test", croissance_max=10):
+    """Exécute DP par résolution (élimination de variables) sur un jeu de clauses et affiche les statistiques
+    Retourne (satisfiable, éliminations et divisions, temps, modèle ou None)."""
+    solveur = resolution.ResolutionSolver(croissance_max)
+
+    start_time = time.perf_counter()
+    try:
+        result = solveur.solve(clauses)
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+
+        print(f"\n--- Résultats DP par résolution {name} ---")
+        print(f"Satisfiable: {result}")
+        print(f"Nombre d'éliminations et de divisions: {solveur.cpt}")
+        print(f"Temps d'exécution: {execution_time:.6f} secondes")
+
+        return result, solveur.cpt, execution_time, solveur.modele
+    except Exception as e:
+        print(f"Erreur lors du test de {name}: {e}")
+        return None, 0, 0, None
+
+
+def run_cdcl_test(clauses, name="Test", heuristique="vsids", preuve=None):
+    """Exécute CDCL sur un jeu de clauses avec l'heuristique de branchement donnée et affiche les statistiques
+    preuve : drat.DratWriter recevant la preuve DRAT d'une réponse UNSAT.
+    Retourne (satisfiable, décisions, temps, modèle ou None)."""
+    solveur = CDCL.CDCLSolver(heuristique, preuve)
+
+    start_time = time.perf_counter()
+    try:
+        result = solveur.solve(clauses)
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+
+        print(f"\n--- Résultats CDCL {name} ---")
+        print(f"Satisfiable: {result}")
+        print(f"Nombre de décisions: {solveur.cpt}")
+        print(f"Nombre de conflits: {solveur.conflits}")
+        print(f"Temps d'exécution: {execution_time:.6f} secondes")
+
+        return result, solveur.cpt, execution_time, solveur.modele
+    except Exception as e:
+        print(f"Erreur lors du test de {name}: {e}")
+        return None, 0, 0, None
+
+
+def run_portfolio_test(clauses, name="Test", configurations=None, timeout=None):
+    """Exécute plusieurs configurations de solveurs en parallèle (mode portfolio) et affiche la gagnante"""
+    try:
+        result, gagnant, appels, execution_time, modele = portfolio.portfolio(clauses, configurations, timeout)
+
+        print(f"\n--- Résultats portfolio {name} ---")
+        print(f"Satisfiable: {result}")
+        print(f"Configuration gagnante: {gagnant}")
+        print(f"Nombre d'appels: {appels}")
         print(f"Temps d'exécution: {execution_time:.6f} secondes")
 
-        return result, DPLL.dpll_cpt, execution_time
+        return result, appels, execution_time, modele
     except Exception as e:
         print(f"Erreur lors du test de {name}: {e}")
-        return None, 0, 0
+        return None, 0, 0, None
+
 
+def run_cube_test(clauses, name="Test", k=None, nb_workers=None, timeout=None):
+    """Exécute DPLL en cube-and-conquer (cubes répartis entre plusieurs processus) et affiche les statistiques"""
+    start_time = time.perf_counter()
+    try:
+        result, appels, traites, nb_cubes, modele = cube_and_conquer.cube_and_conquer(clauses, k, nb_workers,
+                                                                                       timeout)
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+
+        print(f"\n--- Résultats cube-and-conquer {name} ---")
+        print(f"Satisfiable: {result}")
+        print(f"Cubes traités: {traites}/{nb_cubes}")
+        print(f"Nombre d'appels: {appels}")
+        print(f"Temps d'exécution: {execution_time:.6f} secondes")
+
+        return result, appels, execution_time, modele
+    except Exception as e:
+        print(f"Erreur lors du test de {name}: {e}")
+        return None, 0, 0, None
+
+
+# Solveurs disponibles : nom -> fonction de test retournant (satisfiable, appels, temps, modèle ou None)
+SOLVEURS = {
+    'DP': run_dp_test,
+    'DPLL': run_dpll_test,
+    'CDCL': run_cdcl_test,
+    'DPR': run_resolution_test,
+    'BVE+DPLL': partial(run_dpll_test, bve=True),
+    'PRE+DP': partial(run_dp_test, etapes_pretraitement=pretraitement.ETAPES_DEFAUT),
+    'PRE+DPLL': partial(run_dpll_test, etapes_pretraitement=pretraitement.ETAPES_DEFAUT),
+    'PORTFOLIO': run_portfolio_test,
+    'CUBE': run_cube_test,
+}
 
 def scanner_dossier(dossier="uf_files"):
     """Scanne le dossier spécifié et retourne la liste des fichiers CNF."""
@@ -99,10 +238,11 @@ def afficher_menu(fichiers):
     for i, fichier in enumerate(fichiers, 1):
         print(f"{i}. {fichier}")
     print(f"{len(fichiers) + 1}. Tester tous les fichiers sauf uuf150-01.cnf")
-    print(f"{len(fichiers) + 2}. Quitter")
+    print(f"{len(fichiers) + 2}. Tester tous les fichiers en parallèle (un processus par cœur)")
+    print(f"{len(fichiers) + 3}. Quitter")
 
     choix = -1
-    while choix < 0 or choix > len(fichiers) + 1:
+    while choix < 0 or choix > len(fichiers) + 3:
         try:
             choix = int(input("\nEntrez votre choix: "))
         except ValueError:
@@ -111,8 +251,8 @@ def afficher_menu(fichiers):
     return choix
 
 
-def executer_test(fichier, dossier="uf_files"):
-    """Exécute les tests DP et DPLL sur un fichier spécifique."""
+def executer_test(fichier, dossier="uf_files", solveurs=("DP", "DPLL", "CDCL")):
+    """Exécute les solveurs demandés (clés de SOLVEURS) sur un fichier spécifique."""
     chemin_fichier = os.path.join(dossier, fichier)
     print(f"\n===== Test de {fichier} =====")
 
@@ -120,69 +260,342 @@ def executer_test(fichier, dossier="uf_files"):
         clauses = lire_cnf(chemin_fichier)
         print(f"Nombre de clauses: {len(clauses)}")
 
-        # Test avec DP optimisé
-        dp_result, dp_calls, dp_time = run_dp_test(clauses, f"{fichier} DP")
-
-        # Test avec DPLL
-        dpll_result, dpll_calls, dpll_time = run_dpll_test(clauses, f"{fichier} DPLL")
-
-        return {
-            'fichier': fichier,
-            'satisfiable_dp': dp_result,
-            'satisfiable_dpll': dpll_result,
-            'appels_dp': dp_calls,
-            'appels_dpll': dpll_calls,
-            'temps_dp': dp_time,
-            'temps_dpll': dpll_time
-        }
+        resultat = {'fichier': fichier}
+        for solveur in solveurs:
+            result, calls, duree, _ = SOLVEURS[solveur](clauses, f"{fichier} {solveur}")
+            suffixe = solveur.lower()
+            resultat[f'satisfiable_{suffixe}'] = result
+            resultat[f'appels_{suffixe}'] = calls
+            resultat[f'temps_{suffixe}'] = duree
+
+        return resultat
     except Exception as e:
         print(f"Erreur lors du test de {fichier}: {e}")
         return None
 
 
+def _executer_job(conn, chemin_fichier, solveur):
+    """Processus fils d'un lot : exécute un solveur sur un fichier et renvoie (satisfiable, appels, temps, modèle)"""
+    # Les sorties des processus parallèles s'entremêleraient : seul le processus principal affiche
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        clauses = lire_cnf(chemin_fichier)
+        conn.send(SOLVEURS[solveur](clauses, solveur))
+    except Exception:
+        conn.send((None, 0, 0, None))
+    finally:
+        conn.close()
+
+
+def executer_lot(fichiers, dossier="uf_files", solveurs=("DP", "DPLL", "CDCL"), nb_workers=None, timeout=None):
+    """
+    Exécute chaque couple (fichier, solveur) dans un processus séparé, au plus nb_workers à la fois
+    (par défaut un par cœur). Un travail qui dépasse timeout secondes est interrompu : son résultat vaut None.
+    Retourne la liste des résultats par fichier, au même format que executer_test.
+    """
+    nb_workers = nb_workers or os.cpu_count() or 1
+    travaux = deque((fichier, solveur) for fichier in fichiers for solveur in solveurs)
+    total = len(travaux)
+    resultats = {fichier: {'fichier': fichier} for fichier in fichiers}
+    en_cours = {}  # Connexion -> (processus, fichier, solveur, échéance)
+    termines = 0
+
+    print(f"\n{total} travaux sur {nb_workers} processus" + (f", délai {timeout} s" if timeout else ""))
+
+    while travaux or en_cours:
+        # Démarrer de nouveaux travaux tant qu'il reste des processus libres
+        while travaux and len(en_cours) < nb_workers:
+            fichier, solveur = travaux.popleft()
+            lecture, ecriture = multiprocessing.Pipe(duplex=False)
+            processus = multiprocessing.Process(target=_executer_job,
+                                                args=(ecriture, os.path.join(dossier, fichier), solveur),
+                                                daemon=True)
+            processus.start()
+            ecriture.close()
+            echeance = time.perf_counter() + timeout if timeout else None
+            en_cours[lecture] = (processus, fichier, solveur, echeance)
+
+        # Attendre qu'un travail se termine ou que la prochaine échéance soit atteinte
+        delai = None
+        if timeout:
+            delai = max(0.0, min(e[3] for e in en_cours.values()) - time.perf_counter())
+        prets = wait(list(en_cours), delai)
+
+        maintenant = time.perf_counter()
+        for lecture in list(en_cours):
+            processus, fichier, solveur, echeance = en_cours[lecture]
+            if lecture in prets:
+                try:
+                    result, calls, duree, _ = lecture.recv()
+                except EOFError:
+                    # Le processus s'est arrêté sans répondre (mémoire, signal...)
+                    result, calls, duree = None, 0, 0
+                processus.join()
+                statut = str(result)
+            elif echeance is not None and maintenant >= echeance:
+                processus.kill()
+                processus.join()
+                result, calls, duree = None, 0, timeout
+                statut = "délai dépassé"
+            else:
+                continue
+
+            lecture.close()
+            del en_cours[lecture]
+            suffixe = solveur.lower()
+            resultats[fichier][f'satisfiable_{suffixe}'] = result
+            resultats[fichier][f'appels_{suffixe}'] = calls
+            resultats[fichier][f'temps_{suffixe}'] = duree
+            termines += 1
+            print(f"[{termines}/{total}] {fichier} {solveur}: {statut} ({duree:.3f} s)")
+
+    return [resultats[fichier] for fichier in fichiers]
+
+
 def afficher_recap(resultats):
     """Affiche un récapitulatif des résultats des tests."""
+    resultats = [res for res in resultats if res]
     if not resultats:
         print("\nAucun résultat à afficher.")
         return
 
-    print("\n===== RÉCAPITULATIF DES TESTS =====")
-    print(
-        f"{'Fichier':<15} {'Satisfiable (DP)':<20} {'Satisfiable (DPLL)':<20} {'Appels DP':<15} {'Appels DPLL':<15} {'Temps DP (s)':<15} {'Temps DPLL (s)':<15}")
-    print("-" * 115)
+    # Solveurs présents dans les résultats, dans l'ordre de SOLVEURS
+    solveurs = [s for s in SOLVEURS if f'satisfiable_{s.lower()}' in resultats[0]]
+    # Largeur des colonnes : 20 et 15 caractères, élargies si le nom du solveur est long
+    col_sat = {s: max(20, len(f'Satisfiable ({s})') + 1) for s in solveurs}
+    col_appels = {s: max(15, len(f'Appels {s}') + 1) for s in solveurs}
+    col_temps = {s: max(15, len(f'Temps {s} (s)') + 1) for s in solveurs}
+    largeur = 15 + sum(col_sat[s] + col_appels[s] + col_temps[s] + 3 for s in solveurs)
 
-    total_dp_time = 0
-    total_dpll_time = 0
-    total_dp_calls = 0
-    total_dpll_calls = 0
+    print("\n===== RÉCAPITULATIF DES TESTS =====")
+    entete = f"{'Fichier':<15}"
+    for s in solveurs:
+        entete += f" {f'Satisfiable ({s})':<{col_sat[s]}}"
+    for s in solveurs:
+        entete += f" {f'Appels {s}':<{col_appels[s]}}"
+    for s in solveurs:
+        entete += f" {f'Temps {s} (s)':<{col_temps[s]}}"
+    print(entete)
+    print("-" * largeur)
+
+    total_temps = defaultdict(float)
+    total_appels = defaultdict(int)
 
     for res in resultats:
-        if res:
-            # Format corrigé
-            print(
-                f"{res['fichier']:<15} {str(res['satisfiable_dp']):<20} {str(res['satisfiable_dpll']):<20} {res['appels_dp']:<15} {res['appels_dpll']:<15} {res['temps_dp']:.6f} {res['temps_dpll']:.6f}")
-            total_dp_time += res['temps_dp']
-            total_dpll_time += res['temps_dpll']
-            total_dp_calls += res['appels_dp']
-            total_dpll_calls += res['appels_dpll']
-
-    print("-" * 115)
-    # Format corrigé
-    print(
-        f"{'TOTAL':<15} {'':<20} {'':<20} {total_dp_calls:<15} {total_dpll_calls:<15} {total_dp_time:.6f} {total_dpll_time:.6f}")
-
-    # Comparaison des performances
+        ligne = f"{res['fichier']:<15}"
+        for s in solveurs:
+            ligne += f" {str(res[f'satisfiable_{s.lower()}']):<{col_sat[s]}}"
+        for s in solveurs:
+            ligne += f" {res[f'appels_{s.lower()}']:<{col_appels[s]}}"
+        for s in solveurs:
+            ligne += f" {res[f'temps_{s.lower()}']:<{col_temps[s]}.6f}"
+        print(ligne)
+        for s in solveurs:
+            total_temps[s] += res[f'temps_{s.lower()}']
+            total_appels[s] += res[f'appels_{s.lower()}']
+
+    print("-" * largeur)
+    ligne = f"{'TOTAL':<15}"
+    for s in solveurs:
+        ligne += f" {'':<{col_sat[s]}}"
+    for s in solveurs:
+        ligne += f" {total_appels[s]:<{col_appels[s]}}"
+    for s in solveurs:
+        ligne += f" {total_temps[s]:<{col_temps[s]}.6f}"
+    print(ligne)
+
+    # Comparaison des performances par rapport au premier solveur
+    if len(solveurs) < 2:
+        return
+    reference = solveurs[0]
     print("\n===== COMPARAISON DES PERFORMANCES =====")
-    if total_dp_time > 0 and total_dpll_time > 0:
-        ratio_temps = total_dpll_time / total_dp_time
-        print(f"Ratio temps DPLL/DP: {ratio_temps:.2f} ({'plus rapide' if ratio_temps < 1 else 'plus lent'})")
+    for s in solveurs[1:]:
+        if total_temps[reference] > 0 and total_temps[s] > 0:
+            ratio_temps = total_temps[s] / total_temps[reference]
+            qualificatif = "plus rapide" if ratio_temps < 1 else "plus lent"
+            print(f"Ratio temps {s}/{reference}: {ratio_temps:.2f} ({qualificatif})")
+
+        if total_appels[reference] > 0 and total_appels[s] > 0:
+            ratio_appels = total_appels[s] / total_appels[reference]
+            qualificatif = "moins d'appels" if ratio_appels < 1 else "plus d'appels"
+            print(f"Ratio appels {s}/{reference}: {ratio_appels:.2f} ({qualificatif})")
+
+
+# Solveurs qui peuvent écrire une preuve DRAT de leurs réponses UNSAT (leur fonction de test accepte preuve=)
+PREUVES = ('DPLL', 'CDCL')
+
+# Solveurs parallèles : les seuls dont on peut choisir le nombre de processus (threads)
+PARALLELES = ('CUBE', 'PORTFOLIO')
+
 
-    if total_dp_calls > 0 and total_dpll_calls > 0:
-        ratio_appels = total_dpll_calls / total_dp_calls
-        print(f"Ratio appels DPLL/DP: {ratio_appels:.2f} ({'moins d\'appels' if ratio_appels < 1 else 'plus d\'appels'})")
+def _resoudre_sequentiel(clauses, solveur, preuve=None, preuve_binaire=False, stats=False):
+    """
+    Exécute un solveur séquentiel sans affichage, en écrivant éventuellement sa preuve DRAT dans le fichier preuve.
+    Avec stats, le solveur est instrumenté et les compteurs sont affichés en lignes de commentaire « c ».
+    """
+    with contextlib.ExitStack() as pile:
+        executer = SOLVEURS[solveur]
+        if preuve:
+            executer = partial(executer, preuve=pile.enter_context(drat.DratWriter(preuve, preuve_binaire)))
+        if stats:
+            mesures = pile.enter_context(instrumentation.instrumenter())
+        nul = pile.enter_context(open(os.devnull, 'w'))
+        pile.enter_context(contextlib.redirect_stdout(nul))
+        result, calls, duree, modele = executer(clauses, solveur)
+    if stats:
+        mesures.afficher("c ")
+    return result, calls, duree, modele
+
+
+def _executer_resolution(conn, clauses, solveur, preuve, preuve_binaire, stats):
+    """Processus fils de la commande solve : renvoie (satisfiable, appels, temps, modèle)"""
+    try:
+        conn.send(_resoudre_sequentiel(clauses, solveur, preuve, preuve_binaire, stats))
+    except Exception:
+        conn.send((None, 0, 0, None))
+    finally:
+        conn.close()
+
+
+def resoudre(clauses, solveur="DPLL", timeout=None, threads=None, preuve=None, preuve_binaire=False, stats=False):
+    """
+    Résout une formule avec un solveur (clé de SOLVEURS) sans rien afficher.
+    threads : nombre de processus des solveurs de PARALLELES seulement (PORTFOLIO : les configurations
+    prioritaires, voir portfolio.PRIORITE).
+    Avec un délai, un solveur séquentiel est exécuté dans un processus fils interrompu à l'échéance.
+    preuve : fichier où écrire la preuve DRAT (solveurs de PREUVES seulement), en binaire si preuve_binaire.
+    stats : affiche les compteurs et les temps de l'instrumentation (solveurs séquentiels seulement).
+    Retourne (satisfiable ou None si inconnu, appels, temps, modèle ou None).
+    """
+    if preuve and solveur not in PREUVES:
+        raise ValueError(f"Le solveur {solveur} ne produit pas de preuve (disponibles: {', '.join(PREUVES)})")
+    if threads is not None and solveur not in PARALLELES:
+        raise ValueError(f"Le solveur {solveur} est séquentiel (threads pour: {', '.join(PARALLELES)})")
+
+    if solveur in PARALLELES:
+        # Les solveurs parallèles gèrent eux-mêmes le délai et l'arrêt de leurs processus
+        if solveur == 'CUBE':
+            executer = partial(run_cube_test, nb_workers=threads, timeout=timeout)
+        else:
+            configurations = portfolio.configurations_prioritaires(threads) if threads else None
+            executer = partial(run_portfolio_test, configurations=configurations, timeout=timeout)
+        with open(os.devnull, 'w') as nul, contextlib.redirect_stdout(nul):
+            return executer(clauses, solveur)
+
+    if timeout is None:
+        return _resoudre_sequentiel(clauses, solveur, preuve, preuve_binaire, stats)
+
+    lecture, ecriture = multiprocessing.Pipe(duplex=False)
+    processus = multiprocessing.Process(target=_executer_resolution,
+                                        args=(ecriture, clauses, solveur, preuve, preuve_binaire, stats),
+                                        daemon=True)
+    processus.start()
+    ecriture.close()
+    try:
+        if wait([lecture], timeout):
+            try:
+                return lecture.recv()
+            except EOFError:
+                return None, 0, 0, None
+        return None, 0, timeout, None
+    finally:
+        processus.kill()
+        processus.join()
+        lecture.close()
+
+
+def afficher_solution(result, modele=None, largeur=20):
+    """Affiche le résultat au format standard des compétitions SAT (lignes s et v)"""
+    if result is None:
+        print("s UNKNOWN")
+        return
+    if not result:
+        print("s UNSATISFIABLE")
+        return
+    print("s SATISFIABLE")
+    if modele is not None:
+        for i in range(0, len(modele), largeur):
+            print("v " + " ".join(map(str, modele[i:i + largeur])))
+        print("v 0")
+
+
+# Codes de sortie standard des solveurs SAT
+CODE_SAT = 10
+CODE_UNSAT = 20
+CODE_INCONNU = 0
+
+
+def commande_solve(options):
+    """Commande solve : résout un fichier et affiche le résultat au format DIMACS ; retourne le code de sortie"""
+    solveur = options.solver.upper()
+    if options.proof and solveur not in PREUVES:
+        print(f"Erreur: le solveur {options.solver} ne produit pas de preuve (disponibles: "
+              f"{', '.join(nom.lower() for nom in PREUVES)})", file=sys.stderr)
+        return 1
+    if options.threads is not None and solveur not in PARALLELES:
+        print(f"Erreur: le solveur {options.solver} est séquentiel, --threads ne s'applique qu'à "
+              f"{', '.join(nom.lower() for nom in PARALLELES)}", file=sys.stderr)
+        return 1
+    if options.threads is not None and options.threads < 1:
+        print("Erreur: --threads doit être au moins 1", file=sys.stderr)
+        return 1
+    clauses = lire_cnf(options.fichier)
+    result, calls, duree, modele = resoudre(clauses, solveur, options.timeout, options.threads,
+                                            options.proof, options.binary_proof, options.stats)
+    print(f"c solveur {solveur}, {len(clauses)} clauses, {calls} appels, {duree:.6f} secondes")
+    if modele is not None:
+        if not verification.verifier(clauses, modele):
+            print("c erreur: le modèle ne satisfait pas la formule")
+            result, modele = None, None
+        else:
+            nb_vars = max((abs(l) for c in clauses for l in c), default=0)
+            modele = verification.completer_modele(modele, nb_vars)
+    afficher_solution(result, modele)
+    if result is None:
+        return CODE_INCONNU
+    return CODE_SAT if result else CODE_UNSAT
+
+
+def commande_bench(options):
+    """Commande bench : banc d'essai non interactif (voir benchmark.py)"""
+    import benchmark
+    return benchmark.lancer(options)
+
+
+def creer_parseur():
+    """Parseur de la ligne de commande : sous-commandes solve et bench"""
+    parseur = argparse.ArgumentParser(description="Solveurs SAT DP, DPLL et CDCL")
+    sous_commandes = parseur.add_subparsers(dest="commande", required=True)
+
+    solve = sous_commandes.add_parser("solve", help="résoudre un fichier CNF (codes de sortie 10 SAT, 20 UNSAT)")
+    solve.add_argument("fichier", help="fichier DIMACS CNF, éventuellement compressé")
+    solve.add_argument("--solver", default="dpll", type=str.lower, choices=[nom.lower() for nom in SOLVEURS],
+                       help="solveur à utiliser (dpll par défaut)")
+    solve.add_argument("--timeout", type=float, help="délai maximal en secondes (résultat UNKNOWN au-delà)")
+    solve.add_argument("--threads", type=int, help="nombre de processus des solveurs cube et portfolio")
+    solve.add_argument("--proof", metavar="FICHIER", help="écrire la preuve DRAT d'une réponse UNSAT (dpll, cdcl)")
+    solve.add_argument("--binary-proof", action="store_true", help="preuve DRAT au format binaire")
+    solve.add_argument("--stats", action="store_true",
+                       help="afficher compteurs et temps par règle (lignes « c », solveurs séquentiels)")
+    solve.set_defaults(executer=commande_solve)
+
+    import benchmark
+    bench = sous_commandes.add_parser("bench", help="banc d'essai d'un dossier de fichiers CNF")
+    benchmark.creer_parseur(bench)
+    bench.set_defaults(executer=commande_bench)
+    return parseur
+
+
+# Délai maximal (en secondes) d'un travail du mode parallèle
+TIMEOUT_LOT = 3600
 
 
 def main():
+    # Avec des arguments, pas de menu interactif : sous-commandes solve et bench
+    if len(sys.argv) > 1:
+        options = creer_parseur().parse_args()
+        sys.exit(options.executer(options))
+
     # Scanner le dossier pour trouver les fichiers CNF
     fichiers = scanner_dossier()
 
@@ -215,6 +628,11 @@ def main():
                         resultats.append(resultat)
             afficher_recap(resultats)
         elif choix == len(fichiers) + 2:
+            # Tester tous les fichiers en parallèle
+            print("\nTest de tous les fichiers en parallèle...")
+            resultats = executer_lot(fichiers, timeout=TIMEOUT_LOT)
+            afficher_recap(resultats)
+        elif choix == len(fichiers) + 3:
             # Quitter
             print("\nAu revoir!")
             break
@@ -0,0 +1,130 @@
+"""
+Mode portfolio : plusieurs configurations de solveurs sont lancées en parallèle, chacune dans son propre
+processus, sur la même formule. Le premier résultat obtenu est retenu et les autres processus sont arrêtés.
+Sur une instance difficile, on ne sait pas à l'avance quel solveur ou quelle heuristique de branchement
+terminera le premier : le portfolio prend le temps du meilleur, au prix d'un cœur par configuration.
+"""
+
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+import CDCL
+import DP_optimised
+import DPLL
+
+
+def _dp(clauses):
+    solveur = DP_optimised.DPSolver()
+    result = solveur.solve(clauses)
+    return result, solveur.cpt, solveur.modele if result else None
+
+
+def _dpll(clauses):
+    solveur = DPLL.DPLLSolver()
+    result = solveur.solve(clauses)
+    return result, solveur.cpt, solveur.modele if result else None
+
+
+def _dpll_iteratif(heuristique):
+    def executer(clauses):
+        solveur = DPLL.DPLLSolver()
+        result = solveur.solve_iteratif(clauses, heuristique)
+        return result, solveur.cpt, solveur.modele if result else None
+    return executer
+
+
+def _cdcl(clauses):
+    solveur = CDCL.CDCLSolver()
+    result = solveur.solve(clauses)
+    return result, solveur.cpt, solveur.modele if result else None
+
+
+# Configurations disponibles : nom -> fonction retournant (satisfiable, appels, modèle ou None)
+CONFIGURATIONS = {
+    'DP': _dp,
+    'DPLL': _dpll,
+    'DPLL-dlis': _dpll_iteratif('dlis'),
+    'DPLL-statique': _dpll_iteratif('statique'),
+    'DPLL-vsids': _dpll_iteratif('vsids'),
+    'CDCL': _cdcl,
+}
+
+# Ordre de lancement quand il y a moins de processus que de configurations : les plus rapides sur uf50 et uuf50
+# d'abord (CDCL 0,03 s, DPLL-vsids et DPLL-statique 0,07 s, DPLL-dlis 0,19 s, DP 0,25 s, DPLL récursif 0,81 s)
+PRIORITE = ('CDCL', 'DPLL-vsids', 'DPLL-statique', 'DPLL-dlis', 'DP', 'DPLL')
+
+
+def configurations_prioritaires(nb_processus):
+    """Retourne les nb_processus configurations à lancer en premier, dans l'ordre de PRIORITE"""
+    if nb_processus < 1:
+        raise ValueError(f"Nombre de processus invalide: {nb_processus}")
+    return list(PRIORITE[:nb_processus])
+
+
+def _executer_configuration(conn, nom, clauses):
+    """Processus fils : exécute une configuration et envoie (satisfiable, appels, modèle) au processus principal"""
+    try:
+        conn.send(CONFIGURATIONS[nom](clauses))
+    except Exception:
+        conn.send((None, 0, None))
+    finally:
+        conn.close()
+
+
+def portfolio(clauses, configurations=None, timeout=None):
+    """
+    Lance les configurations demandées (noms de CONFIGURATIONS, toutes par défaut) en parallèle.
+    Retourne (satisfiable, configuration gagnante, appels, temps, modèle) dès qu'une configuration répond ;
+    satisfiable vaut None et la configuration gagnante None si aucune ne répond avant timeout secondes.
+    Une configuration qui échoue (exception) n'arrête pas les autres.
+    Le modèle est celui de la configuration gagnante si la formule est satisfiable, None sinon.
+    """
+    configurations = list(configurations or CONFIGURATIONS)
+    for nom in configurations:
+        if nom not in CONFIGURATIONS:
+            raise ValueError(f"Configuration inconnue: {nom} (disponibles: {', '.join(CONFIGURATIONS)})")
+
+    debut = time.perf_counter()
+    en_cours = {}  # Connexion -> (processus, nom)
+    for nom in configurations:
+        lecture, ecriture = multiprocessing.Pipe(duplex=False)
+        processus = multiprocessing.Process(target=_executer_configuration, args=(ecriture, nom, clauses),
+                                            daemon=True)
+        processus.start()
+        ecriture.close()
+        en_cours[lecture] = (processus, nom)
+
+    gagnant = (None, None, 0, None)
+    try:
+        while en_cours:
+            delai = None
+            if timeout is not None:
+                delai = debut + timeout - time.perf_counter()
+                if delai <= 0:
+                    break
+            prets = wait(list(en_cours), delai)
+            if not prets:
+                break  # Délai dépassé
+            for lecture in prets:
+                processus, nom = en_cours.pop(lecture)
+                try:
+                    result, appels, modele_configuration = lecture.recv()
+                except EOFError:
+                    result, appels, modele_configuration = None, 0, None  # Le processus s'est arrêté sans répondre
+                lecture.close()
+                processus.join()
+                if result is not None:
+                    gagnant = (result, nom, appels, modele_configuration)
+                    break
+            if gagnant[0] is not None:
+                break
+    finally:
+        # Arrêt des configurations encore en cours
+        for lecture, (processus, _) in en_cours.items():
+            processus.kill()
+            processus.join()
+            lecture.close()
+
+    result, nom, appels, modele = gagnant
+    return result, nom, appels, time.perf_counter() - debut, modele
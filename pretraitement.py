@@ -0,0 +1,223 @@
+"""
+Prétraitement de la formule avant DP ou DPLL : une suite d'étapes configurable, chacune réduisant la formule
+en une formule équisatisfiable. Les étapes disponibles (ETAPES) :
+- tautologies : ôte les clauses qui contiennent l et ¬l (règle 1 de DP) ;
+- equivalences : dans le graphe d'implications des clauses binaires (a ∨ b donne ¬a → b et ¬b → a),
+  les littéraux d'une même composante fortement connexe sont équivalents. Chacun est remplacé par le
+  représentant de sa composante (le littéral de plus petite variable) ; une composante qui contient l et ¬l
+  rend la formule insatisfiable ;
+- sondage : sondage des littéraux (failed literal probing). Si la propagation unitaire de l
+  (DPLL.unit_propagation) aboutit à une contradiction, ¬l est impliqué et affecté dans la formule.
+
+Chaque étape note sur une pile ce qu'il faut pour revenir aux variables d'origine (littéraux affectés,
+variables remplacées) : reconstruire() transforme un modèle de la formule réduite en modèle de la formule
+de départ. Le temps et la réduction du nombre de clauses de chaque étape sont gardés dans journal.
+
+Exemple :
+    pretraitement = Pretraitement(("tautologies", "sondage"))
+    clauses_reduites = pretraitement.appliquer(clauses)
+    solveur = DPLL.DPLLSolver()
+    if solveur.solve(clauses_reduites):
+        modele = pretraitement.reconstruire(solveur.modele)
+"""
+
+import time
+from collections import defaultdict
+
+import DPLL
+from DP_optimised import is_tautologie, regle_1
+
+
+def oter_tautologies(clauses, pile):
+    """Étape tautologies : règle 1 de DP, sans effet sur les modèles"""
+    return regle_1(clauses)
+
+
+def _composantes_fortes(graphe):
+    """
+    Retourne les composantes fortement connexes du graphe (littéral -> successeurs), algorithme de Tarjan
+    sans récursion : une pile explicite de (sommet, itérateur sur ses successeurs).
+    """
+    index = {}
+    bas = {}
+    pile = []
+    sur_pile = set()
+    composantes = []
+    compteur = 0
+
+    for depart in list(graphe):
+        if depart in index:
+            continue
+        index[depart] = bas[depart] = compteur
+        compteur += 1
+        pile.append(depart)
+        sur_pile.add(depart)
+        appels = [(depart, iter(graphe[depart]))]
+        while appels:
+            sommet, successeurs = appels[-1]
+            for suivant in successeurs:
+                if suivant not in index:
+                    index[suivant] = bas[suivant] = compteur
+                    compteur += 1
+                    pile.append(suivant)
+                    sur_pile.add(suivant)
+                    appels.append((suivant, iter(graphe[suivant])))
+                    break
+                if suivant in sur_pile:
+                    bas[sommet] = min(bas[sommet], index[suivant])
+            else:
+                # Tous les successeurs sont vus : sommet est la racine d'une composante si bas == index
+                appels.pop()
+                if appels:
+                    parent = appels[-1][0]
+                    bas[parent] = min(bas[parent], bas[sommet])
+                if bas[sommet] == index[sommet]:
+                    composante = []
+                    while True:
+                        lit = pile.pop()
+                        sur_pile.discard(lit)
+                        composante.append(lit)
+                        if lit == sommet:
+                            break
+                    composantes.append(composante)
+    return composantes
+
+
+def substituer_equivalences(clauses, pile):
+    """Étape equivalences : remplace les littéraux équivalents par le représentant de leur composante"""
+    graphe = defaultdict(list)
+    for clause in clauses:
+        if len(clause) == 2:
+            a, b = clause
+            graphe[-a].append(b)
+            graphe[-b].append(a)
+
+    remplacement = {}  # Variable remplacée -> littéral qui la remplace
+    for composante in _composantes_fortes(graphe):
+        if len(composante) < 2:
+            continue
+        representant = min(composante, key=abs)
+        if -representant in composante:
+            return [[]]  # l ≡ ¬l
+        # La composante miroir (les opposés) choisit ¬representant : un seul remplacement par variable suffit
+        for lit in composante:
+            if lit != representant:
+                remplacement[abs(lit)] = representant if lit > 0 else -representant
+    if not remplacement:
+        return clauses
+
+    result = []
+    vues = set()
+    for clause in clauses:
+        nouvelle = []
+        for lit in clause:
+            r = remplacement.get(abs(lit))
+            nouvelle.append(lit if r is None else (r if lit > 0 else -r))
+        nouvelle = list(dict.fromkeys(nouvelle))
+        if is_tautologie(nouvelle):
+            continue  # Par exemple la clause binaire d'où vient l'équivalence
+        cle = frozenset(nouvelle)
+        if cle in vues:
+            continue
+        vues.add(cle)
+        result.append(nouvelle)
+    pile.append(("equivalences", remplacement))
+    return result
+
+
+def sonder(clauses, pile):
+    """
+    Étape sondage : propage chaque littéral l dont l'opposé apparaît dans une clause binaire (les autres
+    ne rendent aucune clause unitaire). Si la propagation de l échoue, ¬l est affecté dans la formule.
+    """
+    affectes = []
+    clauses, contradiction = DPLL.unit_propagation(clauses, affectes)
+    if contradiction:
+        return [[]]
+
+    candidats = {}  # Littéraux à sonder, dans l'ordre de la formule
+    for clause in clauses:
+        if len(clause) == 2:
+            candidats[-clause[0]] = None
+            candidats[-clause[1]] = None
+
+    variables = {abs(lit) for lit in affectes}  # Variables déjà affectées, absentes de la formule
+    for lit in candidats:
+        if not clauses:
+            break
+        if abs(lit) in variables:
+            continue
+        _, echec = DPLL.unit_propagation(clauses + [[lit]])
+        if echec:
+            clauses, contradiction = DPLL.unit_propagation(clauses + [[-lit]], affectes)
+            if contradiction:
+                return [[]]  # l et ¬l échouent tous les deux
+            variables.update(abs(l) for l in affectes)
+    if affectes:
+        pile.append(("affectes", affectes))
+    return clauses
+
+
+# Étapes disponibles : nom -> fonction (clauses, pile de reconstruction) -> clauses réduites
+ETAPES = {
+    "tautologies": oter_tautologies,
+    "equivalences": substituer_equivalences,
+    "sondage": sonder,
+}
+
+ETAPES_DEFAUT = ("tautologies", "equivalences", "sondage")
+
+
+class Pretraitement:
+    """
+    Suite d'étapes de prétraitement (noms de ETAPES, dans l'ordre d'exécution).
+    verbose : affiche une ligne par étape (temps, nombre de clauses avant et après).
+    """
+
+    def __init__(self, etapes=ETAPES_DEFAUT, verbose=False):
+        for nom in etapes:
+            if nom not in ETAPES:
+                raise ValueError(f"Étape de prétraitement inconnue: {nom} (disponibles: {', '.join(ETAPES)})")
+        self.etapes = tuple(etapes)
+        self.verbose = verbose
+        self.pile = []  # (nature, données) de chaque transformation, pour reconstruire les modèles
+        self.journal = []  # (étape, temps en secondes, clauses avant, clauses après)
+
+    def appliquer(self, clauses):
+        """
+        Retourne la formule réduite par les étapes, [[]] si l'une d'elles prouve l'insatisfiabilité.
+        La pile et le journal sont remis à zéro : une instance sert à une formule à la fois.
+        """
+        self.pile = []
+        self.journal = []
+        for nom in self.etapes:
+            avant = len(clauses)
+            debut = time.perf_counter()
+            clauses = ETAPES[nom](clauses, self.pile)
+            self.journal.append((nom, time.perf_counter() - debut, avant, len(clauses)))
+            if self.verbose:
+                print(self.rapport()[-1])
+            if clauses == [[]]:
+                break
+        return clauses
+
+    def rapport(self):
+        """Retourne une ligne de texte par étape exécutée"""
+        return [f"{nom}: {avant} -> {apres} clauses, {duree:.6f} secondes"
+                for nom, duree, avant, apres in self.journal]
+
+    def reconstruire(self, modele):
+        """
+        Transforme un modèle (littéraux vrais) de la formule réduite en modèle de la formule de départ :
+        les affectations du sondage sont ajoutées et les variables remplacées prennent la valeur de leur
+        représentant (faux si celui-ci est libre). Les variables absentes restent libres.
+        """
+        valeurs = {abs(lit): lit > 0 for lit in modele}
+        for nature, donnees in reversed(self.pile):
+            if nature == "affectes":
+                for lit in donnees:
+                    valeurs[abs(lit)] = lit > 0
+            else:
+                for var, lit in donnees.items():
+                    valeurs[var] = valeurs.setdefault(abs(lit), False) == (lit > 0)
+        return [var if vrai else -var for var, vrai in sorted(valeurs.items())]
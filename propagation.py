@@ -0,0 +1,325 @@
+"""
+Moteur de propagation unitaire à deux littéraux surveillés (two watched literals).
+Chaque clause surveille deux de ses littéraux (positions 0 et 1) : une clause n'est visitée que lorsque
+l'un de ses littéraux surveillés devient faux, au lieu de reparcourir toute la formule à chaque affectation.
+Les affectations sont conservées dans une pile (trail) découpée en niveaux de décision, ce qui permet
+de revenir en arrière sans recopier la formule.
+"""
+
+from collections import Counter
+
+
+class WatchedLiterals:
+    """Base de clauses avec littéraux surveillés, trail d'affectations et niveaux de décision"""
+
+    def __init__(self, clauses, nb_vars=None):
+        if not isinstance(clauses, list):
+            # Les clauses d'origine sont relues à chaque comptage d'occurrences : une autre séquence
+            # (base_clauses.ClauseDB par exemple) est décodée une seule fois au lieu de l'être à chaque parcours
+            clauses = list(clauses)
+        if nb_vars is None:
+            nb_vars = max((abs(l) for c in clauses for l in c), default=0)
+        self.nb_vars = nb_vars
+        self.source = clauses  # Clauses d'origine, jamais modifiées
+        self.clauses = []  # Copies internes : l'ordre des littéraux change au fil des surveillances
+
+        # Tableaux indexés directement par le littéral : l'index négatif -l tombe dans la seconde moitié
+        # de la liste (taille 2n+1), donc l et -l ne se chevauchent jamais et aucun abs() n'est nécessaire
+        taille = 2 * nb_vars + 1
+        self.watches = [[] for _ in range(taille)]  # Littéral -> indices des clauses qui le surveillent
+        self.val = [0] * taille  # Littéral -> 1 (vrai), -1 (faux), 0 (libre)
+        self.level = [0] * (nb_vars + 1)  # Variable -> niveau de décision de son affectation
+        self.reason = [None] * (nb_vars + 1)  # Variable -> indice de la clause qui l'a impliquée
+
+        self.trail = []  # Littéraux affectés dans l'ordre
+        self.trail_lim = []  # Position du trail au début de chaque niveau de décision
+        self.qhead = 0  # Prochain littéral du trail à propager
+        self.conflict = False  # Vrai si la formule est contradictoire dès le niveau 0
+        self.unassign_hooks = []  # Fonctions appelées avec chaque littéral désaffecté lors d'un retour arrière
+
+        for clause in clauses:
+            self.add_clause(list(clause))
+
+    def modele(self):
+        """Retourne l'affectation courante sous forme de littéraux, une par variable (les variables libres à faux)"""
+        val = self.val
+        return [v if val[v] == 1 else -v for v in range(1, self.nb_vars + 1)]
+
+    def value(self, lit):
+        """Retourne 1 si le littéral est vrai, -1 s'il est faux, 0 s'il est libre"""
+        return self.val[lit]
+
+    def agrandir(self, nb_vars):
+        """Porte le nombre de variables à nb_vars (ajout de variables entre deux résolutions incrémentales)"""
+        n = self.nb_vars
+        if nb_vars <= n:
+            return
+        # Les cases des nouveaux littéraux s'insèrent au milieu : les littéraux négatifs existants,
+        # indexés depuis la fin de la liste, gardent leur place relative
+        ajout = 2 * (nb_vars - n)
+        self.val[n + 1:n + 1] = [0] * ajout
+        self.watches[n + 1:n + 1] = [[] for _ in range(ajout)]
+        self.level.extend([0] * (nb_vars - n))
+        self.reason.extend([None] * (nb_vars - n))
+        self.nb_vars = nb_vars
+
+    def decision_level(self):
+        """Retourne le niveau de décision courant"""
+        return len(self.trail_lim)
+
+    def add_clause(self, clause):
+        """
+        Ajoute une clause à la base et retourne son indice.
+        Les deux premiers littéraux sont surveillés : pour une clause apprise, l'appelant place en tête
+        le littéral à impliquer puis le littéral faux de plus haut niveau.
+        """
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        if len(clause) >= 2:
+            self.watches[clause[0]].append(index)
+            self.watches[clause[1]].append(index)
+        elif len(clause) == 1:
+            if not self.assign(clause[0], index):
+                self.conflict = True
+        else:
+            self.conflict = True
+        return index
+
+    def assign(self, lit, reason=None):
+        """
+        Affecte le littéral à vrai au niveau courant.
+        Retourne False si le littéral est déjà faux (contradiction), True sinon.
+        """
+        v = self.val[lit]
+        if v:
+            return v == 1
+        self.val[lit] = 1
+        self.val[-lit] = -1
+        var = abs(lit)
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+        return True
+
+    def nouveau_niveau(self):
+        """Ouvre un nouveau niveau de décision vide"""
+        self.trail_lim.append(len(self.trail))
+
+    def decide(self, lit):
+        """Ouvre un nouveau niveau de décision et y affecte le littéral"""
+        self.trail_lim.append(len(self.trail))
+        self.assign(lit)
+
+    def backtrack(self, level):
+        """Annule toutes les affectations faites au-delà du niveau donné"""
+        if len(self.trail_lim) <= level:
+            return
+        val = self.val
+        trail = self.trail
+        limite = self.trail_lim[level]
+        hooks = self.unassign_hooks
+        for i in range(len(trail) - 1, limite - 1, -1):
+            lit = trail[i]
+            val[lit] = 0
+            val[-lit] = 0
+            self.reason[abs(lit)] = None
+            if hooks:
+                for hook in hooks:
+                    hook(lit)
+        del trail[limite:]
+        del self.trail_lim[level:]
+        self.qhead = limite
+
+    def propagate(self):
+        """
+        Propage les littéraux du trail qui ne l'ont pas encore été.
+        Retourne l'indice de la clause en conflit, ou None si aucune contradiction n'apparaît.
+        """
+        trail = self.trail
+        val = self.val
+        watches = self.watches
+        clauses = self.clauses
+
+        while self.qhead < len(trail):
+            faux = -trail[self.qhead]
+            self.qhead += 1
+            ws = watches[faux]
+            n = len(ws)
+            i = j = 0
+            while i < n:
+                ci = ws[i]
+                i += 1
+                c = clauses[ci]
+                # Le littéral devenu faux est placé en position 1
+                if c[0] == faux:
+                    c[0] = c[1]
+                    c[1] = faux
+                autre = c[0]
+                if val[autre] == 1:
+                    ws[j] = ci
+                    j += 1
+                    continue
+
+                # Recherche d'un remplaçant non faux à surveiller
+                for k in range(2, len(c)):
+                    lit = c[k]
+                    if val[lit] != -1:
+                        c[1] = lit
+                        c[k] = faux
+                        watches[lit].append(ci)
+                        break
+                else:
+                    ws[j] = ci
+                    j += 1
+                    if val[autre] == -1:
+                        # Conflit : on garde les surveillances restantes et on vide la file
+                        while i < n:
+                            ws[j] = ws[i]
+                            i += 1
+                            j += 1
+                        del ws[j:]
+                        self.qhead = len(trail)
+                        return ci
+                    # Clause unitaire : le dernier littéral surveillé est impliqué
+                    self.assign(autre, ci)
+            del ws[j:]
+        return None
+
+    def residual(self):
+        """
+        Retourne la formule restante sous forme de liste de clauses : les clauses satisfaites sont ôtées,
+        les littéraux faux sont retirés. L'ordre des clauses et des littéraux d'origine est conservé.
+        """
+        val = self.val
+        result = []
+        for clause in self.source:
+            satisfaite = False
+            modifiee = False
+            for lit in clause:
+                v = val[lit]
+                if v == 1:
+                    satisfaite = True
+                    break
+                if v == -1:
+                    modifiee = True
+            if satisfaite:
+                continue
+            if modifiee:
+                result.append([l for l in clause if val[l] != -1])
+            else:
+                result.append(clause)
+        return result
+
+    def residual_counts(self):
+        """
+        Compte les occurrences des littéraux libres dans les clauses non satisfaites.
+        Les littéraux sont insérés dans l'ordre de la formule restante, comme dans DPLL.choose_literal.
+        Retourne None si toutes les clauses sont satisfaites.
+        """
+        val = self.val
+        counter = Counter()
+        restantes = 0
+        for clause in self.source:
+            for lit in clause:
+                if val[lit] == 1:
+                    break
+            else:
+                restantes += 1
+                for lit in clause:
+                    if val[lit] == 0:
+                        counter[lit] += 1
+        if restantes == 0:
+            return None
+        return counter
+
+
+class Occurrences:
+    """
+    Nombre d'occurrences de chaque littéral dans les clauses d'origine non satisfaites, tenu à jour
+    au fil du trail d'un WatchedLiterals au lieu d'être recompté sur toute la formule (residual_counts).
+    Quand le compte d'un littéral tombe à zéro, son opposé devient candidat littéral pur : la file des
+    candidats remplace la recherche des littéraux purs sur toute la formule.
+    Les affectations sont prises en compte par synchroniser() et les retours arrière par un unassign_hook.
+    """
+
+    def __init__(self, moteur):
+        self.moteur = moteur
+        taille = 2 * moteur.nb_vars + 1
+        self.occ = [[] for _ in range(taille)]  # Littéral -> indices des clauses d'origine qui le contiennent
+        self.compte = [0] * taille  # Littéral -> nombre de clauses non satisfaites qui le contiennent
+        self.vrais = [0] * len(moteur.source)  # Clause -> nombre de ses littéraux vrais
+        self.restantes = len(moteur.source)  # Clauses non satisfaites
+        self.traites = []  # Littéraux du trail déjà pris en compte (préfixe du trail)
+        self.candidats = []  # Littéraux peut-être purs (entrées périmées tolérées)
+
+        for i, clause in enumerate(moteur.source):
+            for lit in clause:
+                self.occ[lit].append(i)
+                self.compte[lit] += 1
+        for var in range(1, moteur.nb_vars + 1):
+            self.candidats.append(var)
+            self.candidats.append(-var)
+
+        for lit in moteur.trail:
+            self._affecter(lit)
+        moteur.unassign_hooks.append(self.liberer)
+
+    def _affecter(self, lit):
+        clauses = self.moteur.source
+        compte = self.compte
+        vrais = self.vrais
+        candidats = self.candidats
+        for i in self.occ[lit]:
+            vrais[i] += 1
+            if vrais[i] == 1:
+                self.restantes -= 1
+                for l in clauses[i]:
+                    compte[l] -= 1
+                    if compte[l] == 0:
+                        candidats.append(-l)
+        self.traites.append(lit)
+
+    def liberer(self, lit):
+        """Hook de retour arrière : défait l'affectation de lit si elle avait été prise en compte"""
+        traites = self.traites
+        if not traites or traites[-1] != lit:
+            return  # Affecté puis désaffecté sans synchronisation
+        traites.pop()
+        clauses = self.moteur.source
+        compte = self.compte
+        vrais = self.vrais
+        candidats = self.candidats
+        for i in self.occ[lit]:
+            vrais[i] -= 1
+            if vrais[i] == 0:
+                self.restantes += 1
+                for l in clauses[i]:
+                    if compte[l] == 0:
+                        candidats.append(l)  # Le littéral réapparaît : il peut redevenir pur
+                    compte[l] += 1
+        # Le littéral et son opposé redeviennent libres
+        candidats.append(lit)
+        candidats.append(-lit)
+
+    def synchroniser(self):
+        """Prend en compte les littéraux ajoutés au trail depuis le dernier appel"""
+        trail = self.moteur.trail
+        for k in range(len(self.traites), len(trail)):
+            self._affecter(trail[k])
+
+    def purs(self):
+        """
+        Retourne les littéraux purs de la formule restante : libres, présents dans une clause non satisfaite,
+        et dont l'opposé n'apparaît dans aucune. Seuls les candidats de la file sont examinés.
+        """
+        self.synchroniser()
+        val = self.moteur.val
+        compte = self.compte
+        candidats, self.candidats = self.candidats, []
+        purs = []
+        vus = set()
+        for lit in candidats:
+            if val[lit] == 0 and compte[lit] and not compte[-lit] and lit not in vus:
+                vus.add(lit)
+                purs.append(lit)
+        return purs
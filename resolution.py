@@ -0,0 +1,192 @@
+"""
+Algorithme de Davis-Putnam par élimination de variables (résolution).
+Éliminer une variable v remplace toutes les clauses contenant v ou ¬v par leurs résolvantes sur v ;
+la formule obtenue est satisfiable si et seulement si la formule de départ l'est.
+Les variables sont éliminées par coût croissant (le moins de résolvantes d'abord) et les résolvantes
+tautologiques ou subsumées par une clause existante sont ignorées. La croissance du nombre de clauses peut être bornée : c'est alors
+l'élimination de variables bornée (BVE), utilisée comme prétraitement avant DPLL.
+"""
+
+from DP_optimised import is_tautologie
+
+
+class _Formule:
+    """Ensemble de clauses (frozensets, donc sans doublons) avec listes d'occurrences par littéral"""
+
+    def __init__(self, clauses):
+        self.clauses = set()
+        self.occ = {}
+        self.vide = False  # Vrai si la clause vide a été produite
+        for clause in clauses:
+            self.ajouter(frozenset(clause))
+
+    def ajouter(self, clause):
+        if not clause:
+            self.vide = True
+            return
+        if clause in self.clauses:
+            return
+        self.clauses.add(clause)
+        for lit in clause:
+            self.occ.setdefault(lit, set()).add(clause)
+
+    def retirer(self, clause):
+        self.clauses.discard(clause)
+        for lit in clause:
+            self.occ[lit].discard(clause)
+
+    def variables(self):
+        return {abs(lit) for lit, occurrences in self.occ.items() if occurrences}
+
+    def resolvantes(self, var, limite=None):
+        """Retourne les résolvantes non tautologiques sur var, ou None s'il y en a plus que limite"""
+        result = []
+        for c in self.occ.get(var, ()):
+            reste = c - {var}
+            for d in self.occ.get(-var, ()):
+                r = reste | (d - {-var})
+                if not is_tautologie(r):
+                    result.append(frozenset(r))
+                    if limite is not None and len(result) > limite:
+                        return None
+        return result
+
+    def nb_occurrences(self, var):
+        return len(self.occ.get(var, ())) + len(self.occ.get(-var, ()))
+
+    def cout(self, var):
+        """Estimation du nombre de résolvantes de var"""
+        return len(self.occ.get(var, ())) * len(self.occ.get(-var, ()))
+
+    def eliminer(self, var, resolvantes):
+        """Remplace les clauses contenant var ou ¬var par les résolvantes ; retourne les clauses ôtées"""
+        otees = list(self.occ.get(var, ())) + list(self.occ.get(-var, ()))
+        for clause in otees:
+            self.retirer(clause)
+        for r in resolvantes:
+            if not self.subsumee(r):
+                self.ajouter(r)
+        return otees
+
+    def subsumee(self, clause):
+        """Retourne vrai si une clause de la formule est incluse dans clause"""
+        occ = self.occ
+        for lit in clause:
+            for c in occ.get(lit, ()):
+                if len(c) <= len(clause) and c <= clause:
+                    return True
+        return False
+
+
+class ResolutionSolver:
+    """
+    Solveur DP par résolution réentrant : le compteur et le modèle appartiennent à l'instance.
+    croissance_max : nombre maximal de clauses gagnées par une élimination ; si la variable la moins coûteuse
+    le dépasse, on divise les cas au lieu d'éliminer. None : aucune borne (DP pur, exponentiel en mémoire).
+    """
+
+    def __init__(self, croissance_max=None):
+        self.croissance_max = croissance_max
+        self.cpt = 0  # Nombre d'éliminations et de divisions de cas
+        self.modele = None  # Modèle (liste de littéraux) trouvé par la dernière résolution satisfiable
+
+    def solve(self, clauses):
+        """
+        Retourne vrai si la formule est satisfiable ; le compteur est remis à zéro au début.
+        En cas de succès, modele est reconstruit à partir des éliminations (voir reconstruire_modele).
+        """
+        self.cpt = 0
+        self.modele = None
+        valeurs = self._resoudre(clauses)
+        if valeurs is None:
+            return False
+        self.modele = [var if vrai else -var for var, vrai in sorted(valeurs.items())]
+        return True
+
+    def _resoudre(self, clauses):
+        """Retourne un modèle (dictionnaire variable -> booléen) de la formule, ou None si elle est insatisfiable"""
+        self.cpt += 1
+        croissance_max = self.croissance_max
+
+        formule = _Formule(clauses)
+        pile = []  # (variable, clauses ôtées) dans l'ordre d'élimination
+        while True:
+            if formule.vide:
+                return None
+            variables = formule.variables()
+            if not variables:
+                return reconstruire_modele({}, pile)
+
+            # Variable la moins coûteuse à éliminer
+            var = min(variables, key=formule.cout)
+            if croissance_max is None:
+                resolvantes = formule.resolvantes(var)
+            else:
+                resolvantes = formule.resolvantes(var, formule.nb_occurrences(var) + croissance_max)
+
+            if resolvantes is None:
+                # Élimination trop coûteuse : division de cas, comme la règle 5 de DP_optimised,
+                # sur la variable la plus fréquente pour que les deux branches se simplifient au maximum
+                var = max(variables, key=formule.nb_occurrences)
+                for lit in (var, -var):
+                    valeurs = self._resoudre([list(c - {-lit}) for c in formule.clauses if lit not in c])
+                    if valeurs is not None:
+                        valeurs[var] = lit > 0
+                        return reconstruire_modele(valeurs, pile)
+                return None
+
+            self.cpt += 1
+            pile.append((var, formule.eliminer(var, resolvantes)))
+
+
+def DP_resolution(clauses, croissance_max=None):
+    """Retourne vrai si la formule est satisfiable (DP par résolution, avec un solveur ResolutionSolver neuf)"""
+    return ResolutionSolver(croissance_max).solve(clauses)
+
+
+def bve(clauses, croissance_max=0):
+    """
+    Prétraitement par élimination de variables bornée.
+    Élimine, par coût croissant, les variables dont l'élimination n'ajoute pas plus de croissance_max clauses.
+    Retourne (clauses simplifiées, pile d'élimination) ; la pile sert à reconstruire_modele.
+    Si la clause vide est produite, les clauses retournées sont [[]].
+    """
+    formule = _Formule(clauses)
+    pile = []  # (variable, clauses ôtées) dans l'ordre d'élimination
+    candidates = formule.variables()
+
+    while candidates and not formule.vide:
+        var = min(candidates, key=formule.cout)
+        candidates.discard(var)
+        resolvantes = formule.resolvantes(var, formule.nb_occurrences(var) + croissance_max)
+        if resolvantes is None:
+            continue
+        pile.append((var, formule.eliminer(var, resolvantes)))
+        # Les voisins de var ont changé de coût : ils redeviennent candidats
+        for r in resolvantes:
+            candidates.update(abs(lit) for lit in r)
+        candidates &= formule.variables()
+
+    if formule.vide:
+        return [[]], pile
+    return [sorted(c, key=abs) for c in formule.clauses], pile
+
+
+def reconstruire_modele(modele, pile):
+    """
+    Complète un modèle (dictionnaire variable -> booléen) de la formule simplifiée par bve
+    en un modèle de la formule d'origine, en parcourant les éliminations à rebours.
+    """
+    modele = dict(modele)
+    for var, otees in reversed(pile):
+        for clause in otees:
+            for lit in clause:
+                modele.setdefault(abs(lit), False)
+        modele[var] = False
+        # var vaut vrai seulement si une clause ôtée qui contient var n'est satisfaite par aucun autre littéral
+        for clause in otees:
+            if var in clause and not any(lit != var and modele.get(abs(lit), False) == (lit > 0)
+                                         for lit in clause):
+                modele[var] = True
+                break
+    return modele
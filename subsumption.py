@@ -0,0 +1,116 @@
+"""
+Élimination des clauses subsumées et auto-subsomption (self-subsuming resolution).
+Une clause C subsume D si tous les littéraux de C sont dans D : D est alors redondante.
+Au lieu de comparer toutes les paires, on ne compare C qu'aux clauses de la liste d'occurrences
+de son littéral le plus rare, après un filtre par signature : un masque de 64 bits par clause
+où chaque littéral allume un bit. Si C a un bit que D n'a pas, C ne peut pas être incluse dans D.
+"""
+
+from collections import defaultdict, deque
+
+
+def signature(clause):
+    """Retourne le masque de 64 bits des littéraux de la clause"""
+    sig = 0
+    for lit in clause:
+        sig |= 1 << ((2 * abs(lit) + (lit < 0)) & 63)
+    return sig
+
+
+def _simplifier(clauses, auto_subsumption):
+    """
+    Cœur commun : retourne (retirees, ensembles, modifiees) où retirees[i] indique que la clause i
+    est subsumée, ensembles[i] ses littéraux restants et modifiees[i] qu'elle a été raccourcie.
+    """
+    n = len(clauses)
+    ensembles = [set(c) for c in clauses]
+    sigs = [signature(e) for e in ensembles]
+    retirees = [False] * n
+    modifiees = [False] * n
+
+    # Listes d'occurrences : littéral -> indices des clauses. Elles ne sont jamais nettoyées quand une clause
+    # est raccourcie : une entrée périmée échoue simplement au test d'inclusion.
+    occ = defaultdict(list)
+    for i, e in enumerate(ensembles):
+        for lit in e:
+            occ[lit].append(i)
+
+    # Les clauses courtes d'abord : ce sont elles qui subsument le plus
+    file = deque(sorted(range(n), key=lambda i: len(ensembles[i])))
+    en_file = [True] * n
+
+    while file:
+        i = file.popleft()
+        en_file[i] = False
+        if retirees[i]:
+            continue
+        e = ensembles[i]
+        taille = len(e)
+
+        if taille == 0:
+            # La clause vide subsume toutes les autres
+            for j in range(n):
+                if j != i:
+                    retirees[j] = True
+            break
+
+        # Subsomption : parcourir seulement les clauses qui contiennent le littéral le plus rare de C
+        sig = sigs[i]
+        rare = min(e, key=lambda l: len(occ[l]))
+        for j in occ[rare]:
+            if j == i or retirees[j] or sig & ~sigs[j]:
+                continue
+            ej = ensembles[j]
+            if len(ej) >= taille and e <= ej:
+                retirees[j] = True
+
+        if not auto_subsumption:
+            continue
+
+        # Auto-subsomption : si C = R ∪ {l} et D ⊇ R ∪ {¬l}, la résolvante R subsume D, on retire ¬l de D
+        for lit in list(e):
+            if -lit in e:
+                continue  # Clause tautologique sur lit : la résolvante garderait ¬l
+            sig_inverse = signature((e - {lit}) | {-lit})
+            for j in occ[-lit]:
+                if j == i or retirees[j] or sig_inverse & ~sigs[j]:
+                    continue
+                ej = ensembles[j]
+                if len(ej) < taille or -lit not in ej:
+                    continue
+                if all(x in ej for x in e if x != lit):
+                    ej.discard(-lit)
+                    sigs[j] = signature(ej)
+                    modifiees[j] = True
+                    # La clause raccourcie peut maintenant subsumer ou raccourcir d'autres clauses
+                    if not en_file[j]:
+                        en_file[j] = True
+                        file.append(j)
+
+    return retirees, ensembles, modifiees
+
+
+def clauses_subsumees(clauses):
+    """Retourne les clauses subsumées par une autre clause (une seule copie des doublons est conservée)"""
+    retirees, _, _ = _simplifier(clauses, False)
+    return [c for c, retiree in zip(clauses, retirees) if retiree]
+
+
+def simplifier(clauses, auto_subsumption=False):
+    """
+    Retourne la formule sans ses clauses subsumées, dans l'ordre d'origine (la liste clauses elle-même
+    si rien n'a changé). Avec auto_subsumption, les clauses sont aussi raccourcies par auto-subsomption.
+    """
+    retirees, ensembles, modifiees = _simplifier(clauses, auto_subsumption)
+    if not any(retirees) and not any(modifiees):
+        return clauses
+    result = []
+    for i, clause in enumerate(clauses):
+        if retirees[i]:
+            continue
+        if modifiees[i]:
+            restants = ensembles[i]
+            result.append([l for l in clause if l in restants])
+        else:
+            result.append(clause)
+    return result
@@ -0,0 +1,89 @@
+"""
+Tests de non-régression des représentations de clauses de DP et DPLL (listes, masques de bits, matrice NumPy).
+Lancer avec : python -m pytest -q
+"""
+
+import random
+
+import pytest
+
+import bitset
+import dimacs
+from base_clauses import ClauseDB
+import DP_optimised
+import DPLL
+from verification import verifier
+
+# Satisfiable (x1 faux, x63 vrai, ...). Avec un hachage de Python, la clause {1, 63, ...} et la clause {1, 2, ...}
+# avaient la même clé : le monde x1 = faux réutilisait l'échec mémorisé du monde x1 = vrai.
+FORMULE_63_VARIABLES = [[-1, 2, 3], [-1, 2, -3], [1, 63, 3], [1, 63, -3], [4, -2], [-63, -4], [-2, -4], [5, 2], [-6]]
+
+
+def test_cle_bitset_variables_au_dela_de_61():
+    for v in (62, 63, 64):
+        assert bitset.cle(bitset.encoder([[v]])) != bitset.cle(bitset.encoder([[v - 61]]))
+        assert bitset.cle(bitset.encoder([[v, 5]])) != bitset.cle(bitset.encoder([[v - 61, 5]]))
+
+
+def test_formule_63_variables_satisfiable_sur_masques():
+    for backend in ("auto", "bits", "listes"):
+        solveur = DP_optimised.DPSolver(backend=backend)
+        assert solveur.solve(FORMULE_63_VARIABLES), backend
+        assert verifier(FORMULE_63_VARIABLES, solveur.modele)
+        solveur = DPLL.DPLLSolver(backend=backend)
+        assert solveur.solve(FORMULE_63_VARIABLES), backend
+        assert verifier(FORMULE_63_VARIABLES, solveur.modele)
+
+
+def test_dp_numpy_meme_reponse_que_listes():
+    pytest.importorskip("numpy")
+    generateur = random.Random(9)
+    for _ in range(200):
+        n = generateur.randint(1, 10)
+        clauses = [[generateur.choice((1, -1)) * generateur.randint(1, n) for _ in range(generateur.randint(1, 3))]
+                   for _ in range(generateur.randint(0, 40))]
+        attendu = DP_optimised.DPSolver(backend="listes").solve(clauses)
+        solveur = DP_optimised.DPSolver(backend="numpy")
+        assert solveur.solve(clauses) == attendu, clauses
+        if attendu:
+            assert verifier(clauses, solveur.modele)
+
+
+def test_clausedb_meme_recherche_que_listes():
+    clauses = dimacs.lire_listes("uf_files/uuf50-01.cnf", cache=False)
+    db = ClauseDB.from_clauses(clauses)
+    for solveur in (DPLL.DPLLSolver(backend="listes"), DP_optimised.DPSolver()):
+        appels_listes = (solveur.solve(clauses), solveur.cpt)
+        assert (solveur.solve(db), solveur.cpt) == appels_listes
+    solveur = DPLL.DPLLSolver()
+    appels_listes = (solveur.solve_iteratif(clauses), solveur.cpt)
+    assert (solveur.solve_iteratif(db), solveur.cpt) == appels_listes
+
+
+def test_dpll_garde_les_listes_par_defaut():
+    # Sur masques, les égalités de fréquence ne sont pas départagées dans l'ordre de la formule :
+    # le backend par défaut doit garder la recherche (et le nombre d'appels) des listes
+    clauses = dimacs.lire_listes("uf_files/uf50-01.cnf", cache=False)
+    assert DPLL.choisir_regles(clauses) is DPLL.choisir_regles(clauses, "listes")
+    defaut = DPLL.DPLLSolver()
+    listes = DPLL.DPLLSolver(backend="listes")
+    assert (defaut.solve(clauses), defaut.cpt) == (listes.solve(clauses), listes.cpt) == (True, 84)
+
+
+def test_regles_2_et_3_retournent_le_litteral_applique():
+    clauses = [[3], [-3, 1, 2], [2, 1, 4], [-2, 1]]
+    modules = [bitset]
+    try:
+        import DP_numpy
+        modules.append(DP_numpy)
+    except ImportError:  # NumPy est facultatif
+        pass
+    for regles in modules:
+        apres, lit = regles.regle_2(regles.encoder(clauses))
+        assert lit == 3
+        inchangee, lit = regles.regle_2(apres)
+        assert lit == 0 and inchangee is apres
+        assert regles.regle_3(apres)[1] in (1, 4)
+        sans_pur = regles.encoder([[1, 2], [-1, -2]])
+        inchangee, lit = regles.regle_3(sans_pur)
+        assert lit == 0 and inchangee is sans_pur
@@ -0,0 +1,18 @@
+"""Tests de la lecture DIMACS (dimacs.py)"""
+
+import dimacs
+
+
+def test_litteral_au_dela_de_l_entete(tmp_path):
+    chemin = tmp_path / "f.cnf"
+    chemin.write_text("p cnf 3 2\n1 -2 0\n4 -3 0\n")
+    assert dimacs.lire_listes(str(chemin), cache=False) == [[1, -2], [4, -3]]
+    assert dimacs.lire(str(chemin), cache=False).to_lists() == [[1, -2], [4, -3]]
+
+
+def test_lire_listes_ecrit_la_copie_binaire(tmp_path):
+    chemin = tmp_path / "f.cnf"
+    chemin.write_text("p cnf 3 2\n1 -2 0\n3 0\n")
+    assert dimacs.lire_listes(str(chemin)) == [[1, -2], [3]]
+    assert dimacs.lire_cache(str(chemin)) is not None
+    assert dimacs.lire_listes(str(chemin)) == [[1, -2], [3]]
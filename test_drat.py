@@ -0,0 +1,56 @@
+"""
+Tests des preuves DRAT : les preuves texte et binaires de CDCL et de DPLL sont acceptées par le vérificateur,
+une preuve altérée est refusée.
+Lancer avec : python -m pytest -q
+"""
+
+import pytest
+
+import CDCL
+import dimacs
+import drat
+import DPLL
+
+FICHIER = "uf_files/uuf50-01.cnf"
+
+
+def _prouver(solveur, resoudre, clauses):
+    assert not resoudre(solveur, clauses)
+    solveur.preuve.fermer()
+
+
+SOLVEURS = {
+    'CDCL': (lambda preuve: CDCL.CDCLSolver(preuve=preuve), CDCL.CDCLSolver.solve),
+    'DPLL': (lambda preuve: DPLL.DPLLSolver(preuve=preuve), DPLL.DPLLSolver.solve),
+    'DPLL-iteratif': (lambda preuve: DPLL.DPLLSolver(preuve=preuve), DPLL.DPLLSolver.solve_iteratif),
+}
+
+
+@pytest.mark.parametrize("binaire", (False, True))
+@pytest.mark.parametrize("nom", list(SOLVEURS))
+def test_preuve_acceptee(tmp_path, nom, binaire):
+    clauses = dimacs.lire_listes(FICHIER, cache=False)
+    chemin = tmp_path / "preuve.drat"
+    creer, resoudre = SOLVEURS[nom]
+    _prouver(creer(drat.DratWriter(chemin, binaire)), resoudre, clauses)
+    valide, message = drat.verifier_preuve(clauses, chemin, binaire)
+    assert valide, message
+    assert drat.verifier_preuve(clauses, chemin) == (valide, message)  # Format détecté
+
+
+def test_preuve_alteree_refusee(tmp_path):
+    clauses = dimacs.lire_listes(FICHIER, cache=False)
+    chemin = tmp_path / "preuve.drat"
+    _prouver(CDCL.CDCLSolver(preuve=drat.DratWriter(chemin)), CDCL.CDCLSolver.solve, clauses)
+    etapes = list(drat.lire_preuve(chemin, binaire=False))
+    assert etapes[-1] == (True, [])
+
+    # Sans les lemmes appris (suppressions gardées), la clause vide n'est plus déductible par propagation unitaire
+    alteree = tmp_path / "alteree.drat"
+    with drat.DratWriter(alteree) as preuve:
+        for ajout, clause in etapes:
+            if not ajout:
+                preuve.supprimer(clause)
+        preuve.ajouter([])
+    valide, message = drat.verifier_preuve(clauses, alteree)
+    assert not valide and "ni RUP ni RAT" in message
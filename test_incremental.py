@@ -0,0 +1,77 @@
+"""
+Tests de la session incrémentale (hypothèses, hypothèses en échec, ajout de clauses et de variables entre deux appels).
+Lancer avec : python -m pytest -q
+"""
+
+import random
+
+import DPLL
+from incremental import IncrementalSolver
+from verification import verifier
+
+
+def _formule(generateur, nb_vars, nb_clauses):
+    return [[generateur.choice((1, -1)) * generateur.randint(1, nb_vars) for _ in range(3)]
+            for _ in range(nb_clauses)]
+
+
+def _hypotheses(generateur, nb_vars, nombre):
+    return [v if generateur.random() < 0.5 else -v for v in generateur.sample(range(1, nb_vars + 1), nombre)]
+
+
+def _verifier_appel(session, clauses, hypotheses):
+    """Résout sous hypothèses et vérifie le modèle ou les hypothèses en échec contre DPLL ; retourne le résultat"""
+    result = session.solve(hypotheses)
+    attendu = DPLL.DPLL(clauses + [[lit] for lit in hypotheses])
+    assert result == attendu, (clauses, hypotheses)
+    if result:
+        assert verifier(clauses, session.modele), (clauses, hypotheses)
+        assert all(lit in session.modele for lit in hypotheses), (session.modele, hypotheses)
+    else:
+        assert set(session.hypotheses_echec) <= set(hypotheses), (session.hypotheses_echec, hypotheses)
+        assert not DPLL.DPLL(clauses + [[lit] for lit in session.hypotheses_echec]), (clauses, hypotheses)
+    return result
+
+
+def test_hypotheses_modeles_et_echecs():
+    generateur = random.Random(20)
+    resultats = set()
+    for _ in range(60):
+        nb_vars = generateur.randint(3, 12)
+        clauses = _formule(generateur, nb_vars, generateur.randint(nb_vars, 5 * nb_vars))
+        session = IncrementalSolver(clauses)
+        for _ in range(5):
+            hypotheses = _hypotheses(generateur, nb_vars, generateur.randint(0, min(4, nb_vars)))
+            resultats.add(_verifier_appel(session, clauses, hypotheses))
+    assert resultats == {True, False}  # Les deux cas sont couverts
+
+
+def test_ajout_de_clauses_et_de_variables_entre_deux_appels():
+    generateur = random.Random(21)
+    for _ in range(40):
+        nb_vars = generateur.randint(3, 8)
+        clauses = _formule(generateur, nb_vars, 2 * nb_vars)
+        session = IncrementalSolver(clauses)
+        _verifier_appel(session, clauses, [])
+        for _ in range(6):
+            # Les nouvelles clauses portent aussi sur des variables inconnues de la session (agrandir)
+            nb_vars += generateur.randint(0, 2)
+            for clause in _formule(generateur, nb_vars, generateur.randint(1, 3)):
+                session.add_clause(clause)
+                clauses.append(clause)
+            hypotheses = _hypotheses(generateur, nb_vars, generateur.randint(0, 3))
+            _verifier_appel(session, clauses, hypotheses)
+            _verifier_appel(session, clauses, [])
+
+
+def test_hypothese_sur_variable_nouvelle():
+    session = IncrementalSolver([[1, 2], [-1, 2]])
+    assert session.solve([-2, 5]) is False
+    assert session.hypotheses_echec == [-2]
+    assert session.solve([2, -5])
+    assert verifier([[1, 2], [-1, 2]], session.modele) and -5 in session.modele
+    session.add_clause([-2, 7])
+    assert session.solve([-7]) is False
+    assert set(session.hypotheses_echec) == {-7}
+    assert session.solve()
+    assert 7 in session.modele
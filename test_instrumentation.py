@@ -0,0 +1,27 @@
+"""
+Tests de l'instrumentation : les mesures ne concernent que les résolutions lancées dans leur contexte.
+Lancer avec : python -m pytest -q
+"""
+
+import contextvars
+import threading
+
+import DPLL
+import instrumentation
+
+FORMULE = [[1, 2], [-1, 2], [1, -2], [-1, -2, 3], [-3, 4]]
+
+
+def test_mesures_limitees_au_contexte():
+    with instrumentation.instrumenter() as mesures:
+        # Une résolution lancée dans un autre contexte (ici un thread) n'est pas mesurée
+        thread = threading.Thread(target=contextvars.Context().run, args=(DPLL.DPLL, FORMULE))
+        thread.start()
+        thread.join()
+        assert not mesures.compteurs
+        DPLL.DPLL(FORMULE)
+    appels = mesures.compteurs["unit_propagation"]
+    assert appels > 0
+    DPLL.DPLL(FORMULE)
+    assert mesures.compteurs["unit_propagation"] == appels
+    assert instrumentation.courantes() is None
@@ -0,0 +1,82 @@
+"""
+Tests de la reconstruction des modèles après prétraitement (littéraux équivalents, sondage des littéraux).
+Lancer avec : python -m pytest -q
+"""
+
+import random
+
+import DPLL
+from pretraitement import ETAPES_DEFAUT, Pretraitement
+from verification import verifier
+
+
+def _formule_plantee(generateur, nb_vars):
+    """
+    Formule satisfiable (par une affectation tirée au hasard) qui contient des chaînes de littéraux équivalents
+    et des littéraux dont la propagation échoue
+    """
+    vrai = {v: generateur.random() < 0.5 for v in range(1, nb_vars + 1)}
+
+    def litteral(v):
+        return v if vrai[v] else -v
+
+    clauses = []
+    variables = list(vrai)
+    generateur.shuffle(variables)
+    # Équivalences a ≡ b le long de chaînes de 4 variables : deux clauses binaires par maillon
+    for debut in range(0, nb_vars // 2, 4):
+        chaine = variables[debut:debut + 4]
+        for a, b in zip(chaine, chaine[1:]):
+            la, lb = litteral(a), litteral(b)
+            clauses += [[-la, lb], [la, -lb]]
+    # Littéraux qui échouent : x implique y et ¬y, donc ¬x (vrai dans l'affectation) doit être affecté
+    for x in variables[nb_vars // 2:nb_vars // 2 + 3]:
+        y = generateur.choice([v for v in variables if v != x])
+        lx = litteral(x)
+        clauses += [[lx, litteral(y)], [lx, -litteral(y)]]
+    # Clauses ternaires satisfaites par l'affectation
+    while len(clauses) < 4 * nb_vars:
+        clause = [generateur.choice((1, -1)) * v for v in generateur.sample(variables, 3)]
+        if any(litteral(abs(l)) == l for l in clause):
+            clauses.append(clause)
+    generateur.shuffle(clauses)
+    return clauses
+
+
+def test_reconstruction_equivalences_et_sondage():
+    generateur = random.Random(25)
+    natures = set()
+    for _ in range(40):
+        clauses = _formule_plantee(generateur, generateur.randint(12, 30))
+        for etapes in (ETAPES_DEFAUT, ("equivalences",), ("sondage",), ("sondage", "equivalences")):
+            pretraitement = Pretraitement(etapes)
+            reduites = pretraitement.appliquer(clauses)
+            natures.update(nature for nature, _ in pretraitement.pile)
+            solveur = DPLL.DPLLSolver()
+            assert solveur.solve(reduites), (etapes, clauses)
+            modele = pretraitement.reconstruire(solveur.modele)
+            assert verifier(clauses, modele), (etapes, clauses)
+    assert natures == {"equivalences", "affectes"}  # Les deux reconstructions ont servi
+
+
+def test_reconstruction_variable_remplacee_libre():
+    # x1 ≡ x2 ≡ ¬x3 et rien d'autre : le représentant reste libre, le modèle reconstruit doit rester cohérent
+    clauses = [[-1, 2], [1, -2], [-2, -3], [2, 3]]
+    pretraitement = Pretraitement(("equivalences",))
+    assert pretraitement.appliquer(clauses) == []
+    modele = pretraitement.reconstruire([])
+    assert verifier(clauses, modele)
+    assert sorted(map(abs, modele)) == [1, 2, 3]
+
+
+def test_reconstruction_litteral_qui_echoue():
+    # x1 implique x2 et ¬x2 : le sondage affecte ¬x1, puis x3 ∨ x1 donne x3
+    clauses = [[-1, 2], [-1, -2], [3, 1], [4, 5, -3]]
+    pretraitement = Pretraitement(("sondage",))
+    reduites = pretraitement.appliquer(clauses)
+    assert all(abs(l) not in (1, 3) for c in reduites for l in c)
+    solveur = DPLL.DPLLSolver()
+    assert solveur.solve(reduites)
+    modele = pretraitement.reconstruire(solveur.modele)
+    assert verifier(clauses, modele)
+    assert -1 in modele and 3 in modele
@@ -0,0 +1,47 @@
+"""
+Tests des modèles reconstruits après élimination de variables (DP par résolution, BVE avant DPLL).
+Lancer avec : python -m pytest -q
+"""
+
+import random
+
+import DPLL
+import main
+import resolution
+from verification import verifier
+
+
+def _formules(graine, nombre):
+    generateur = random.Random(graine)
+    for _ in range(nombre):
+        n = generateur.randint(1, 12)
+        yield [[generateur.choice((1, -1)) * generateur.randint(1, n) for _ in range(generateur.randint(1, 3))]
+               for _ in range(generateur.randint(0, 50))]
+
+
+def test_modele_dp_resolution():
+    for croissance_max in (None, 0):
+        for clauses in _formules(4, 150):
+            solveur = resolution.ResolutionSolver(croissance_max)
+            assert solveur.solve(clauses) == DPLL.DPLL(clauses), clauses
+            if solveur.modele is not None:
+                assert verifier(clauses, solveur.modele), clauses
+
+
+def test_modele_bve_puis_dpll():
+    for clauses in _formules(5, 150):
+        reduites, pile = resolution.bve(clauses)
+        solveur = DPLL.DPLLSolver()
+        if solveur.solve(reduites):
+            valeurs = resolution.reconstruire_modele({abs(lit): lit > 0 for lit in solveur.modele}, pile)
+            assert verifier(clauses, [var if vrai else -var for var, vrai in valeurs.items()]), clauses
+        else:
+            assert not DPLL.DPLL(clauses), clauses
+
+
+def test_solveurs_main_retournent_le_modele_reconstruit():
+    clauses = main.lire_cnf("uf_files/uf50-01.cnf")
+    for solveur in ("DPR", "BVE+DPLL", "PRE+DPLL"):
+        result, _, _, modele = main.SOLVEURS[solveur](clauses, solveur)
+        assert result, solveur
+        assert verifier(clauses, modele), solveur
@@ -0,0 +1,78 @@
+"""
+Vérification des modèles renvoyés par les solveurs.
+Un modèle est une liste de littéraux (ceux affectés à vrai) ; les variables absentes sont libres et
+vérifiées à faux, comme dans completer_modele (ce qui satisfait aussi les clauses tautologiques).
+La vérification est linéaire en la taille de la formule : une table indexée directement par le littéral
+(les littéraux négatifs par la fin de la liste, comme dans propagation.py) donne la valeur de chaque
+littéral sans dictionnaire ni abs(). Pour vérifier beaucoup de modèles d'une même formule,
+verifier_lot utilise NumPy s'il est installé.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif : verifier_lot se replie sur la version Python
+    np = None
+
+
+def _nb_vars(clauses, modele):
+    return max(max((abs(l) for c in clauses for l in c), default=0),
+               max((abs(l) for l in modele), default=0))
+
+
+def clause_fausse(clauses, modele):
+    """Retourne l'indice de la première clause qu'aucun littéral du modèle ne satisfait, ou None"""
+    n = _nb_vars(clauses, modele)
+    vrai = [False] * (2 * n + 1)
+    for lit in modele:
+        if vrai[-lit]:
+            return -1  # Modèle contradictoire : l et ¬l affectés tous les deux
+        vrai[lit] = True
+    for v in range(1, n + 1):
+        if not vrai[v]:
+            vrai[-v] = True  # Variable libre : faux
+    for i, clause in enumerate(clauses):
+        if not any(vrai[l] for l in clause):
+            return i
+    return None
+
+
+def verifier(clauses, modele):
+    """Retourne vrai si le modèle est cohérent et satisfait toutes les clauses"""
+    return clause_fausse(clauses, modele) is None
+
+
+def completer_modele(modele, nb_vars):
+    """Retourne une affectation de toutes les variables 1..nb_vars, les variables libres à faux"""
+    vrai = set(modele)
+    return [v if v in vrai else -v for v in range(1, nb_vars + 1)]
+
+
+def verifier_lot(clauses, modeles):
+    """
+    Vérifie plusieurs modèles d'une même formule ; retourne la liste des résultats (booléens).
+    Avec NumPy, tous les modèles sont vérifiés en une opération sur une matrice clauses x littéraux.
+    """
+    if np is None or not modeles:
+        return [verifier(clauses, modele) for modele in modeles]
+
+    n = max(_nb_vars(clauses, modele) for modele in modeles)
+    if n == 0:
+        return [verifier(clauses, modele) for modele in modeles]
+    # Valeurs des littéraux, une ligne par modèle : colonne n + l pour le littéral l (colonne n : remplissage)
+    valeurs = np.zeros((len(modeles), 2 * n + 1), dtype=bool)
+    coherents = np.ones(len(modeles), dtype=bool)
+    for i, modele in enumerate(modeles):
+        lits = np.asarray(modele, dtype=np.int64)
+        valeurs[i, n + lits] = True
+        positifs = valeurs[i, n + 1:]
+        negatifs = valeurs[i, n - 1::-1]  # Vue des colonnes des littéraux -1, -2, ..., -n
+        coherents[i] = not (positifs & negatifs).any()
+        negatifs |= ~positifs  # Variables libres : faux
+
+    largeur = max((len(c) for c in clauses), default=0)
+    M = np.zeros((len(clauses), largeur), dtype=np.int64)
+    for j, c in enumerate(clauses):
+        M[j, :len(c)] = c
+    # valeurs[:, n + M] : modèles x clauses x littéraux ; le 0 de remplissage tombe sur la colonne n, toujours fausse
+    satisfaites = valeurs[:, n + M].any(axis=2).all(axis=1)
+    return (satisfaites & coherents).tolist()